@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import concurrent.futures
+from collections import defaultdict
+from typing import Any, AsyncIterator, Coroutine, Dict, Iterator, Optional, Set
+
+
+class BackgroundLoop:
+    """Long-lived event loop on a daemon thread that synchronous callers (Streamlit) submit work to
+
+    Keeping one loop per process lets async clients such as the Groq async client
+    keep their connections warm across reruns instead of being rebuilt by asyncio.run.
+    Futures can be tagged with a group (e.g. session + stage) and cancelled together.
+    """
+
+    def __init__(self, name: str = "projectcraft-event-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Set[concurrent.futures.Future]] = defaultdict(set)
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._loop.is_closed():
+            with self._lock:
+                if self._loop is None or self._loop.is_closed():
+                    self._start()
+        return self._loop
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def submit(self, coro: Coroutine, group: str = None) -> concurrent.futures.Future:
+        """Schedule a coroutine on the background loop and return a thread-safe future"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if group is not None:
+            with self._lock:
+                self._groups[group].add(future)
+            future.add_done_callback(lambda f, g=group: self._forget(g, f))
+        return future
+
+    def _forget(self, group: str, future: concurrent.futures.Future):
+        with self._lock:
+            futures = self._groups.get(group)
+            if futures is not None:
+                futures.discard(future)
+                if not futures:
+                    del self._groups[group]
+
+    def run(self, coro: Coroutine, group: str = None, timeout: float = None) -> Any:
+        """Run a coroutine to completion on the background loop, blocking the caller"""
+        future = self.submit(coro, group)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(self, agen: AsyncIterator, group: str = None) -> Iterator:
+        """Drive an async generator on the background loop from synchronous code"""
+        try:
+            while True:
+                try:
+                    yield self.run(agen.__anext__(), group)
+                except StopAsyncIteration:
+                    break
+        finally:
+            # Closing runs the generator's cleanup on the loop that owns it
+            try:
+                self.submit(agen.aclose()).result()
+            except Exception as e:
+                print(f"⚠️ Closing async generator failed: {e}")
+
+    def cancel_group(self, group: str) -> int:
+        """Cancel every pending future submitted under a group"""
+        with self._lock:
+            futures = list(self._groups.pop(group, ()))
+        cancelled = sum(1 for f in futures if f.cancel())
+        if cancelled:
+            print(f"🛑 Cancelled {cancelled} background task(s) for {group}")
+        return cancelled
+
+    def stop(self):
+        """Stop the loop and its thread; a new loop is started on next use"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+
+background_loop = BackgroundLoop()
@@ -0,0 +1,234 @@
+import os
+import re
+import csv
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+from models import ProjectDetails, ProjectRequest
+
+load_dotenv()
+
+# Projects generated at once; each one fans out to the LLM, YouTube, GitHub and Tavily
+BATCH_CONCURRENCY = int(os.getenv("PROJECTCRAFT_BATCH_CONCURRENCY", "4"))
+# Worker processes writing the export files
+BATCH_EXPORT_WORKERS = int(os.getenv("PROJECTCRAFT_BATCH_EXPORT_WORKERS", str(min(4, os.cpu_count() or 1))))
+EXPORT_FORMATS = ("xlsx", "md", "pdf", "json")
+DEFAULT_FORMATS = ("xlsx", "md")
+
+
+def read_requests(path: str) -> List[Dict[str, Any]]:
+    """Load project rows from a CSV or JSONL file; every row needs a title"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    requests = []
+    for line_no, row in enumerate(rows, 1):
+        title = str(row.get("title") or "").strip()
+        if not title:
+            print(f"⚠️ Skipping row {line_no}: no title")
+            continue
+        responses = row.get("user_responses") or {}
+        if isinstance(responses, str):
+            # CSV cells carry the refinement answers as a JSON object
+            try:
+                responses = json.loads(responses)
+            except ValueError:
+                responses = {"Requirements": responses}
+        selected_field = row.get("selected_field") or row.get("engineering_field") or "Engineering"
+        requests.append({
+            "request": ProjectRequest(
+                title=title,
+                engineering_field=row.get("engineering_field") or selected_field,
+                selected_field=selected_field,
+                project_type=row.get("project_type") or "General Project",
+                complexity_level=row.get("complexity_level") or "Intermediate",
+                user_responses=dict(responses),
+            ),
+            "user_name": row.get("user_name") or "Builder",
+        })
+    return requests
+
+
+def output_stem(index: int, title: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", title).strip("_")[:60] or "project"
+    return f"{index:04d}_{slug}"
+
+
+def export_guide(details: ProjectDetails, user_name: str, out_dir: str, stem: str,
+                 formats: List[str]) -> Dict[str, float]:
+    """Write the requested guide files for one project (runs in a worker process); returns seconds per format"""
+    # Imported here so workers never load the Streamlit app module
+    from excel_export import write_excel_guide
+    from markdown_export import markdown_guide
+    from pdf_export import write_pdf_guide
+
+    timings = {}
+    for fmt in formats:
+        started = time.perf_counter()
+        path = os.path.join(out_dir, f"{stem}.{fmt}")
+        if fmt == "xlsx":
+            with open(path, "wb") as f:
+                write_excel_guide(details, user_name, f)
+        elif fmt == "pdf":
+            with open(path, "wb") as f:
+                write_pdf_guide(details, user_name, f)
+        elif fmt == "md":
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(markdown_guide(details, user_name))
+        elif fmt == "json":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(asdict(details), f, ensure_ascii=False, indent=2)
+        timings[fmt] = time.perf_counter() - started
+    return timings
+
+
+class BatchRunner:
+    """Generate guides for many projects with one assistant, a bounded number in flight at a time"""
+
+    def __init__(self, assistant, out_dir: str, formats: List[str] = DEFAULT_FORMATS,
+                 concurrency: int = BATCH_CONCURRENCY, export_workers: int = BATCH_EXPORT_WORKERS):
+        self.assistant = assistant
+        self.out_dir = out_dir
+        self.formats = list(formats)
+        self.concurrency = max(1, concurrency)
+        self.export_workers = max(1, export_workers)
+
+    async def _generate(self, index: int, request: Dict[str, Any], semaphore: asyncio.Semaphore,
+                        pool: ProcessPoolExecutor) -> Dict[str, Any]:
+        title = request["request"].title
+        result = {"index": index, "title": title, "status": "ok", "errors": [], "timings": {}}
+        timings = result["timings"]
+        queued = time.perf_counter()
+
+        async with semaphore:
+            started = time.perf_counter()
+            timings["queue"] = started - queued
+            details = None
+            try:
+                async for event, payload in self.assistant.stream_project_details(request["request"]):
+                    if event == "stage" and "blueprint" not in timings:
+                        # The first stage event marks the end of the LLM blueprint
+                        timings["blueprint"] = time.perf_counter() - started
+                    elif event == "error":
+                        result["status"] = "fallback"
+                        result["errors"].append(payload)
+                    elif event == "details":
+                        details = payload
+                timings["resources"] = time.perf_counter() - started - timings.get("blueprint", 0.0)
+            except Exception as e:
+                result["status"] = "failed"
+                result["errors"].append(str(e))
+                print(f"❌ [{index}] {title}: {e}")
+                return result
+
+        # Exports are CPU-bound, so they run in worker processes while generation continues
+        stem = output_stem(index, title)
+        try:
+            export_timings = await asyncio.get_running_loop().run_in_executor(
+                pool, export_guide, details, request["user_name"], self.out_dir, stem, self.formats
+            )
+            timings.update({f"export_{fmt}": seconds for fmt, seconds in export_timings.items()})
+            result["files"] = [f"{stem}.{fmt}" for fmt in self.formats]
+        except Exception as e:
+            result["status"] = "failed"
+            result["errors"].append(f"export: {e}")
+            print(f"❌ [{index}] {title}: export failed: {e}")
+            return result
+
+        timings["total"] = time.perf_counter() - queued
+        icon = "✅" if result["status"] == "ok" else "⚠️"
+        print(f"{icon} [{index}] {title} ({timings['total']:.1f}s)")
+        return result
+
+    async def run(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        os.makedirs(self.out_dir, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.export_workers) as pool:
+            results = await asyncio.gather(*(
+                self._generate(index, request, semaphore, pool) for index, request in enumerate(requests, 1)
+            ))
+        wall = time.perf_counter() - started
+
+        report = {
+            "projects": len(requests),
+            "ok": sum(1 for r in results if r["status"] == "ok"),
+            "fallback": sum(1 for r in results if r["status"] == "fallback"),
+            "failed": sum(1 for r in results if r["status"] == "failed"),
+            "wall_seconds": wall,
+            "projects_per_minute": len(requests) / wall * 60 if wall else 0.0,
+            "concurrency": self.concurrency,
+            "export_workers": self.export_workers,
+            "stages": stage_summary(results),
+            "results": results,
+        }
+        with open(os.path.join(self.out_dir, "batch_report.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+def stage_summary(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Count, mean, median, p95 and max seconds for every timed stage"""
+    samples: Dict[str, List[float]] = {}
+    for result in results:
+        for stage, seconds in result["timings"].items():
+            samples.setdefault(stage, []).append(seconds)
+
+    summary = {}
+    for stage, values in samples.items():
+        values.sort()
+        summary[stage] = {
+            "count": len(values),
+            "mean": statistics.fmean(values),
+            "p50": statistics.median(values),
+            "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+            "max": values[-1],
+        }
+    return summary
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"\n📦 {report['projects']} projects in {report['wall_seconds']:.1f}s "
+          f"({report['projects_per_minute']:.1f}/min, concurrency {report['concurrency']}, "
+          f"{report['export_workers']} export workers)")
+    print(f"   ✅ {report['ok']} ok, ⚠️ {report['fallback']} fallback, ❌ {report['failed']} failed")
+    print(f"   {'stage':<14}{'n':>5}{'mean':>9}{'p50':>9}{'p95':>9}{'max':>9}")
+    for stage, s in report["stages"].items():
+        print(f"   {stage:<14}{s['count']:>5}{s['mean']:>8.2f}s{s['p50']:>8.2f}s{s['p95']:>8.2f}s{s['max']:>8.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate project guides for many titles without the UI")
+    parser.add_argument("input", help="CSV or JSONL file with a title column and optional context columns")
+    parser.add_argument("--out", default="batch_output", help="Directory for the guides and batch_report.json")
+    parser.add_argument("--formats", nargs="+", choices=EXPORT_FORMATS, default=list(DEFAULT_FORMATS))
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY, help="Projects generated at once")
+    parser.add_argument("--workers", type=int, default=BATCH_EXPORT_WORKERS, help="Export worker processes")
+    parser.add_argument("--limit", type=int, help="Only process the first N rows")
+    args = parser.parse_args()
+
+    requests = read_requests(args.input)[:args.limit]
+    if not requests:
+        print("❌ No projects to generate")
+        return
+
+    # Imported lazily: the app module pulls in Streamlit and the LLM client
+    from main import ProjectGuideAssistant
+
+    runner = BatchRunner(ProjectGuideAssistant(), args.out, args.formats, args.concurrency, args.workers)
+    print_report(asyncio.run(runner.run(requests)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Set PROJECTCRAFT_CACHE_DB to a file path to enable the on-disk tier
+CACHE_DB_PATH = os.getenv("PROJECTCRAFT_CACHE_DB")
+CACHE_MAX_ENTRIES = int(os.getenv("PROJECTCRAFT_CACHE_MAX_ENTRIES", "2048"))
+LLM_CACHE_TTL = float(os.getenv("PROJECTCRAFT_LLM_CACHE_TTL", str(6 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("PROJECTCRAFT_LLM_CACHE_MAX_ENTRIES", "512"))
+EXPORT_CACHE_TTL = float(os.getenv("PROJECTCRAFT_EXPORT_CACHE_TTL", str(6 * 3600)))
+EXPORT_CACHE_MAX_ENTRIES = int(os.getenv("PROJECTCRAFT_EXPORT_CACHE_MAX_ENTRIES", "64"))
+
+# Time-to-live (seconds) per provider
+PROVIDER_TTLS = {
+    "youtube_search": 6 * 3600,
+    "youtube_video": 24 * 3600,
+    "github_repos": 6 * 3600,
+    "component_lookup": 24 * 3600,
+    "ddg_search": 3600,
+}
+DEFAULT_TTL = 3600
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share a cache entry"""
+    q = (query or "").strip().lower()
+    q = re.sub(r"\s+", " ", q)
+    return q.strip(" ?!.,;:")
+
+
+class TTLCache:
+    """Thread-safe in-memory LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, default_ttl: float = DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class SQLiteCache:
+    """Optional on-disk cache tier (JSON values) that survives process restarts"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at < time.time():
+            self.delete(key)
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: float):
+        payload = json.dumps(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, time.time() + ttl),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+
+class ResultCache:
+    """Two-tier (memory LRU + optional SQLite) cache for external search results"""
+
+    def __init__(self, memory: TTLCache = None, disk: SQLiteCache = None,
+                 ttls: Dict[str, float] = None):
+        self.memory = memory or TTLCache()
+        self.disk = disk
+        self.ttls = dict(PROVIDER_TTLS if ttls is None else ttls)
+
+    def ttl_for(self, provider: str) -> float:
+        return self.ttls.get(provider, DEFAULT_TTL)
+
+    def make_key(self, provider: str, key_parts: Sequence) -> str:
+        raw = json.dumps(list(key_parts), sort_keys=True, default=str)
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return f"{provider}:{digest}"
+
+    def get(self, provider: str, key_parts: Sequence) -> Optional[Any]:
+        key = self.make_key(provider, key_parts)
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        if self.disk is not None:
+            try:
+                value = self.disk.get(key)
+            except Exception as e:
+                print(f"⚠️ Disk cache read failed: {e}")
+                return None
+            if value is not None:
+                # Promote to memory so the next hit skips SQLite
+                self.memory.set(key, value, self.ttl_for(provider))
+        return value
+
+    def set(self, provider: str, key_parts: Sequence, value: Any):
+        key = self.make_key(provider, key_parts)
+        ttl = self.ttl_for(provider)
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value, ttl)
+            except Exception as e:
+                print(f"⚠️ Disk cache write failed: {e}")
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+class LLMResponseCache:
+    """Memory cache for chat completions keyed on model, temperature and the rendered messages"""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, ttl: float = LLM_CACHE_TTL):
+        self.store = TTLCache(max_entries=max_entries, default_ttl=ttl)
+
+    def make_key(self, llm, messages: Sequence) -> str:
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", "") or type(llm).__name__
+        temperature = getattr(llm, "temperature", None)
+        rendered = [
+            (getattr(m, "type", type(m).__name__), getattr(m, "content", str(m)))
+            for m in messages
+        ]
+        raw = json.dumps([model, temperature, rendered], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, llm, messages: Sequence) -> Optional[Any]:
+        return self.store.get(self.make_key(llm, messages))
+
+    def set(self, llm, messages: Sequence, response: Any):
+        self.store.set(self.make_key(llm, messages), response)
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.store.stats()
+
+
+class ExportCache:
+    """Content-addressed memory cache for generated export files (Excel, Markdown, ...)"""
+
+    def __init__(self, max_entries: int = EXPORT_CACHE_MAX_ENTRIES, ttl: float = EXPORT_CACHE_TTL):
+        self.store = TTLCache(max_entries=max_entries, default_ttl=ttl)
+
+    def make_key(self, kind: str, content: Any) -> str:
+        raw = json.dumps([kind, content], sort_keys=True, default=str)
+        return f"{kind}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, kind: str, content: Any) -> Optional[Any]:
+        return self.store.get(self.make_key(kind, content))
+
+    def get_or_build(self, kind: str, content: Any, build: Callable[[], Any]) -> Any:
+        """Return the cached export for this content, building (and caching) it on a miss"""
+        key = self.make_key(kind, content)
+        value = self.store.get(key)
+        if value is None:
+            value = build()
+            if value is not None:
+                self.store.set(key, value)
+        return value
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.store.stats()
+
+
+result_cache = ResultCache(disk=SQLiteCache(CACHE_DB_PATH) if CACHE_DB_PATH else None)
+llm_cache = LLMResponseCache()
+export_cache = ExportCache()
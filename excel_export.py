@@ -0,0 +1,456 @@
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.worksheet.cell_range import CellRange
+
+# Workbooks smaller than this stay in memory; larger ones spill to a temp file
+EXCEL_SPOOL_MAX_SIZE = int(os.getenv("PROJECTCRAFT_EXCEL_SPOOL_MAX_SIZE", str(8 * 1024 * 1024)))
+
+PRIMARY_COLOR = "1E40AF"
+SECONDARY_COLOR = "F8FAFC"
+ACCENT_COLOR = "10B981"
+TEXT_COLOR = "374151"
+LINK_COLOR = "2563EB"
+
+
+def _fill(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+_THIN = Side(style="thin")
+_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+_CENTER = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_LEFT = Alignment(horizontal="left", vertical="top", wrap_text=True)
+_CENTER_TOP = Alignment(horizontal="center", vertical="top")
+
+# Named styles shared by every cell of a kind; each is written once to styles.xml
+STYLE_SPECS: Dict[str, Dict[str, Any]] = {
+    "PC Guide Title": dict(font=Font(name="Calibri", size=20, bold=True, color=PRIMARY_COLOR), alignment=_CENTER),
+    "PC Project Title": dict(font=Font(name="Calibri", size=18, bold=True, color=PRIMARY_COLOR), alignment=_CENTER),
+    "PC Sheet Header": dict(font=Font(name="Calibri", size=16, bold=True, color=PRIMARY_COLOR), alignment=_CENTER),
+    "PC Section": dict(font=Font(name="Calibri", size=14, bold=True, color=TEXT_COLOR), fill=_fill(SECONDARY_COLOR)),
+    "PC Heading": dict(font=Font(name="Calibri", size=14, bold=True, color=PRIMARY_COLOR), fill=_fill("E0F2FE")),
+    "PC Video Section": dict(font=Font(name="Calibri", size=14, bold=True, color=TEXT_COLOR), fill=_fill("FEE2E2")),
+    "PC Repo Section": dict(font=Font(name="Calibri", size=14, bold=True, color=TEXT_COLOR), fill=_fill("E0F2FE")),
+    "PC Accent Label": dict(font=Font(name="Calibri", size=12, bold=True, color=PRIMARY_COLOR)),
+    "PC Label": dict(font=Font(name="Calibri", size=11, bold=True)),
+    "PC Body": dict(font=Font(name="Calibri", size=11, color=TEXT_COLOR), alignment=_LEFT),
+    "PC Stat": dict(font=Font(name="Calibri", size=11, bold=True, color=ACCENT_COLOR)),
+    "PC Info Header": dict(font=Font(name="Calibri", size=12, bold=True, color="FFFFFF"), fill=_fill(PRIMARY_COLOR)),
+    "PC Table Header": dict(font=Font(name="Calibri", size=12, bold=True, color="FFFFFF"), fill=_fill(PRIMARY_COLOR),
+                           alignment=_CENTER, border=_BORDER),
+    "PC Video Header": dict(font=Font(name="Calibri", size=11, bold=True, color="FFFFFF"), fill=_fill("DC2626"),
+                           alignment=_CENTER, border=_BORDER),
+    "PC Repo Header": dict(font=Font(name="Calibri", size=11, bold=True, color="FFFFFF"), fill=_fill("0369A1"),
+                          alignment=_CENTER, border=_BORDER),
+    "PC Cell": dict(font=Font(name="Calibri", size=11, color=TEXT_COLOR), alignment=_LEFT, border=_BORDER),
+    "PC Cell Alt": dict(font=Font(name="Calibri", size=11, color=TEXT_COLOR), alignment=_LEFT, border=_BORDER,
+                       fill=_fill(SECONDARY_COLOR)),
+    "PC Link": dict(font=Font(name="Calibri", size=11, color=LINK_COLOR, underline="single"), alignment=_LEFT,
+                   border=_BORDER),
+    "PC Link Alt": dict(font=Font(name="Calibri", size=11, color=LINK_COLOR, underline="single"), alignment=_LEFT,
+                       border=_BORDER, fill=_fill(SECONDARY_COLOR)),
+    "PC Phase": dict(font=Font(name="Calibri", size=14, bold=True, color="FFFFFF"), fill=_fill(ACCENT_COLOR),
+                    alignment=Alignment(horizontal="center", vertical="center"), border=_BORDER),
+    "PC Step Number": dict(font=Font(name="Calibri", size=11, bold=True), alignment=_CENTER_TOP, border=_BORDER),
+    "PC Step Status": dict(font=Font(name="Calibri", size=11, color=ACCENT_COLOR), alignment=_CENTER_TOP,
+                          border=_BORDER),
+    "PC Step Notes": dict(font=Font(name="Calibri", size=10, italic=True, color="6B7280"), alignment=_LEFT,
+                         border=_BORDER),
+    "PC Tips Header": dict(font=Font(name="Calibri", size=14, bold=True, color=PRIMARY_COLOR), fill=_fill("FEF3C7"),
+                          alignment=Alignment(horizontal="center", vertical="center")),
+    "PC Tip Icon": dict(font=Font(name="Calibri", size=12)),
+}
+
+
+class ExcelStyleRegistry:
+    """Precompiled named styles for the guide, added to a workbook on first use and applied by name
+
+    The Font/Fill/Alignment/Border objects are built once per process; each workbook only
+    gets lightweight NamedStyle wrappers, because openpyxl binds a NamedStyle to one workbook.
+    A style is registered the first time a cell uses it, so styles.xml carries only the styles
+    the workbook actually needs.
+    """
+
+    def __init__(self, specs: Dict[str, Dict[str, Any]] = None):
+        self.specs = dict(STYLE_SPECS if specs is None else specs)
+
+    def named_style(self, name: str) -> NamedStyle:
+        style = NamedStyle(name=name)
+        for attr, value in self.specs[name].items():
+            setattr(style, attr, value)
+        return style
+
+    def use(self, wb: Workbook, name: str, registered: set = None) -> str:
+        """Register a guide style on the workbook unless it already is; returns the name
+
+        Pass a set shared across calls to skip re-reading the workbook's style names per cell.
+        """
+        if registered is not None and name in registered:
+            return name
+        if name in self.specs and name not in wb.named_styles:
+            wb.add_named_style(self.named_style(name))
+        if registered is not None:
+            registered.add(name)
+        return name
+
+    def apply(self, ws, cell_range: str, name: str):
+        """Apply one named style to every cell of a range, e.g. a table row or a merged block"""
+        self.use(ws.parent, name)
+        cells = ws[cell_range]
+        if not isinstance(cells, tuple):
+            cells = ((cells,),)
+        for row in cells:
+            for cell in row:
+                cell.style = name
+
+    def write_sheet(self, ws, spec: "SheetSpec"):
+        """Write a sheet spec into a regular (random-access) worksheet"""
+        for column, width in spec.column_widths.items():
+            ws.column_dimensions[column].width = width
+        for row, height in spec.row_heights.items():
+            ws.row_dimensions[row].height = height
+
+        registered = set()
+        for sheet_row in spec.rows:
+            for col, (value, style) in enumerate(sheet_row.cells, 1):
+                if value is None and style is None:
+                    continue
+                cell = ws.cell(sheet_row.row, col, value)
+                if style:
+                    cell.style = self.use(ws.parent, style, registered)
+            for merged in sheet_row.merges:
+                ws.merge_cells(merged)
+                # Carry the anchor's style over the whole block so borders and fills span it
+                anchor_style = ws[merged.split(":")[0]].style
+                self.apply(ws, merged, anchor_style)
+
+    def stream_sheet(self, ws, spec: "SheetSpec"):
+        """Append a sheet spec row by row into a write-only worksheet"""
+        # Dimensions must be known before rows are flushed in write-only mode
+        for column, width in spec.column_widths.items():
+            ws.column_dimensions[column].width = width
+        for row, height in spec.row_heights.items():
+            ws.row_dimensions[row].height = height
+
+        registered = set()
+        next_row = 1
+        for sheet_row in spec.rows:
+            while next_row < sheet_row.row:
+                ws.append([])
+                next_row += 1
+
+            cells = []
+            for value, style in sheet_row.cells:
+                cell = WriteOnlyCell(ws, value)
+                if style:
+                    cell.style = self.use(ws.parent, style, registered)
+                cells.append(cell)
+            ws.append(cells)
+            next_row += 1
+
+            for merged in sheet_row.merges:
+                ws.merged_cells.add(CellRange(merged))
+
+
+Cell = Tuple[Any, Optional[str]]
+BLANK: Cell = (None, None)
+
+
+@dataclass
+class SheetRow:
+    """One worksheet row: (value, named style) cells from column A, plus merged ranges anchored on it"""
+    row: int
+    cells: List[Cell]
+    merges: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SheetSpec:
+    """Layout and lazily generated rows of one guide sheet"""
+    title: str
+    column_widths: Dict[str, float]
+    rows: Iterator[SheetRow]
+    row_heights: Dict[int, float] = field(default_factory=dict)
+
+
+ACTION_PLAN = [
+    ("Phase 1: Planning & Preparation", [
+        "Gather all required components from the components list",
+        "Set up development environment and install necessary tools",
+        "Review all tutorial videos and documentation",
+        "Create project folder structure and documentation",
+    ]),
+    ("Phase 2: Learning & Research", [
+        "Watch key tutorial videos to understand concepts",
+        "Study relevant GitHub repositories for code examples",
+        "Practice with smaller components before full integration",
+        "Join relevant online communities and forums",
+    ]),
+    ("Phase 3: Implementation", [
+        "Start with basic functionality implementation",
+        "Test each component individually before integration",
+        "Follow step-by-step implementation guide",
+        "Document your progress and code changes",
+    ]),
+    ("Phase 4: Testing & Refinement", [
+        "Perform comprehensive testing of all features",
+        "Debug issues and optimize performance",
+        "Add additional features and improvements",
+        "Prepare project documentation and presentation",
+    ]),
+]
+
+SUCCESS_TIPS = [
+    "Start with the basics and build incrementally",
+    "Don't hesitate to ask for help in online communities",
+    "Document your progress and learnings for future reference",
+    "Test each component before integrating into the main system",
+    "Have fun and be creative with your implementation!",
+]
+
+
+def _overview_rows(details, user_name: str) -> Iterator[SheetRow]:
+    yield SheetRow(1, [("🚀 ProjectCraft AI - Project Guide", "PC Guide Title")], ["A1:F3"])
+    yield SheetRow(5, [(details.title, "PC Project Title")], ["A5:F6"])
+
+    info = [
+        ("Personal Guide for:", user_name),
+        ("Difficulty Level:", details.difficulty_level),
+        ("Estimated Timeline:", details.estimated_time),
+        ("Generated on:", datetime.now().strftime('%B %d, %Y at %I:%M %p')),
+    ]
+    yield SheetRow(8, [BLANK, ("Project Information", "PC Info Header"), BLANK, ("Details", "PC Info Header")])
+    for i, (label, value) in enumerate(info, 9):
+        yield SheetRow(i, [BLANK, (label, "PC Label"), BLANK, (value, "PC Body")])
+
+    yield SheetRow(14, [BLANK, ("Project Description:", "PC Accent Label")])
+    yield SheetRow(15, [BLANK, (details.short_description, "PC Body")], ["B15:F18"])
+
+    yield SheetRow(20, [BLANK, ("Quick Project Stats:", "PC Accent Label")])
+    stats = [
+        ("📦 Components Required:", len(details.components or [])),
+        ("🛠️ Tools & Frameworks:", len(details.frameworks or [])),
+        ("🎥 Video Tutorials:", len([l for l in details.youtube_links or [] if l.strip()])),
+        ("💻 GitHub Repositories:", len([r for r in details.github_repos or [] if r.strip()])),
+    ]
+    for i, (label, value) in enumerate(stats, 22):
+        yield SheetRow(i, [BLANK, (label, "PC Body"), BLANK, (str(value), "PC Stat")])
+
+
+def _implementation_rows(details) -> Iterator[SheetRow]:
+    yield SheetRow(1, [("📖 Detailed Implementation Guide", "PC Sheet Header")], ["A1:E2"])
+
+    if not details.detailed_description:
+        yield SheetRow(4, [("Detailed implementation steps will be provided based on your specific project "
+                            "requirements and chosen technologies.", "PC Body")], ["A4:E6"])
+        return
+
+    row = 4
+    for line in details.detailed_description.split('\n'):
+        line = line.strip()
+        if not line:
+            row += 1
+            continue
+
+        if line.startswith('## '):
+            yield SheetRow(row, [(line.replace('## ', '').strip(), "PC Section")], [f"A{row}:E{row}"])
+        elif line.startswith('# '):
+            yield SheetRow(row, [(line.replace('# ', '').strip(), "PC Heading")], [f"A{row}:E{row}"])
+        elif line.startswith(('- ', '• ', '* ')):
+            yield SheetRow(row, [BLANK, (f"• {line[2:].strip()}", "PC Body")])
+        elif line.startswith(tuple(f"{i}." for i in range(1, 10))):
+            yield SheetRow(row, [BLANK, (line, "PC Body")])
+        elif len(line) > 10:
+            yield SheetRow(row, [(line, "PC Body")], [f"A{row}:E{row}"])
+        else:
+            continue
+        row += 1
+
+
+def _table_rows(start_row: int, header_style: str, headers: List[str],
+                records: List[List[Any]], link_column: int = None) -> Iterator[SheetRow]:
+    """Bordered table with a header row and zebra striping on even rows; URLs in link_column get the link style"""
+    yield SheetRow(start_row, [(h, header_style) for h in headers])
+    for row, record in enumerate(records, start_row + 1):
+        alt = " Alt" if row % 2 == 0 else ""
+        yield SheetRow(row, [
+            (value, ("PC Link" if col == link_column and str(value).startswith('http') else "PC Cell") + alt)
+            for col, value in enumerate(record)
+        ])
+
+
+def _components_rows(details) -> Iterator[SheetRow]:
+    yield SheetRow(1, [("🔧 Required Components & Specifications", "PC Sheet Header")], ["A1:D2"])
+    records = [
+        [c.get('name', 'Component'), c.get('purpose', 'Project component'),
+         c.get('specs', 'As per requirements'), "Research suppliers for best prices"]
+        for c in details.components or []
+    ]
+    if records:
+        yield from _table_rows(4, "PC Table Header", ["Component Name", "Purpose", "Specifications", "Notes"], records)
+    else:
+        yield SheetRow(4, [(h, "PC Table Header") for h in ["Component Name", "Purpose", "Specifications", "Notes"]])
+        yield SheetRow(5, [("Components will be determined based on your specific project requirements. "
+                            "Research the necessary hardware/software components for your implementation.",
+                            "PC Body")], ["A5:D7"])
+
+
+def framework_category(framework: str) -> str:
+    framework_lower = framework.lower()
+    if any(term in framework_lower for term in ['python', 'javascript', 'react', 'node']):
+        return "Programming"
+    if any(term in framework_lower for term in ['arduino', 'iot', 'sensor']):
+        return "Hardware/IoT"
+    if any(term in framework_lower for term in ['database', 'sql', 'mongodb']):
+        return "Database"
+    if any(term in framework_lower for term in ['design', 'cad', 'modeling']):
+        return "Design/Modeling"
+    return "Development Tool"
+
+
+def _frameworks_rows(details) -> Iterator[SheetRow]:
+    yield SheetRow(1, [("🛠️ Recommended Tools & Frameworks", "PC Sheet Header")], ["A1:C2"])
+    headers = ["Tool/Framework", "Category", "Purpose"]
+    records = []
+    for framework in details.frameworks or []:
+        category = framework_category(framework)
+        records.append([framework, category, f"Essential for {category.lower()} aspects of the project"])
+    if records:
+        yield from _table_rows(4, "PC Table Header", headers, records)
+    else:
+        yield SheetRow(4, [(h, "PC Table Header") for h in headers])
+        yield SheetRow(5, [("Recommended tools and frameworks will depend on your specific project requirements. "
+                            "Consider popular development environments and libraries in your chosen field.",
+                            "PC Body")], ["A5:C7"])
+
+
+def _link_records(links: List[str], label, site: str) -> List[List[str]]:
+    records = []
+    for link in links or []:
+        if not link or not link.strip():
+            continue
+        n = len(records) + 1
+        if link.startswith('http'):
+            records.append([str(n), label(link.strip(), n), link.strip(), "Direct Link"])
+        else:
+            records.append([str(n), link.strip(), f"Search {site} for: {link.strip()}", "Search Term"])
+    return records
+
+
+def _resources_rows(details) -> Iterator[SheetRow]:
+    yield SheetRow(1, [("📚 Learning Resources & References", "PC Sheet Header")], ["A1:D2"])
+
+    sections = [
+        ("🎥 Video Tutorials", "PC Video Section", "PC Video Header", "Tutorial Title/Search Term",
+         _link_records(details.youtube_links, lambda link, n: f"Direct Tutorial Link {n}", "YouTube"),
+         "Search YouTube for tutorials related to your project components and implementation steps."),
+        ("💻 Code Repositories", "PC Repo Section", "PC Repo Header", "Repository Name/Search Term",
+         _link_records(details.github_repos, lambda link, n: link.split('/')[-1] or f"Repository {n}", "GitHub"),
+         "Search GitHub for open-source projects and code examples related to your project."),
+    ]
+
+    row = 4
+    for title, section_style, header_style, name_header, records, empty_text in sections:
+        yield SheetRow(row, [(title, section_style)], [f"A{row}:D{row}"])
+        row += 2
+        headers = ["#", name_header, "Link", "Type"]
+        if records:
+            yield from _table_rows(row, header_style, headers, records, link_column=2)
+            row += len(records) + 1
+        else:
+            yield SheetRow(row, [(h, header_style) for h in headers])
+            yield SheetRow(row + 1, [(empty_text, "PC Body")], [f"A{row + 1}:D{row + 1}"])
+            row += 2
+        row += 2
+
+
+def _action_plan_rows(details) -> Iterator[SheetRow]:
+    yield SheetRow(1, [("🎯 Project Action Plan & Next Steps", "PC Sheet Header")], ["A1:D2"])
+
+    row = 4
+    for phase, tasks in ACTION_PLAN:
+        yield SheetRow(row, [(phase, "PC Phase")], [f"A{row}:D{row}"])
+        row += 1
+        for i, task in enumerate(tasks, 1):
+            yield SheetRow(row, [(f"{i}.", "PC Step Number"), (task, "PC Cell"),
+                                 ("⬜ To Do", "PC Step Status"), ("Notes", "PC Step Notes")])
+            row += 1
+        row += 1
+
+    row += 1
+    yield SheetRow(row, [("💡 Tips for Success", "PC Tips Header")], [f"A{row}:D{row}"])
+    for tip in SUCCESS_TIPS:
+        row += 1
+        yield SheetRow(row, [("💡", "PC Tip Icon"), (tip, "PC Body")])
+
+
+def overview_sheet(details, user_name: str = "Builder") -> SheetSpec:
+    return SheetSpec("📋 Project Overview", {"A": 5, "B": 25, "C": 5, "D": 30, "E": 5, "F": 20},
+                     _overview_rows(details, user_name),
+                     {**{row: 20 for row in range(1, 25)}, 7: 80})
+
+
+def implementation_sheet(details) -> SheetSpec:
+    return SheetSpec("📖 Implementation Guide", {"A": 40, "B": 40, "C": 20, "D": 20, "E": 20},
+                     _implementation_rows(details))
+
+
+def components_sheet(details) -> SheetSpec:
+    return SheetSpec("🔧 Components", {"A": 25, "B": 35, "C": 30, "D": 25}, _components_rows(details))
+
+
+def frameworks_sheet(details) -> SheetSpec:
+    return SheetSpec("🛠️ Tools & Frameworks", {"A": 30, "B": 20, "C": 40}, _frameworks_rows(details))
+
+
+def resources_sheet(details) -> SheetSpec:
+    return SheetSpec("📚 Learning Resources", {"A": 8, "B": 40, "C": 50, "D": 15}, _resources_rows(details))
+
+
+def action_plan_sheet(details) -> SheetSpec:
+    return SheetSpec("🎯 Action Plan", {"A": 8, "B": 50, "C": 15, "D": 20}, _action_plan_rows(details))
+
+
+def guide_sheets(details, user_name: str = "Builder") -> List[SheetSpec]:
+    """The six sheets of the Excel project guide, in workbook order"""
+    return [
+        overview_sheet(details, user_name),
+        implementation_sheet(details),
+        components_sheet(details),
+        frameworks_sheet(details),
+        resources_sheet(details),
+        action_plan_sheet(details),
+    ]
+
+
+excel_styles = ExcelStyleRegistry()
+
+
+def write_excel_guide(details, user_name: str = "Builder", output: BinaryIO = None) -> BinaryIO:
+    """Stream the guide through a write-only workbook into output (default: a spooled temp file)
+
+    Rows are flushed to disk as they are generated and every cell shares a named style (added
+    to the workbook on first use), so memory stays flat regardless of guide size. The returned stream is rewound when seekable.
+    """
+    wb = Workbook(write_only=True)
+    for spec in guide_sheets(details, user_name):
+        excel_styles.stream_sheet(wb.create_sheet(spec.title), spec)
+
+    if output is None:
+        output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE)
+    wb.save(output)
+    if output.seekable():
+        output.seek(0)
+    return output
+
+
+def excel_guide_bytes(details, user_name: str = "Builder") -> bytes:
+    with write_excel_guide(details, user_name) as output:
+        return output.read()
@@ -0,0 +1,221 @@
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional, Tuple
+
+from http_pool import http_pool
+
+GITHUB_API_URL = "https://api.github.com"
+# Search API budget per rolling minute; GitHub allows 30 with a token and 10 without
+GITHUB_SEARCH_PER_MINUTE = int(os.getenv("GITHUB_SEARCH_PER_MINUTE", "30"))
+GITHUB_SEARCH_PER_MINUTE_ANONYMOUS = 10
+# Longest a request may queue for a free slot before failing fast
+GITHUB_MAX_WAIT = float(os.getenv("GITHUB_MAX_WAIT", "10"))
+GITHUB_ETAG_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_ETAG_CACHE_MAX_ENTRIES", "512"))
+
+
+class GitHubError(RuntimeError):
+    """A GitHub API request failed"""
+
+
+class GitHubRateLimited(GitHubError):
+    """The rate-limit window is exhausted for longer than callers are willing to wait"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"GitHub search rate limit reached, resets in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+class RateLimitWindow:
+    """Rolling one-minute request budget, corrected by the X-RateLimit-* headers GitHub returns"""
+
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._sent = deque()
+        self._cond = threading.Condition()
+
+    def _wait_time(self, now: float) -> float:
+        while self._sent and now - self._sent[0] >= 60:
+            self._sent.popleft()
+        if self.remaining is not None and self.remaining <= 0 and self.reset_at and self.reset_at > now:
+            return self.reset_at - now
+        if len(self._sent) >= self.per_minute:
+            return 60 - (now - self._sent[0])
+        return 0.0
+
+    def acquire(self, max_wait: float) -> float:
+        """Take a request slot, sleeping until one frees up; returns seconds waited"""
+        started = time.time()
+        waited = False
+        with self._cond:
+            while True:
+                now = time.time()
+                wait = self._wait_time(now)
+                if wait <= 0:
+                    self._sent.append(now)
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    return now - started if waited else 0.0
+                if now + wait - started > max_wait:
+                    raise GitHubRateLimited(wait)
+                self._cond.wait(wait)
+                waited = True
+
+    def refund(self):
+        """Give back the latest local slot (304 responses do not count against the limit)"""
+        with self._cond:
+            if self._sent:
+                self._sent.pop()
+            self._cond.notify()
+
+    def update(self, headers):
+        """Adopt the server's view of the window"""
+        try:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            limit = headers.get("X-RateLimit-Limit")
+            retry_after = headers.get("Retry-After")
+        except AttributeError:
+            return
+        with self._cond:
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_at = float(reset)
+            if retry_after is not None:
+                # Secondary rate limit: back off for the period GitHub asks for
+                self.remaining = 0
+                self.reset_at = time.time() + float(retry_after)
+
+    def state(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.time()
+            self._wait_time(now)
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "resets_in": max(0.0, self.reset_at - now) if self.reset_at else None,
+                "sent_last_minute": len(self._sent),
+                "per_minute": self.per_minute,
+            }
+
+
+class GitHubClient:
+    """GitHub search client that paces requests under the rate limit and revalidates with ETags"""
+
+    def __init__(self, max_wait: float = GITHUB_MAX_WAIT, max_entries: int = GITHUB_ETAG_CACHE_MAX_ENTRIES):
+        self.max_wait = max_wait
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._etags: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._metrics = {
+            "requests": 0, "not_modified": 0, "rate_limited": 0, "errors": 0,
+            "queued": 0, "wait_seconds": 0.0,
+        }
+
+    @staticmethod
+    def _fingerprint(token: Optional[str]) -> str:
+        return hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:12] if token else "anonymous"
+
+    def window(self, token: Optional[str] = None) -> RateLimitWindow:
+        key = self._fingerprint(token)
+        with self._lock:
+            if key not in self._windows:
+                per_minute = GITHUB_SEARCH_PER_MINUTE if token else GITHUB_SEARCH_PER_MINUTE_ANONYMOUS
+                self._windows[key] = RateLimitWindow(per_minute)
+            return self._windows[key]
+
+    def _count(self, name: str, amount=1):
+        with self._lock:
+            self._metrics[name] += amount
+
+    def _etag_key(self, path: str, params: Dict, token: Optional[str]) -> str:
+        return f"{self._fingerprint(token)}:{path}?{sorted(params.items())}"
+
+    def get(self, path: str, params: Dict = None, token: Optional[str] = None) -> Any:
+        """GET a search endpoint and return its JSON; cached bodies are revalidated with If-None-Match"""
+        params = dict(params or {})
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "langchain-tool",
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        key = self._etag_key(path, params, token)
+        with self._lock:
+            cached = self._etags.get(key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        window = self.window(token)
+        try:
+            waited = window.acquire(self.max_wait)
+        except GitHubRateLimited:
+            self._count("rate_limited")
+            raise
+        if waited > 0:
+            self._count("queued")
+            self._count("wait_seconds", waited)
+            print(f"⏳ Waited {waited:.1f}s for a GitHub search slot")
+
+        self._count("requests")
+        try:
+            res = http_pool.get(f"{GITHUB_API_URL}{path}", params=params, headers=headers)
+        except Exception as e:
+            self._count("errors")
+            raise GitHubError(f"GitHub search failed: {e}")
+        window.update(res.headers)
+
+        if res.status_code == 304 and cached is not None:
+            window.refund()
+            self._count("not_modified")
+            with self._lock:
+                self._etags.move_to_end(key)
+            return cached[1]
+
+        if res.status_code in (403, 429) and (
+            res.headers.get("X-RateLimit-Remaining") == "0" or res.headers.get("Retry-After")
+        ):
+            self._count("rate_limited")
+            raise GitHubRateLimited(window.state()["resets_in"] or 60)
+
+        if res.status_code >= 400:
+            self._count("errors")
+            auth_msg = " (authentication may be missing or rate limit exceeded)" if res.status_code in (401, 403) else ""
+            raise GitHubError(f"GitHub search failed with HTTP {res.status_code}{auth_msg}.")
+
+        data = res.json()
+        etag = res.headers.get("ETag")
+        if etag:
+            with self._lock:
+                self._etags[key] = (etag, data)
+                self._etags.move_to_end(key)
+                while len(self._etags) > self.max_entries:
+                    self._etags.popitem(last=False)
+        return data
+
+    def search_repositories(self, query: str, token: Optional[str] = None, per_page: int = 8,
+                            sort: str = "stars") -> Dict:
+        return self.get("/search/repositories",
+                        {"q": query, "sort": sort, "order": "desc", "per_page": per_page}, token)
+
+    def metrics(self, token: Optional[str] = None) -> Dict[str, Any]:
+        """Request counters plus the current rate-limit window for a token"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["etag_entries"] = len(self._etags)
+        metrics["window"] = self.window(token).state()
+        return metrics
+
+
+github_client = GitHubClient()
@@ -0,0 +1,110 @@
+import os
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+# Longest a single retry will sleep, whatever Retry-After the server sends
+HTTP_MAX_RETRY_AFTER = float(os.getenv("HTTP_MAX_RETRY_AFTER", "30"))
+
+# Keep-alive pool size per upstream host; anything else gets DEFAULT_POOL_SIZE
+HOST_POOL_SIZES = {
+    "www.googleapis.com": 20,
+    "api.github.com": 10,
+    "api.tavily.com": 10,
+}
+DEFAULT_POOL_SIZE = 10
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Hosts whose client paces itself from the rate-limit headers (see github_client.RateLimitWindow):
+# the adapter only retries server errors there and never sleeps through a Retry-After
+SELF_THROTTLED_HOSTS = {"api.github.com"}
+SERVER_ERROR_STATUSES = (500, 502, 503, 504)
+
+
+class CappedRetry(Retry):
+    """urllib3 Retry that never sleeps longer than max_retry_after for a Retry-After header"""
+
+    max_retry_after = HTTP_MAX_RETRY_AFTER
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+class HttpPool:
+    """Shared keep-alive HTTP layer with per-host pools and backoff-aware retries"""
+
+    def __init__(self, host_pool_sizes: Dict[str, int] = None,
+                 connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+                 read_timeout: float = HTTP_READ_TIMEOUT,
+                 max_retries: int = HTTP_MAX_RETRIES,
+                 backoff_factor: float = HTTP_BACKOFF_FACTOR):
+        self.host_pool_sizes = dict(host_pool_sizes or HOST_POOL_SIZES)
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+
+    def _build_retry(self, self_throttled: bool = False) -> Retry:
+        return CappedRetry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=SERVER_ERROR_STATUSES if self_throttled else RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=not self_throttled,
+            raise_on_status=False,
+        )
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        retry = self._build_retry()
+
+        default_adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_SIZE, max_retries=retry
+        )
+        session.mount("https://", default_adapter)
+        session.mount("http://", default_adapter)
+
+        for host, size in self.host_pool_sizes.items():
+            host_retry = self._build_retry(self_throttled=True) if host in SELF_THROTTLED_HOSTS else retry
+            session.mount(
+                f"https://{host}",
+                HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=host_retry)
+            )
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the pooled session; retries and backoff are handled by the adapter"""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+http_pool = HttpPool()
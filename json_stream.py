@@ -0,0 +1,123 @@
+import json
+from typing import Any, Dict, List, Tuple
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """Single-pass parser that emits top-level object fields as soon as each value closes
+
+    Text before the first "{" (code fences, prose) and after the closing "}" is ignored, and
+    trailing commas are dropped while scanning, so LLM output never needs a second pass.
+    """
+
+    def __init__(self):
+        self.result: Dict[str, Any] = {}
+        self._state = "seek"
+        self._key: List[str] = []
+        self._value: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk and return the (key, value) pairs completed by it"""
+        completed = []
+        for ch in text:
+            state = self._state
+
+            if state == "value":
+                field = self._feed_value(ch)
+                if field is not None:
+                    completed.append(field)
+            elif state == "seek":
+                if ch == "{":
+                    self._state = "key"
+            elif state == "key":
+                if ch == '"':
+                    self._key = []
+                    self._state = "in_key"
+                elif ch == "}":
+                    self._state = "done"
+            elif state == "in_key":
+                if self._escape:
+                    self._key.append(ch)
+                    self._escape = False
+                elif ch == "\\":
+                    self._key.append(ch)
+                    self._escape = True
+                elif ch == '"':
+                    self._state = "colon"
+                else:
+                    self._key.append(ch)
+            elif state == "colon":
+                if ch == ":":
+                    self._value = []
+                    self._depth = 0
+                    self._in_string = False
+                    self._escape = False
+                    self._state = "value"
+            # "done": ignore anything after the closing brace (e.g. a trailing code fence)
+
+        return completed
+
+    def _feed_value(self, ch: str):
+        if self._in_string:
+            self._value.append(ch)
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+            return None
+
+        if ch == '"':
+            self._in_string = True
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            if self._depth == 0:
+                # Closing brace of the top-level object ends the last field
+                self._state = "done"
+                return self._complete_field()
+            self._depth -= 1
+            self._drop_trailing_comma()
+        elif ch == "," and self._depth == 0:
+            self._state = "key"
+            return self._complete_field()
+
+        self._value.append(ch)
+        return None
+
+    def _drop_trailing_comma(self):
+        """Remove a dangling comma before a closing bracket, e.g. [1, 2, ]"""
+        i = len(self._value) - 1
+        while i >= 0 and self._value[i] in _WHITESPACE:
+            i -= 1
+        if i >= 0 and self._value[i] == ",":
+            del self._value[i]
+
+    def _complete_field(self):
+        key = json.loads('"' + "".join(self._key) + '"')
+        raw = "".join(self._value).strip()
+        self._value = []
+        if not raw:
+            return None
+        try:
+            value = json.loads(raw, strict=False)
+        except json.JSONDecodeError:
+            return None
+        self.result[key] = value
+        return key, value
+
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing, keeping a final field that ended without its closing brace"""
+        if self._state == "value" and not self._in_string and self._depth == 0:
+            self._complete_field()
+        self._state = "done"
+        return self.result
@@ -1,11 +1,12 @@
 import streamlit as st
 import asyncio
-from typing import Dict, List, Any
-from dataclasses import dataclass
+import uuid
+import hashlib
+from typing import Dict, List, Any, AsyncIterator, Iterator, Tuple
+from dataclasses import asdict
 import json
 import re
 import io
-from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -15,12 +16,22 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import io
 import base64
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.table import Table, TableStyleInfo
 
 from simple_chat import simple_chat
-from tools import ToolsMain
+from tools import ToolsMain, tool_registry
+from github_client import GitHubRateLimited
+from cache import llm_cache, export_cache
+from json_stream import IncrementalJSONParser
+from excel_export import (
+    excel_styles, overview_sheet, implementation_sheet, components_sheet,
+    frameworks_sheet, resources_sheet, action_plan_sheet
+)
+from pdf_export import pdf_guide_bytes, write_pdf_guide
+from markdown_export import markdown_guide
+from models import ProjectDetails, ProjectRequest
+from async_runner import background_loop
+from trending_catalogue import trending_catalogue, validate_projects
 from theme import (
     add_custom_css, 
     create_animated_title, 
@@ -30,31 +41,159 @@ from theme import (
 )
 from langchain_groq import ChatGroq
 from langchain.prompts import ChatPromptTemplate
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 import os
 from dotenv import load_dotenv
 load_dotenv()
 
-@dataclass
-class ProjectDetails:
-    title: str
-    short_description: str
-    detailed_description: str
-    components: List[Dict[str, str]]
-    frameworks: List[str]
-    youtube_links: List[str]
-    github_repos: List[str]
-    difficulty_level: str
-    estimated_time: str
+# Components from the bill of materials looked up for store and spec links
+COMPONENT_INFO_MAX = 10
+
+# Fields a project-guide completion must contain before it is worth caching
+PROJECT_DETAILS_REQUIRED_KEYS = ("title", "short_description", "detailed_description", "components", "frameworks")
+
+# Per-source deadlines (seconds) for the concurrent resource-gathering stage
+RESOURCE_DEADLINES = {
+    "youtube": 45.0,
+    "github": 30.0,
+    "components": 30.0,
+}
+
+# Engineering Fields Structure based on Pakistan's complete list
+ENGINEERING_FIELDS = {
+    "🏗️ Civil & Infrastructure": {
+        "color": "#8B4513",
+        "desc": "Building the foundations of society",
+        "subfields": [
+            "Civil Engineering",
+            "Structural Engineering", 
+            "Environmental Engineering",
+            "Transportation Engineering",
+            "Water Resources Engineering",
+            "Geotechnical Engineering",
+            "Urban & Infrastructure Engineering",
+            "Architectural Engineering",
+            "Geological Engineering"
+        ]
+    },
+    "⚙️ Mechanical & Manufacturing": {
+        "color": "#FF6B35",
+        "desc": "Designing and building mechanical systems",
+        "subfields": [
+            "Mechanical Engineering",
+            "Manufacturing Engineering",
+            "Automotive Engineering",
+            "Aerospace Engineering",
+            "Aeronautical Engineering",
+            "Industrial Engineering",
+            "Mechatronics Engineering",
+            "Robotics & Automation Engineering",
+            "Marine Engineering"
+        ]
+    },
+    "⚡ Electrical & Electronics": {
+        "color": "#FFD700",
+        "desc": "Powering the modern world",
+        "subfields": [
+            "Electrical Engineering",
+            "Electronics Engineering",
+            "Telecommunication Engineering",
+            "Avionics Engineering",
+            "Power Systems Engineering",
+            "Control Systems Engineering",
+            "Instrumentation Engineering",
+            "Energy & Power Engineering"
+        ]
+    },
+    "💻 Computing & Software": {
+        "color": "#4169E1",
+        "desc": "Creating digital solutions",
+        "subfields": [
+            "Computer Engineering",
+            "Software Engineering",
+            "Information & Communication Technology (ICT)",
+            "Systems Engineering",
+            "Artificial Intelligence Engineering",
+            "Data Science Engineering",
+            "Cybersecurity Engineering",
+            "Network Engineering"
+        ]
+    },
+    "⚗️ Chemical & Materials": {
+        "color": "#32CD32",
+        "desc": "Transforming materials and processes",
+        "subfields": [
+            "Chemical Engineering",
+            "Petroleum Engineering",
+            "Polymer Engineering",
+            "Materials Engineering",
+            "Nanotechnology Engineering",
+            "Process Engineering",
+            "Food Engineering",
+            "Textile Engineering"
+        ]
+    },
+    "🌱 Biological & Agricultural": {
+        "color": "#228B22",
+        "desc": "Engineering for life sciences",
+        "subfields": [
+            "Biomedical Engineering",
+            "Agricultural Engineering",
+            "Bioengineering",
+            "Biotechnology Engineering",
+            "Food Engineering",
+            "Environmental Engineering",
+            "Biosystems Engineering"
+        ]
+    },
+    "🛡️ Specialized & Defense": {
+        "color": "#800080",
+        "desc": "Advanced and specialized fields",
+        "subfields": [
+            "Nuclear Engineering",
+            "Military Engineering",
+            "Defense Production Engineering",
+            "Mining Engineering",
+            "Metallurgical Engineering",
+            "Safety Engineering",
+            "Quality Engineering"
+        ]
+    },
+    "🔬 Emerging Technologies": {
+        "color": "#FF1493",
+        "desc": "Cutting-edge engineering disciplines",
+        "subfields": [
+            "Renewable Energy Engineering",
+            "Artificial Intelligence Engineering",
+            "Quantum Engineering",
+            "Space Technology Engineering",
+            "Biomedical Device Engineering",
+            "Smart Systems Engineering",
+            "Sustainable Engineering"
+        ]
+    }
+}
+
+# Fields per batched trending request, concurrent batches, and attempts per field
+TRENDING_BATCH_SIZE = 6
+TRENDING_BATCH_CONCURRENCY = 2
+TRENDING_BATCH_ATTEMPTS = 3
+
+# Speculative refinement questions kept in flight per session (oldest is cancelled first)
+REFINEMENT_PREFETCH_MAX = 2
+# Longest the Submit handler waits for an in-flight prefetched question before streaming a fresh one
+REFINEMENT_PREFETCH_WAIT = float(os.getenv("REFINEMENT_PREFETCH_WAIT", "8"))
 
 class ProjectGuideAssistant:
     def __init__(self):
         self.llm = ChatGroq(temperature=0.2, model="moonshotai/kimi-k2-instruct")
         self.simple_chat = simple_chat()
-        self.tools = ToolsMain()
-        self.tool_list = self.tools()
-        self.tool_map = {t.name: t for t in self.tool_list}
+        self.tool_registry = tool_registry
+        self.llm_cache = llm_cache
+        self.export_cache = export_cache
+        self.excel_styles = excel_styles
+        self.trending_catalogue = trending_catalogue
         
         # Natural conversation prompt for project exploration
         self.refinement_prompt = ChatPromptTemplate.from_template("""
@@ -115,6 +254,37 @@ class ProjectGuideAssistant:
         Make sure projects are diverse in difficulty and application areas within the selected field.
         """)
         
+        # Several fields in one request; each field's section is validated on its own
+        self.trending_projects_batch_prompt = ChatPromptTemplate.from_template("""
+        Generate 6 trending and popular project ideas for EACH of these fields:
+        {engineering_fields}
+        
+        Focus on projects that are:
+        1. Currently relevant and in-demand in the industry
+        2. Educational and skill-building
+        3. Suitable for different levels (beginner to advanced)
+        4. Implementable with available resources
+        5. Impressive for portfolios and resumes
+        
+        Provide a JSON response with one top-level key per field, spelled exactly as listed:
+        {{
+            "Field Name": {{
+                "projects": [
+                    {{
+                        "title": "Project Name",
+                        "description": "Brief 2-3 sentence description of what the project does and why it's trending",
+                        "difficulty": "Beginner/Intermediate/Advanced",
+                        "category": "Semester Project/FYP/Hobby Project/Industry Project",
+                        "key_technologies": ["Tech1", "Tech2", "Tech3"],
+                        "why_trending": "Brief explanation of why this project is currently popular"
+                    }}
+                ]
+            }}
+        }}
+        
+        Make sure projects are diverse in difficulty and application areas within each field, and do not repeat projects across fields.
+        """)
+        
         # Project-specific refinement prompt
         self.project_refinement_prompt = ChatPromptTemplate.from_template("""
         You are helping a student refine their project idea: {project_title}
@@ -169,31 +339,135 @@ class ProjectGuideAssistant:
         Include enough detail for someone to actually build the project successfully.
         """)
 
+    @property
+    def tools(self) -> ToolsMain:
+        return self.tool_registry.tools_main
+    
+    @property
+    def tool_list(self) -> List:
+        return self.tool_registry.tool_list
+    
+    @property
+    def tool_map(self) -> Dict:
+        return self.tool_registry.tool_map
+    
+    async def _ainvoke_llm(self, messages: List, use_cache: bool = True):
+        """Invoke the chat model asynchronously, serving repeated prompts from the shared LLM response cache
+        
+        Responses are not cached here: callers store them with _cache_llm_response once they parse.
+        """
+        if use_cache:
+            cached = self.llm_cache.get(self.llm, messages)
+            if cached is not None:
+                print(f"⚡ LLM cache hit ({self.llm_cache.stats()['hits']} hits so far)")
+                return cached
+        
+        return await self.llm.ainvoke(messages)
+    
+    def _cache_llm_response(self, messages: List, response: Any):
+        """Remember a completion that its caller has parsed and validated"""
+        if isinstance(response, str):
+            response = AIMessage(content=response)
+        self.llm_cache.set(self.llm, messages, response)
+
+    async def request_trending_projects(self, engineering_field: str, use_cache: bool = True) -> List[Dict]:
+        """Ask the LLM for trending projects and validate them; raises on unusable output"""
+        messages = self.trending_projects_prompt.format_messages(engineering_field=engineering_field)
+        response = await self._ainvoke_llm(messages, use_cache=use_cache)
+        
+        response_text = response.content if hasattr(response, 'content') else str(response)
+        # Clean up the response to extract JSON
+        if '```json' in response_text:
+            response_text = response_text.split('```json')[1].split('```')[0]
+        elif '```' in response_text:
+            response_text = response_text.split('```')[1].split('```')[0]
+        
+        projects = validate_projects(json.loads(response_text.strip()))
+        self._cache_llm_response(messages, response)
+        return projects
+
+    async def _request_trending_batch(self, engineering_fields: List[str], use_cache: bool) -> Tuple[Dict[str, List[Dict]], Dict[str, str]]:
+        """One LLM round trip for several fields; returns (valid projects, errors) per field"""
+        messages = self.trending_projects_batch_prompt.format_messages(
+            engineering_fields="\n".join(f"- {f}" for f in engineering_fields)
+        )
+        response = await self._ainvoke_llm(messages, use_cache=use_cache)
+        sections = self._parse_llm_response(response.content if hasattr(response, 'content') else str(response)) or {}
+        # Tolerate the model changing case or spacing of a field name
+        normalized = {re.sub(r"\s+", " ", k).strip().lower(): v for k, v in sections.items()}
+        
+        results, errors = {}, {}
+        for engineering_field in engineering_fields:
+            section = sections.get(engineering_field)
+            if section is None:
+                section = normalized.get(re.sub(r"\s+", " ", engineering_field).strip().lower())
+            try:
+                if section is None:
+                    raise ValueError("missing from response")
+                results[engineering_field] = validate_projects(section)
+            except ValueError as e:
+                errors[engineering_field] = str(e)
+        
+        # Only a response that covered every field is worth replaying
+        if not errors:
+            self._cache_llm_response(messages, response)
+        return results, errors
+
+    async def request_trending_projects_batch(self, engineering_fields: List[str], use_cache: bool = True,
+                                              batch_size: int = TRENDING_BATCH_SIZE,
+                                              attempts: int = TRENDING_BATCH_ATTEMPTS) -> Tuple[Dict[str, List[Dict]], Dict[str, str]]:
+        """Generate trending projects for many fields in batched requests, retrying only the fields that failed"""
+        semaphore = asyncio.Semaphore(TRENDING_BATCH_CONCURRENCY)
+        results, errors = {}, {}
+        pending = list(dict.fromkeys(engineering_fields))
+        
+        async def run_batch(batch: List[str]):
+            async with semaphore:
+                try:
+                    return await self._request_trending_batch(batch, use_cache)
+                except Exception as e:
+                    return {}, {f: f"request failed: {e}" for f in batch}
+        
+        for attempt in range(attempts):
+            if not pending:
+                break
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            outcomes = await asyncio.gather(*(run_batch(b) for b in batches))
+            
+            errors = {}
+            for batch_results, batch_errors in outcomes:
+                results.update(batch_results)
+                errors.update(batch_errors)
+            pending = list(errors)
+            # Retries always ask the model again rather than replaying an earlier answer
+            use_cache = False
+            if pending:
+                print(f"🔁 Trending batch attempt {attempt + 1}: {len(pending)} field(s) failed validation")
+        
+        print(f"📦 Trending batch: {len(results)}/{len(results) + len(errors)} fields generated")
+        return results, errors
+
     async def generate_trending_projects(self, engineering_field: str) -> List[Dict]:
         """Generate trending projects for the selected engineering field"""
         try:
-            response = self.llm.invoke(
-                self.trending_projects_prompt.format_messages(engineering_field=engineering_field)
-            )
-            
-            # Parse the response
-            try:
-                import json
-                response_text = response.content if hasattr(response, 'content') else str(response)
-                # Clean up the response to extract JSON
-                if '```json' in response_text:
-                    response_text = response_text.split('```json')[1].split('```')[0]
-                elif '```' in response_text:
-                    response_text = response_text.split('```')[1].split('```')[0]
-                
-                projects_data = json.loads(response_text.strip())
-                return projects_data.get("projects", [])
-            except:
-                # Fallback trending projects
-                return self._get_fallback_projects(engineering_field)
-                
+            projects = await self.request_trending_projects(engineering_field)
         except Exception as e:
+            print(f"⚠️ Trending generation failed for {engineering_field}: {e}")
             return self._get_fallback_projects(engineering_field)
+        
+        # Write through so the next session for this field is served from the catalogue
+        try:
+            self.trending_catalogue.put(engineering_field, projects)
+        except Exception as e:
+            print(f"⚠️ Could not store trending projects in the catalogue: {e}")
+        return projects
+    
+    def catalogued_trending_projects(self, engineering_field: str) -> List[Dict]:
+        """Serve pre-generated trending projects instantly; stale entries are refreshed in the background"""
+        projects = self.trending_catalogue.get(engineering_field)
+        if projects and self.trending_catalogue.is_stale(engineering_field):
+            background_loop.submit(self.trending_catalogue.refresh(self, [engineering_field]))
+        return projects
     
     def _get_fallback_projects(self, engineering_field: str) -> List[Dict]:
         """Fallback trending projects if generation fails"""
@@ -211,96 +485,218 @@ class ProjectGuideAssistant:
         }
         return fallback_projects.get(engineering_field, fallback_projects["💻 Computing & Software"])
     
+    def _refinement_question_messages(self, project_title: str, engineering_field: str,
+                                      project_type: str, complexity_level: str, user_responses: Dict) -> List:
+        """Render the refinement-question prompt for the current project context"""
+        return self.project_refinement_prompt.format_messages(
+            project_title=project_title,
+            engineering_field=engineering_field,
+            project_type=project_type,
+            complexity_level=complexity_level,
+            user_responses=str(user_responses)
+        )
+    
+    def _fallback_refinement_question(self, project_title: str) -> str:
+        """Pick a generic refinement question when the LLM is unavailable"""
+        fallback_questions = [
+            f"What specific features would you like to include in your {project_title}?",
+            f"Which technologies or components are you most interested in using for this {project_title}?",
+            f"What would be the main use case or target audience for your {project_title}?",
+            f"Do you want to focus more on the hardware side or software side of this {project_title}?",
+            f"What makes your {project_title} unique compared to existing solutions?"
+        ]
+        import random
+        return random.choice(fallback_questions)
+    
+    async def _astream_llm(self, messages: List, use_cache: bool = True) -> AsyncIterator[str]:
+        """Stream completion text as it is generated; cached completions are replayed in one chunk
+        
+        As with _ainvoke_llm, callers cache the joined text once it has parsed.
+        """
+        if use_cache:
+            cached = self.llm_cache.get(self.llm, messages)
+            if cached is not None:
+                print(f"⚡ LLM cache hit ({self.llm_cache.stats()['hits']} hits so far)")
+                yield cached.content if hasattr(cached, 'content') else str(cached)
+                return
+        
+        async for chunk in self.llm.astream(messages):
+            text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+            if text:
+                yield text
+    
     async def ask_refinement_question(self, project_title: str, engineering_field: str, 
-                                    project_type: str, complexity_level: str, user_responses: Dict) -> str:
+                                    project_type: str, complexity_level: str, user_responses: Dict,
+                                    use_cache: bool = True) -> str:
         """Ask a specific refinement question about the selected project"""
         try:
-            response = self.llm.invoke(
-                self.project_refinement_prompt.format_messages(
-                    project_title=project_title,
-                    engineering_field=engineering_field,
-                    project_type=project_type,
-                    complexity_level=complexity_level,
-                    user_responses=str(user_responses)
-                )
+            messages = self._refinement_question_messages(
+                project_title, engineering_field, project_type, complexity_level, user_responses
             )
+            response = await self._ainvoke_llm(messages, use_cache=use_cache)
             
-            question = response.content if hasattr(response, 'content') else str(response)
-            return question.strip()
+            question = (response.content if hasattr(response, 'content') else str(response)).strip()
+            if not question:
+                raise ValueError("empty refinement question")
+            self._cache_llm_response(messages, response)
+            return question
             
         except Exception as e:
             # Fallback questions based on project type
-            fallback_questions = [
-                f"What specific features would you like to include in your {project_title}?",
-                f"Which technologies or components are you most interested in using for this {project_title}?",
-                f"What would be the main use case or target audience for your {project_title}?",
-                f"Do you want to focus more on the hardware side or software side of this {project_title}?",
-                f"What makes your {project_title} unique compared to existing solutions?"
-            ]
-            import random
-            return random.choice(fallback_questions)
+            return self._fallback_refinement_question(project_title)
+    
+    async def stream_refinement_question(self, project_title: str, engineering_field: str,
+                                         project_type: str, complexity_level: str, user_responses: Dict,
+                                         use_cache: bool = True) -> AsyncIterator[str]:
+        """Stream the next refinement question token by token"""
+        messages = self._refinement_question_messages(
+            project_title, engineering_field, project_type, complexity_level, user_responses
+        )
+        parts = []
+        emitted = False
+        try:
+            async for text in self._astream_llm(messages, use_cache=use_cache):
+                emitted = True
+                parts.append(text)
+                yield text
+            if "".join(parts).strip():
+                self._cache_llm_response(messages, "".join(parts))
+        except Exception as e:
+            print(f"❌ Streaming refinement question failed: {e}")
+            if not emitted:
+                yield self._fallback_refinement_question(project_title)
+
+    def _refinement_query(self, user_input: str, conversation_history: List[str]) -> str:
+        """Build the simple_chat query for conversational idea refinement"""
+        context = f"Previous conversation: {' '.join(conversation_history[-3:])}"
+        return f"Help refine this project idea: {user_input}\nContext: {context}"
 
     async def refine_project_idea(self, user_input: str, conversation_history: List[str]) -> str:
         """Refine the user's project idea through conversation"""
         try:
             # Use simple_chat for idea refinement with better context
-            context = f"Previous conversation: {' '.join(conversation_history[-3:])}"
-            refined_query = f"Help refine this project idea: {user_input}\nContext: {context}"
+            refined_query = self._refinement_query(user_input, conversation_history)
             
-            response = await asyncio.create_task(
-                asyncio.to_thread(self.simple_chat, refined_query)
-            )
-            return response
+            return await self.simple_chat.fusion_answer(refined_query)
         except Exception as e:
             return f"I had trouble understanding that. Could you tell me more about what you'd like to build? For example, do you want to make something that helps around the house, or maybe something fun to play with?"
 
-    async def generate_project_details(self, project_title: str) -> ProjectDetails:
+    async def stream_refine_project_idea(self, user_input: str, conversation_history: List[str]) -> AsyncIterator[str]:
+        """Stream the conversational refinement reply as it is generated"""
+        emitted = False
+        try:
+            refined_query = self._refinement_query(user_input, conversation_history)
+            async for text in self.simple_chat.astream_fusion_answer(refined_query):
+                emitted = True
+                yield text
+        except Exception as e:
+            print(f"❌ Streaming refinement reply failed: {e}")
+            if not emitted:
+                yield "I had trouble understanding that. Could you tell me more about what you'd like to build? For example, do you want to make something that helps around the house, or maybe something fun to play with?"
+
+    def _project_details_messages(self, project_title: str, engineering_field: str, project_type: str,
+                                  complexity_level: str, user_responses: Dict) -> List:
+        """Render the project-guide prompt with the user's refinement context"""
+        # Enhanced prompt with context
+        enhanced_prompt = f"""
+        Generate a comprehensive project guide for: {project_title}
+        
+        Context:
+        - Engineering Field: {engineering_field}
+        - Project Type: {project_type}
+        - Complexity Level: {complexity_level}
+        - User Requirements: {'; '.join([f"{k}: {v}" for k, v in user_responses.items()])}
+        
+        Create a detailed, practical project plan that's educational and achievable.
+        Focus on clear learning outcomes and step-by-step implementation.
+        
+        Provide a JSON response with this exact structure:
+        {{
+            "title": "{project_title}",
+            "short_description": "Clear, engaging description of what the project does and its real-world applications",
+            "detailed_description": "Comprehensive guide including:\\n1. Project overview and learning objectives\\n2. Prerequisites and required knowledge\\n3. Step-by-step implementation process with detailed explanations\\n4. Key concepts and technologies explained clearly\\n5. Testing and validation methods\\n6. Potential extensions and improvements\\n7. Common challenges and troubleshooting tips\\n8. Real-world applications and use cases",
+            "components": [
+                {{"name": "Component Name", "purpose": "What this component does and why it's needed", "specs": "Detailed specifications, model numbers, and where to buy"}}
+            ],
+            "frameworks": ["Framework1", "Framework2", "Framework3"],
+            "difficulty_level": "{complexity_level.split(' - ')[0] if ' - ' in complexity_level else complexity_level}",
+            "estimated_time": "X weeks/months based on complexity"
+        }}
+        
+        Make it comprehensive yet approachable, with clear explanations suitable for the specified complexity level.
+        Include enough detail for someone to actually build the project successfully.
+        """
+        
+        return [
+            SystemMessage(content="You are an expert project mentor creating detailed, practical project guides."),
+            HumanMessage(content=enhanced_prompt)
+        ]
+
+    async def generate_project_details(self, request: ProjectRequest) -> ProjectDetails:
         """Generate comprehensive project details with enhanced context"""
+        details = None
+        async for event, payload in self.stream_project_details(request):
+            if event == "details":
+                details = payload
+        return details
+
+    @staticmethod
+    def _is_complete_project_data(closed: bool, project_data: Dict) -> bool:
+        """A guide completion is cacheable only if its object closed and every required field parsed"""
+        return closed and all(key in project_data for key in PROJECT_DETAILS_REQUIRED_KEYS)
+
+    async def generate_project_structure(self, request: ProjectRequest) -> Dict:
+        """Run only the LLM step of the project guide; returns {} unless the response parses completely"""
+        messages = self._project_details_messages(
+            request.title, request.engineering_field, request.project_type,
+            request.complexity_level, request.user_responses
+        )
+        parser = IncrementalJSONParser()
+        parts = []
+        async for text in self._astream_llm(messages):
+            parts.append(text)
+            parser.feed(text)
+        
+        # close() marks the parser done, so check whether the object really closed first
+        closed = parser.done
+        project_data = parser.close()
+        if not self._is_complete_project_data(closed, project_data):
+            return {}
+        self._cache_llm_response(messages, "".join(parts))
+        return project_data
+
+    async def stream_project_details(self, request: ProjectRequest, project_data: Dict = None) -> AsyncIterator[Tuple[str, Any]]:
+        """Generate project details, yielding ("token", text), ("field", (name, value)), ("stage", label) and ("error", message) events before ("details", ProjectDetails)
+        
+        A project_data structure drafted earlier (see generate_project_structure) skips the LLM step.
+        """
+        project_title = request.title
         try:
-            # Get project context from session state
-            engineering_field = getattr(st.session_state, 'selected_subdomain', None) or getattr(st.session_state, 'selected_field', '')
-            project_type = getattr(st.session_state, 'project_type', 'General Project')
-            complexity_level = getattr(st.session_state, 'complexity_level', 'Intermediate')
-            user_responses = getattr(st.session_state, 'user_responses', {})
-            
-            # Enhanced prompt with context
-            enhanced_prompt = f"""
-            Generate a comprehensive project guide for: {project_title}
-            
-            Context:
-            - Engineering Field: {engineering_field}
-            - Project Type: {project_type}
-            - Complexity Level: {complexity_level}
-            - User Requirements: {'; '.join([f"{k}: {v}" for k, v in user_responses.items()])}
-            
-            Create a detailed, practical project plan that's educational and achievable.
-            Focus on clear learning outcomes and step-by-step implementation.
-            
-            Provide a JSON response with this exact structure:
-            {{
-                "title": "{project_title}",
-                "short_description": "Clear, engaging description of what the project does and its real-world applications",
-                "detailed_description": "Comprehensive guide including:\\n1. Project overview and learning objectives\\n2. Prerequisites and required knowledge\\n3. Step-by-step implementation process with detailed explanations\\n4. Key concepts and technologies explained clearly\\n5. Testing and validation methods\\n6. Potential extensions and improvements\\n7. Common challenges and troubleshooting tips\\n8. Real-world applications and use cases",
-                "components": [
-                    {{"name": "Component Name", "purpose": "What this component does and why it's needed", "specs": "Detailed specifications, model numbers, and where to buy"}}
-                ],
-                "frameworks": ["Framework1", "Framework2", "Framework3"],
-                "difficulty_level": "{complexity_level.split(' - ')[0] if ' - ' in complexity_level else complexity_level}",
-                "estimated_time": "X weeks/months based on complexity"
-            }}
-            
-            Make it comprehensive yet approachable, with clear explanations suitable for the specified complexity level.
-            Include enough detail for someone to actually build the project successfully.
-            """
-            
-            # Generate basic project structure
-            project_response = self.llm.invoke([
-                SystemMessage(content="You are an expert project mentor creating detailed, practical project guides."),
-                HumanMessage(content=enhanced_prompt)
-            ])
-            
-            # Parse the response with robust error handling
-            project_data = self._parse_llm_response(project_response.content)
+            engineering_field = request.engineering_field
+            project_type = request.project_type
+            complexity_level = request.complexity_level
+            user_responses = request.user_responses
+            
+            if project_data:
+                for field_update in project_data.items():
+                    yield "field", field_update
+            else:
+                # Generate basic project structure, emitting each JSON field as soon as it closes
+                messages = self._project_details_messages(
+                    project_title, engineering_field, project_type, complexity_level, user_responses
+                )
+                parser = IncrementalJSONParser()
+                parts = []
+                async for text in self._astream_llm(messages):
+                    parts.append(text)
+                    yield "token", text
+                    for field_update in parser.feed(text):
+                        yield "field", field_update
+                
+                closed = parser.done
+                project_data = parser.close()
+                if self._is_complete_project_data(closed, project_data):
+                    self._cache_llm_response(messages, "".join(parts))
             
             if not project_data:
                 # Create comprehensive fallback data
@@ -315,44 +711,79 @@ class ProjectGuideAssistant:
                 }
             
             # Use tools to get additional information with enhanced project context
-            project_context = {
-                'engineering_field': engineering_field,
-                'user_responses': user_responses,
-                'project_type': project_data.get('type', ''),
-                'complexity_level': complexity_level
-            }
+            project_context = request.resource_context(project_data.get('type', ''))
             
-            youtube_links = await self.get_youtube_tutorials(project_title, project_context)
-            github_repos = await self.get_github_repos(project_title, engineering_field)
+            yield "stage", "📚 Finding tutorials, repositories and components..."
+            resources = await self.gather_project_resources(
+                project_title, project_context, project_data.get("components", [])
+            )
             
-            return ProjectDetails(
+            yield "details", ProjectDetails(
                 title=project_data.get("title", project_title),
                 short_description=project_data.get("short_description", ""),
                 detailed_description=project_data.get("detailed_description", ""),
                 components=project_data.get("components", []),
                 frameworks=project_data.get("frameworks", []),
-                youtube_links=youtube_links,
-                github_repos=github_repos,
+                youtube_links=resources["youtube"],
+                github_repos=resources["github"],
                 difficulty_level=project_data.get("difficulty_level", "Intermediate"),
-                estimated_time=project_data.get("estimated_time", "4-6 weeks")
+                estimated_time=project_data.get("estimated_time", "4-6 weeks"),
+                component_info=resources["components"]
             )
             
         except Exception as e:
-            st.error(f"Error generating project details: {str(e)}")
-            return ProjectDetails(
+            print(f"❌ Error generating project details: {str(e)}")
+            yield "error", f"Error generating project details: {str(e)}"
+            yield "details", ProjectDetails(
                 title=project_title,
                 short_description=f"Custom {project_title} project",
                 detailed_description=self._create_fallback_description(project_title, 
-                    getattr(st.session_state, 'selected_field', 'Engineering'), 
-                    getattr(st.session_state, 'complexity_level', 'Intermediate')),
-                components=self._create_fallback_components(getattr(st.session_state, 'selected_field', 'Engineering')),
-                frameworks=self._create_fallback_frameworks(getattr(st.session_state, 'selected_field', 'Engineering')),
+                    request.selected_field, 
+                    request.complexity_level),
+                components=self._create_fallback_components(request.selected_field),
+                frameworks=self._create_fallback_frameworks(request.selected_field),
                 youtube_links=[],
                 github_repos=[],
                 difficulty_level="Intermediate",
                 estimated_time="4-6 weeks"
             )
     
+    async def gather_project_resources(self, project_title: str, project_context: Dict,
+                                       components: List[Dict]) -> Dict[str, List[str]]:
+        """Launch YouTube, GitHub and component lookups together, each bounded by its own deadline"""
+        engineering_field = project_context.get('engineering_field', '') if project_context else ''
+        
+        # Each source pairs its lookup with a cheap, offline fallback used on timeout or failure
+        sources = {
+            "youtube": (
+                self.get_youtube_tutorials(project_title, project_context),
+                lambda: self._get_fallback_youtube_search_urls(project_title, engineering_field)
+            ),
+            "github": (
+                self.get_github_repos(project_title, engineering_field),
+                lambda: self._build_github_search_urls(project_title, engineering_field)
+            ),
+            "components": (
+                self.get_component_info(components),
+                list
+            ),
+        }
+        
+        async def run_source(name: str, lookup, fallback) -> List[str]:
+            deadline = RESOURCE_DEADLINES.get(name)
+            try:
+                return await asyncio.wait_for(lookup, timeout=deadline)
+            except asyncio.TimeoutError:
+                print(f"⏱️ {name} lookup missed its {deadline}s deadline, using partial fallback")
+            except Exception as e:
+                print(f"❌ {name} lookup failed: {e}")
+            return fallback()
+        
+        results = await asyncio.gather(
+            *(run_source(name, lookup, fallback) for name, (lookup, fallback) in sources.items())
+        )
+        return dict(zip(sources.keys(), results))
+    
     def _create_fallback_description(self, project_title: str, engineering_field: str, complexity_level: str) -> str:
         """Create a comprehensive fallback description"""
         return f"""
@@ -453,58 +884,16 @@ This project demonstrates skills and concepts directly applicable to:
         return framework_map.get(engineering_field, ["Python", "MATLAB", "Documentation Tools"])
 
     def _parse_llm_response(self, response_content: str) -> dict:
-        """Robust JSON parsing with multiple fallback attempts"""
-        try:
-            # Clean the response content
-            content = response_content.strip()
-            
-            # Remove markdown code blocks
-            if content.startswith('```json'):
-                content = content[7:]
-            elif content.startswith('```'):
-                content = content[3:]
-            
-            if content.endswith('```'):
-                content = content[:-3]
-            
-            # Try direct JSON parsing
-            return json.loads(content)
-            
-        except json.JSONDecodeError:
-            try:
-                # Try to extract JSON from text using regex
-                json_pattern = r'\{.*\}'
-                matches = re.findall(json_pattern, content, re.DOTALL)
-                if matches:
-                    # Try the largest match (most likely to be complete)
-                    largest_match = max(matches, key=len)
-                    return json.loads(largest_match)
-            except:
-                pass
-            
-            try:
-                # Try to fix common JSON issues
-                # Remove trailing commas
-                content = re.sub(r',(\s*[}\]])', r'\1', content)
-                # Fix unescaped quotes in strings
-                content = re.sub(r'(?<!\\)"(?![:,\]\}])', r'\\"', content)
-                return json.loads(content)
-            except:
-                pass
-        
-        # If all parsing fails, return None to trigger fallback
-        return None
+        """Parse LLM JSON in a single pass, tolerating code fences, prose and trailing commas"""
+        parser = IncrementalJSONParser()
+        parser.feed(response_content or "")
+        
+        # Empty result triggers the caller's fallback data
+        return parser.close() or None
 
     async def get_youtube_tutorials(self, project_title: str, project_context: Dict = None) -> List[str]:
         """Expert-level YouTube API integration with advanced filtering and project-specific search"""
         try:
-            # Create enhanced tool instance with advanced YouTube API capabilities
-            enhanced_youtube_tool = self._create_enhanced_youtube_tool()
-            if not enhanced_youtube_tool:
-                print("Enhanced YouTube tool creation failed")
-                engineering_field = project_context.get('engineering_field', '') if project_context else ''
-                return self._get_fallback_youtube_search_urls(project_title, engineering_field)
-            
             # Extract comprehensive project context
             engineering_field = project_context.get('engineering_field', '') if project_context else ''
             user_responses = project_context.get('user_responses', {}) if project_context else {}
@@ -518,27 +907,23 @@ This project demonstrates skills and concepts directly applicable to:
             
             print(f"🔍 Using {len(search_strategies)} expert search strategies for: {project_title}")
             
+            # All strategy searches run together and share one batched video-details lookup
+            results = await asyncio.to_thread(
+                self.tools.youtube_videos_batch, [strategy['query_template'] for strategy in search_strategies]
+            )
+            
             all_videos = []
             for strategy in search_strategies:
-                try:
-                    print(f"🚀 Executing search strategy: {strategy['name']}")
-                    
-                    # Execute advanced YouTube search with expert parameters
-                    videos = await self._execute_advanced_youtube_search(
-                        enhanced_youtube_tool, strategy, project_title, project_context
-                    )
-                    
-                    if videos:
-                        # Apply expert-level filtering and scoring
-                        filtered_videos = self._apply_expert_video_filtering(
-                            videos, project_title, project_context, strategy
-                        )
-                        all_videos.extend(filtered_videos)
-                        print(f"✅ Strategy '{strategy['name']}' found {len(filtered_videos)} relevant videos")
-                    
-                except Exception as e:
-                    print(f"❌ Error in search strategy '{strategy['name']}': {e}")
-                    continue
+                videos = [
+                    self._video_from_result(result, strategy, project_title)
+                    for result in results.get(strategy['query_template'], [])
+                ]
+                # Apply expert-level filtering and scoring
+                filtered_videos = self._apply_expert_video_filtering(
+                    videos, project_title, project_context, strategy
+                )
+                print(f"✅ Strategy '{strategy['name']}' found {len(filtered_videos)} relevant videos")
+                all_videos.extend(filtered_videos)
             
             if all_videos:
                 # Advanced video ranking and deduplication
@@ -553,20 +938,8 @@ This project demonstrates skills and concepts directly applicable to:
         except Exception as e:
             print(f"💥 Critical error in YouTube tutorial search: {e}")
         
-        # Enhanced fallback with project context
-        engineering_field = project_context.get('engineering_field', '') if project_context else ''
-        return self._get_enhanced_fallback_youtube_urls(project_title, project_context)
-    
-    def _create_enhanced_youtube_tool(self):
-        """Create enhanced YouTube tool with advanced API capabilities"""
-        try:
-            fresh_tools = ToolsMain()
-            fresh_tool_list = fresh_tools()
-            fresh_tool_map = {t.name: t for t in fresh_tool_list}
-            return fresh_tool_map.get("youtube_search")
-        except Exception as e:
-            print(f"Failed to create enhanced YouTube tool: {e}")
-            return None
+        # Enhanced fallback with project context (runs off the event loop so concurrent sources keep moving)
+        return await asyncio.to_thread(self._get_enhanced_fallback_youtube_urls, project_title, project_context)
     
     def _generate_expert_search_strategies(self, project_title: str, engineering_field: str, 
                                          user_responses: Dict, project_type: str, complexity_level: str) -> List[Dict]:
@@ -729,156 +1102,21 @@ This project demonstrates skills and concepts directly applicable to:
         
         return ['tutorial', 'guide', 'course']  # Default terms
     
-    async def _execute_advanced_youtube_search(self, youtube_tool, strategy: Dict, 
-                                             project_title: str, project_context: Dict) -> List[Dict]:
-        """Execute advanced YouTube search with expert parameters"""
-        try:
-            # Build advanced query with strategy parameters
-            query = strategy['query_template']
-            parameters = strategy.get('parameters', {})
-            
-            print(f"🔍 Advanced search query: {query}")
-            print(f"📊 Search parameters: {parameters}")
-            
-            # Execute search with enhanced error handling
-            result = await asyncio.to_thread(youtube_tool.invoke, {"query": query})
-            
-            if isinstance(result, str) and not result.startswith("Error") and "youtube.com" in result:
-                # Parse and structure video data
-                videos = self._parse_advanced_youtube_response(result, strategy, project_title)
-                return videos
-            else:
-                print(f"⚠️ No valid results from YouTube API: {result}")
-                return []
-                
-        except Exception as e:
-            print(f"❌ Advanced YouTube search failed: {e}")
-            return []
-    
-    def _parse_advanced_youtube_response(self, response: str, strategy: Dict, project_title: str) -> List[Dict]:
-        """Parse YouTube API response with advanced video data extraction"""
-        videos = []
-        
-        try:
-            # Extract video URLs with enhanced patterns
-            youtube_urls = self._extract_youtube_urls(response)
-            
-            # Parse video information from response text
-            lines = response.split('\n')
-            current_video = {}
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Extract title information
-                if 'Title:' in line or 'title:' in line.lower():
-                    title = line.split(':', 1)[1].strip() if ':' in line else line
-                    current_video['title'] = title
-                
-                # Extract duration information
-                elif 'Duration:' in line or 'duration:' in line.lower():
-                    duration = line.split(':', 1)[1].strip() if ':' in line else ''
-                    current_video['duration'] = self._parse_duration(duration)
-                
-                # Extract view count
-                elif 'Views:' in line or 'views:' in line.lower():
-                    views = line.split(':', 1)[1].strip() if ':' in line else ''
-                    current_video['views'] = self._parse_view_count(views)
-                
-                # Extract channel information
-                elif 'Channel:' in line or 'channel:' in line.lower():
-                    channel = line.split(':', 1)[1].strip() if ':' in line else ''
-                    current_video['channel'] = channel
-                
-                # Extract description
-                elif 'Description:' in line or 'description:' in line.lower():
-                    description = line.split(':', 1)[1].strip() if ':' in line else ''
-                    current_video['description'] = description
-                
-                # When we find a URL, complete the video entry
-                elif any(url in line for url in youtube_urls):
-                    for url in youtube_urls:
-                        if url in line:
-                            current_video['url'] = url
-                            current_video['strategy'] = strategy['name']
-                            
-                            # Calculate advanced relevance score
-                            current_video['relevance_score'] = self._calculate_advanced_relevance_score(
-                                current_video, project_title, strategy
-                            )
-                            
-                            videos.append(current_video.copy())
-                            current_video = {}
-                            break
-            
-            # Handle any remaining URLs without full metadata
-            for url in youtube_urls:
-                if not any(video['url'] == url for video in videos):
-                    videos.append({
-                        'url': url,
-                        'title': 'YouTube Video',
-                        'strategy': strategy['name'],
-                        'relevance_score': 50  # Default score
-                    })
-            
-        except Exception as e:
-            print(f"Error parsing advanced YouTube response: {e}")
-            # Fallback to basic URL extraction
-            youtube_urls = self._extract_youtube_urls(response)
-            for url in youtube_urls:
-                videos.append({
-                    'url': url,
-                    'title': 'YouTube Tutorial',
-                    'strategy': strategy['name'],
-                    'relevance_score': 40
-                })
-        
-        return videos
-    
-    def _parse_duration(self, duration_str: str) -> int:
-        """Parse video duration string to seconds"""
-        try:
-            if not duration_str:
-                return 0
-            
-            # Handle various duration formats
-            duration_str = duration_str.lower().replace('duration:', '').strip()
-            
-            if 'min' in duration_str:
-                parts = duration_str.split()
-                minutes = int(parts[0]) if parts and parts[0].isdigit() else 0
-                return minutes * 60
-            elif ':' in duration_str:
-                parts = duration_str.split(':')
-                if len(parts) == 2:
-                    minutes, seconds = parts
-                    return int(minutes) * 60 + int(seconds)
-                elif len(parts) == 3:
-                    hours, minutes, seconds = parts
-                    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-            
-            return 0
-        except:
-            return 0
-    
-    def _parse_view_count(self, views_str: str) -> int:
-        """Parse view count string to integer"""
-        try:
-            if not views_str:
-                return 0
-            
-            views_str = views_str.lower().replace('views:', '').replace(',', '').strip()
-            
-            if 'k' in views_str:
-                return int(float(views_str.replace('k', '')) * 1000)
-            elif 'm' in views_str:
-                return int(float(views_str.replace('m', '')) * 1000000)
-            elif views_str.isdigit():
-                return int(views_str)
-            
-            return 0
-        except:
-            return 0
+    def _video_from_result(self, result: Dict, strategy: Dict, project_title: str) -> Dict:
+        """Map a structured YouTube tool result onto the video record used for filtering and ranking"""
+        video = {
+            'url': result.get('video_url', ''),
+            'title': result.get('title', 'YouTube Video'),
+            'description': result.get('description', ''),
+            'channel': result.get('channel', ''),
+            'duration': result.get('duration_seconds', 0),
+            'views': result.get('view_count', 0),
+            'likes': result.get('like_count', 0),
+            'quality_score': result.get('quality_score', 0),
+            'strategy': strategy['name'],
+        }
+        video['relevance_score'] = self._calculate_advanced_relevance_score(video, project_title, strategy)
+        return video
     
     def _calculate_advanced_relevance_score(self, video: Dict, project_title: str, strategy: Dict) -> int:
         """Calculate advanced relevance score with multiple factors"""
@@ -1029,17 +1267,11 @@ This project demonstrates skills and concepts directly applicable to:
         
         # Try to get direct video links using a simpler approach
         try:
-            youtube_tool = self._create_enhanced_youtube_tool()
-            if youtube_tool:
-                # Simple search for direct links
-                simple_query = f"{project_title} tutorial"
-                result = youtube_tool.invoke({"query": simple_query})
-                
-                # Extract direct video URLs from the result
-                if isinstance(result, str) and "youtube.com/watch" in result:
-                    urls = self._extract_youtube_urls(result)
-                    if urls:
-                        return urls[:4]  # Return up to 4 direct video links
+            # Simple search for direct links
+            videos = self.tools.youtube_videos(f"{project_title} tutorial")
+            urls = [video['video_url'] for video in videos if video.get('video_url')]
+            if urls:
+                return urls[:4]  # Return up to 4 direct video links
                         
         except Exception as e:
             print(f"Failed to get direct video links: {e}")
@@ -1060,59 +1292,6 @@ This project demonstrates skills and concepts directly applicable to:
         
         return fallback_urls[:4]
 
-    def _is_quality_tutorial_video(self, url: str, title: str, project_title: str) -> bool:
-        """Enhanced filtering for quality tutorial videos"""
-        if not url or not url.startswith('http'):
-            return False
-            
-        title_lower = title.lower()
-        
-        # Exclude shorts and low-quality content
-        exclusion_terms = ['shorts', '#shorts', 'meme', 'funny', 'react', 'tiktok', 'quick tip']
-        if any(term in title_lower for term in exclusion_terms):
-            return False
-            
-        # Prefer tutorial content
-        tutorial_indicators = ['tutorial', 'how to', 'guide', 'build', 'create', 'make', 'step by step', 
-                             'complete', 'full', 'beginner', 'learn', 'course', 'project']
-        tutorial_score = sum(1 for indicator in tutorial_indicators if indicator in title_lower)
-        
-        # Check project relevance
-        project_words = project_title.lower().split()
-        relevance_score = sum(1 for word in project_words if word in title_lower)
-        
-        return tutorial_score >= 1 or relevance_score >= len(project_words) * 0.6
-    
-    def _calculate_video_relevance_score(self, title: str, project_title: str, engineering_field: str) -> int:
-        """Calculate relevance score for video ranking"""
-        score = 0
-        title_lower = title.lower()
-        
-        # High-value tutorial indicators
-        premium_terms = ['complete tutorial', 'full course', 'step by step', 'comprehensive guide', 
-                        'from scratch', 'beginner to advanced']
-        for term in premium_terms:
-            if term in title_lower:
-                score += 15
-                
-        # Standard tutorial terms
-        tutorial_terms = ['tutorial', 'how to', 'guide', 'build', 'create', 'learn']
-        score += sum(5 for term in tutorial_terms if term in title_lower)
-        
-        # Project title relevance
-        project_words = project_title.lower().split()
-        score += sum(10 for word in project_words if word in title_lower)
-        
-        # Engineering field relevance
-        if engineering_field and any(word in title_lower for word in engineering_field.lower().split()):
-            score += 8
-            
-        # Quality indicators
-        quality_terms = ['professional', 'expert', 'advanced', 'industry', 'best practices']
-        score += sum(3 for term in quality_terms if term in title_lower)
-        
-        return score
-    
     def _extract_project_keywords(self, project_title: str, engineering_field: str) -> List[str]:
         """Extract relevant keywords from project title and field for better searches"""
         keywords = []
@@ -1158,70 +1337,6 @@ This project demonstrates skills and concepts directly applicable to:
         
         return list(set(keywords))[:10]  # Return unique keywords, max 10
     
-    def _extract_youtube_urls(self, result_text: str) -> List[str]:
-        """Extract YouTube URLs using multiple patterns"""
-        urls = []
-        
-        # Pattern 1: Standard YouTube watch URLs
-        pattern1 = r'https://www\.youtube\.com/watch\?v=[a-zA-Z0-9_-]{11}'
-        urls.extend(re.findall(pattern1, result_text))
-        
-        # Pattern 2: YouTube URLs with additional parameters
-        pattern2 = r'https://www\.youtube\.com/watch\?v=[a-zA-Z0-9_-]+[^\s]*'
-        additional_urls = re.findall(pattern2, result_text)
-        for url in additional_urls:
-            # Clean URL by removing extra characters
-            clean_url = url.split('&')[0] if '&' in url else url
-            if clean_url not in urls:
-                urls.append(clean_url)
-        
-        # Pattern 3: Extract from formatted lines
-        lines = result_text.split('\n')
-        for line in lines:
-            if 'youtube.com/watch' in line:
-                # Extract URL from the line
-                url_match = re.search(r'https://www\.youtube\.com/watch\?v=[a-zA-Z0-9_-]+', line)
-                if url_match and url_match.group() not in urls:
-                    urls.append(url_match.group())
-        
-        return list(set(urls))  # Remove duplicates
-    
-    def _parse_youtube_response(self, result_text: str, urls: List[str], project_title: str, engineering_field: str) -> List[Dict]:
-        """Parse YouTube tool response to extract video details"""
-        videos = []
-        lines = result_text.split('\n')
-        
-        for url in urls:
-            title = "Tutorial Video"
-            description = ""
-            
-            # Find the line containing this URL
-            for i, line in enumerate(lines):
-                if url in line:
-                    # Look backwards for title (usually in format "- Title by Channel")
-                    for j in range(max(0, i-3), i):
-                        if lines[j].startswith('- ') and 'by' in lines[j]:
-                            title = lines[j][2:].split(' by ')[0].strip()
-                            break
-                    
-                    # Look forward for description
-                    if i + 1 < len(lines) and not lines[i + 1].startswith(('- ', 'http')):
-                        description = lines[i + 1].strip()
-                    
-                    break
-            
-            # Quality filtering
-            if self._is_quality_tutorial_video(url, title, project_title):
-                score = self._calculate_video_relevance_score(title, project_title, engineering_field)
-                videos.append({
-                    'url': url,
-                    'title': title,
-                    'description': description,
-                    'score': score
-                })
-        
-        return videos
-    
     def _get_fallback_youtube_search_urls(self, project_title: str, engineering_field: str) -> List[str]:
         """Generate fallback YouTube search URLs"""
         base_url = "https://www.youtube.com/results?search_query="
@@ -1237,15 +1352,6 @@ This project demonstrates skills and concepts directly applicable to:
     async def get_github_repos(self, project_title: str, engineering_field: str = "") -> List[str]:
         """Get relevant GitHub repository links with enhanced project-specific filtering"""
         try:
-            # Create fresh tool instance to avoid any potential caching
-            fresh_tools = ToolsMain()
-            fresh_tool_list = fresh_tools()
-            fresh_tool_map = {t.name: t for t in fresh_tool_list}
-            github_tool = fresh_tool_map.get("github_search")
-            if not github_tool:
-                print("GitHub tool not found in tool_map")
-                return self._get_fallback_github_search_urls(project_title, engineering_field)
-            
             # Create highly specific search queries based on project context
             project_keywords = self._extract_project_keywords(project_title, engineering_field)
             
@@ -1271,24 +1377,20 @@ This project demonstrates skills and concepts directly applicable to:
             print(f"Searching GitHub with enhanced queries: {enhanced_queries}")
             
             all_repos = []
+            rate_limited = False
             for query in enhanced_queries:  # Use enhanced queries
                 try:
-                    print(f"Calling GitHub tool with query: {query}")
-                    result = await asyncio.to_thread(github_tool.invoke, {"query": query})
-                    print(f"GitHub tool result type: {type(result)}")
-                    print(f"GitHub tool result length: {len(str(result)) if result else 0}")
-                    print(f"GitHub tool result preview: {str(result)[:300]}...")
-                    print(f"GitHub API call completed for project: {project_title}")
-                    
-                    if isinstance(result, str) and not result.startswith("Error") and "github.com" in result:
-                        # Enhanced URL extraction and parsing
-                        github_repos = self._parse_github_response(result, project_title, engineering_field)
-                        all_repos.extend(github_repos)
-                        print(f"Extracted {len(github_repos)} GitHub repositories")
-                        
-                    else:
-                        print(f"GitHub tool returned error or no results: {result}")
+                    print(f"Calling GitHub search with query: {query}")
+                    results = await asyncio.to_thread(self.tools.github_repositories, query)
+                    github_repos = self._score_github_repos(results, project_title, engineering_field)
+                    all_repos.extend(github_repos)
+                    print(f"Found {len(github_repos)} relevant of {len(results)} GitHub repositories")
                         
+                except GitHubRateLimited as e:
+                    # Fail fast: later queries would only queue for the same exhausted window
+                    print(f"⏳ {e}; skipping the remaining GitHub searches")
+                    rate_limited = True
+                    break
                 except Exception as e:
                     print(f"Error processing GitHub query '{query}': {e}")
                     continue
@@ -1311,95 +1413,33 @@ This project demonstrates skills and concepts directly applicable to:
                     return unique_repos
             
             print("No valid GitHub repositories found, returning fallback URLs")
+            if rate_limited:
+                # The fallback would search GitHub again; offline search links are all we can offer
+                return self._build_github_search_urls(project_title, engineering_field)
                 
         except Exception as e:
             print(f"Error fetching GitHub repositories: {e}")
         
         # Return fallback search URLs
-        return self._get_fallback_github_search_urls(project_title, engineering_field)
+        return await asyncio.to_thread(self._get_fallback_github_search_urls, project_title, engineering_field)
     
-    def _parse_github_response(self, result_text: str, project_title: str, engineering_field: str) -> List[Dict]:
-        """Parse GitHub tool response to extract repository details"""
-        repos = []
-        
-        # Extract GitHub URLs first
-        github_urls = self._extract_github_urls(result_text)
-        
-        # Split into sections (repositories are usually separated by double newlines)
-        sections = result_text.split('\n\n')
-        
-        for section in sections:
-            if 'github.com' not in section:
+    def _score_github_repos(self, repos: List[Dict], project_title: str, engineering_field: str) -> List[Dict]:
+        """Keep relevant repositories from the structured GitHub results and score them for ranking"""
+        scored = []
+        for repo in repos:
+            repo_url, description, stars = repo.get('url', ''), repo.get('description', ''), repo.get('stars', 0)
+            if not self._is_quality_repository(repo_url, description, project_title):
                 continue
-                
-            lines = [line.strip() for line in section.split('\n') if line.strip()]
-            
-            repo_url = None
-            repo_name = "Repository"
-            description = ""
-            stars = 0
-            
-            for line in lines:
-                # Extract repository URL
-                if 'github.com' in line and line.startswith('http'):
-                    repo_url = line.strip()
-                # Extract repository name and stars (format: "- owner/repo ⭐ (123 stars)")
-                elif line.startswith('- ') and '⭐' in line:
-                    parts = line[2:].split(' ⭐')
-                    if parts:
-                        repo_name = parts[0].strip()
-                        # Extract star count if available
-                        if len(parts) > 1 and 'stars' in parts[1]:
-                            star_match = re.search(r'\((\d+)\s*stars?\)', parts[1])
-                            if star_match:
-                                stars = int(star_match.group(1))
-                # Extract description (usually the longest non-URL, non-title line)
-                elif (not line.startswith(('http', '- ')) and 
-                      len(line) > 20 and 
-                      not line.isdigit() and
-                      '⭐' not in line):
-                    if len(line) > len(description):  # Take the longest description
-                        description = line
-            
-            # Validate and score the repository
-            if repo_url and self._is_quality_repository(repo_url, description, project_title):
-                score = self._calculate_repo_relevance_score(repo_url, description, project_title, engineering_field)
-                # Boost score based on stars
-                if stars > 100:
-                    score += 5
-                elif stars > 50:
-                    score += 3
-                elif stars > 10:
-                    score += 1
-                
-                repos.append({
-                    'url': repo_url,
-                    'name': repo_name,
-                    'description': description,
-                    'stars': stars,
-                    'score': score
-                })
-        
-        return repos
-    
-    def _extract_github_urls(self, result_text: str) -> List[str]:
-        """Extract GitHub repository URLs using multiple patterns"""
-        urls = []
-        
-        # Pattern 1: Standard GitHub repository URLs
-        pattern1 = r'https://github\.com/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+'
-        urls.extend(re.findall(pattern1, result_text))
-        
-        # Pattern 2: Extract from formatted lines
-        lines = result_text.split('\n')
-        for line in lines:
-            if 'github.com' in line and line.strip().startswith('http'):
-                # Clean URL by removing trailing punctuation
-                url = line.strip().rstrip('.,;')
-                if url not in urls:
-                    urls.append(url)
-        
-        return list(set(urls))  # Remove duplicates
+            score = self._calculate_repo_relevance_score(repo_url, description, project_title, engineering_field)
+            # Boost score based on stars
+            if stars > 100:
+                score += 5
+            elif stars > 50:
+                score += 3
+            elif stars > 10:
+                score += 1
+            scored.append({**repo, 'score': score})
+        return scored
 
     def _is_quality_repository(self, url: str, description: str, project_title: str) -> bool:
         """Check if repository is relevant and high-quality"""
@@ -1480,28 +1520,22 @@ This project demonstrates skills and concepts directly applicable to:
         
         # Try to get direct repository links using the GitHub tool
         try:
-            fresh_tools = ToolsMain()
-            fresh_tool_list = fresh_tools()
-            fresh_tool_map = {t.name: t for t in fresh_tool_list}
-            github_tool = fresh_tool_map.get("github_search")
-            
-            if github_tool:
-                # Simple search for direct repo links
-                simple_query = f"{project_title} {engineering_field} project"
-                result = github_tool.invoke({"query": simple_query})
-                
-                # Extract direct repository URLs from the result
-                if isinstance(result, str) and "github.com/" in result:
-                    urls = self._extract_github_urls(result)
-                    if urls:
-                        print(f"✅ Found {len(urls)} direct GitHub repository links")
-                        return urls[:6]  # Return up to 6 direct repo links
+            # Simple search for direct repo links
+            repos = self.tools.github_repositories(f"{project_title} {engineering_field} project")
+            urls = [repo['url'] for repo in repos if repo.get('url')]
+            if urls:
+                print(f"✅ Found {len(urls)} direct GitHub repository links")
+                return urls[:6]  # Return up to 6 direct repo links
                         
         except Exception as e:
             print(f"⚠️ Failed to get direct repo links: {e}")
         
         # Fallback to search URLs only if direct links fail
         print("⚠️ Using GitHub search URLs as fallback")
+        return self._build_github_search_urls(project_title, engineering_field)
+    
+    def _build_github_search_urls(self, project_title: str, engineering_field: str) -> List[str]:
+        """Build GitHub search URLs without any network calls"""
         base_url = "https://github.com/search?q="
         search_terms = [
             f"{project_title.replace(' ', '+')}+project+implementation",
@@ -1513,6 +1547,38 @@ This project demonstrates skills and concepts directly applicable to:
         ]
         return [base_url + term + "&type=repositories" for term in search_terms]
 
+    def get_excel_guide(self, project_details: ProjectDetails, user_name: str = "Builder",
+                        build: bool = True) -> bytes:
+        """Excel guide bytes from the content-addressed export cache; with build=False only a cached copy is returned"""
+        content = [asdict(project_details), user_name]
+        if not build:
+            return self.export_cache.get("excel", content)
+        return self.export_cache.get_or_build(
+            "excel", content, lambda: self.generate_excel_guide(project_details, user_name)
+        )
+
+    def get_pdf_guide(self, project_details: ProjectDetails, user_name: str = "Builder",
+                      build: bool = True) -> bytes:
+        """PDF guide bytes from the export cache; with build=False only a cached copy is returned"""
+        content = [asdict(project_details), user_name]
+        if not build:
+            return self.export_cache.get("pdf", content)
+        return self.export_cache.get_or_build(
+            "pdf", content, lambda: self.generate_pdf_guide(project_details, user_name)
+        )
+
+    def stream_pdf_guide(self, project_details: ProjectDetails, user_name: str = "Builder", output=None):
+        """Lay out the PDF guide into output (default: BytesIO) and return it rewound when seekable"""
+        return write_pdf_guide(project_details, user_name, output)
+
+    def generate_pdf_guide(self, project_details: ProjectDetails, user_name: str = "Builder") -> bytes:
+        """Generate a PDF project guide with the same sections as the Excel guide"""
+        try:
+            return pdf_guide_bytes(project_details, user_name)
+        except Exception as e:
+            print(f"❌ PDF generation error: {e}")
+            return None
+
     def generate_excel_guide(self, project_details: ProjectDetails, user_name: str = "Builder") -> bytes:
         """Generate a professional Excel project guide with enhanced formatting and tables"""
         try:
@@ -1522,54 +1588,29 @@ This project demonstrates skills and concepts directly applicable to:
             # Remove default sheet and create named sheets
             wb.remove(wb.active)
             
-            # Define professional color scheme
-            primary_color = "1E40AF"  # Blue
-            secondary_color = "F8FAFC"  # Light gray
-            accent_color = "10B981"  # Green
-            text_color = "374151"  # Dark gray
-            
-            # Define common styles
-            header_font = Font(name="Calibri", size=16, bold=True, color=primary_color)
-            subheader_font = Font(name="Calibri", size=14, bold=True, color=text_color)
-            title_font = Font(name="Calibri", size=20, bold=True, color=primary_color)
-            body_font = Font(name="Calibri", size=11, color=text_color)
-            link_font = Font(name="Calibri", size=11, color="2563EB", underline="single")
-            
-            header_fill = PatternFill(start_color=primary_color, end_color=primary_color, fill_type="solid")
-            alt_fill = PatternFill(start_color=secondary_color, end_color=secondary_color, fill_type="solid")
-            accent_fill = PatternFill(start_color=accent_color, end_color=accent_color, fill_type="solid")
-            
-            center_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-            left_alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-            
-            thin_border = Border(
-                left=Side(style="thin"), right=Side(style="thin"),
-                top=Side(style="thin"), bottom=Side(style="thin")
-            )
-            
             # Create Overview Sheet
             overview_ws = wb.create_sheet("📋 Project Overview")
-            self._create_overview_sheet(overview_ws, project_details, user_name, title_font, header_font, body_font, center_alignment, left_alignment)
+            self._create_overview_sheet(overview_ws, project_details, user_name)
             
             # Create Implementation Guide Sheet
             guide_ws = wb.create_sheet("📖 Implementation Guide")
-            self._create_implementation_sheet(guide_ws, project_details, header_font, subheader_font, body_font, left_alignment)
+            self._create_implementation_sheet(guide_ws, project_details)
             
             # Create Components Sheet
             components_ws = wb.create_sheet("🔧 Components")
-            self._create_components_sheet(components_ws, project_details, header_font, body_font, header_fill, alt_fill, center_alignment, left_alignment, thin_border)
+            self._create_components_sheet(components_ws, project_details)
             
             # Create Frameworks & Tools Sheet
             frameworks_ws = wb.create_sheet("🛠️ Tools & Frameworks")
-            self._create_frameworks_sheet(frameworks_ws, project_details, header_font, body_font, header_fill, alt_fill, center_alignment, left_alignment, thin_border)
+            self._create_frameworks_sheet(frameworks_ws, project_details)
             
             # Create Resources Sheet
             resources_ws = wb.create_sheet("📚 Learning Resources")
-            self._create_resources_sheet(resources_ws, project_details, header_font, subheader_font, body_font, link_font, header_fill, alt_fill, center_alignment, left_alignment, thin_border)
+            self._create_resources_sheet(resources_ws, project_details)
             
             # Create Action Plan Sheet
             action_ws = wb.create_sheet("🎯 Action Plan")
-            self._create_action_plan_sheet(action_ws, project_details, header_font, body_font, accent_fill, left_alignment, thin_border)
+            self._create_action_plan_sheet(action_ws, project_details)
             
             # Set Overview as active sheet
             wb.active = overview_ws
@@ -1587,539 +1628,199 @@ This project demonstrates skills and concepts directly applicable to:
             traceback.print_exc()
             return None
     
-    def _create_overview_sheet(self, ws, project_details, user_name, title_font, header_font, body_font, center_alignment, left_alignment):
+    def _create_overview_sheet(self, ws, project_details, user_name):
         """Create the project overview sheet"""
-        
-        # Title section
-        ws.merge_cells("A1:F3")
-        ws["A1"] = "🚀 ProjectCraft AI - Project Guide"
-        ws["A1"].font = title_font
-        ws["A1"].alignment = center_alignment
-        
-        # Project title
-        ws.merge_cells("A5:F6")
-        ws["A5"] = project_details.title
-        ws["A5"].font = Font(name="Calibri", size=18, bold=True, color="1E40AF")
-        ws["A5"].alignment = center_alignment
-        
-        # Project info table
-        current_time = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-        
-        info_data = [
-            ["Project Information", "Details"],
-            ["Personal Guide for:", user_name],
-            ["Difficulty Level:", project_details.difficulty_level],
-            ["Estimated Timeline:", project_details.estimated_time],
-            ["Generated on:", current_time]
-        ]
-        
-        start_row = 8
-        for i, (label, value) in enumerate(info_data):
-            ws[f"B{start_row + i}"] = label
-            ws[f"D{start_row + i}"] = value
-            
-            if i == 0:  # Header row
-                ws[f"B{start_row + i}"].font = header_font
-                ws[f"D{start_row + i}"].font = header_font
-                ws[f"B{start_row + i}"].fill = PatternFill(start_color="1E40AF", end_color="1E40AF", fill_type="solid")
-                ws[f"D{start_row + i}"].fill = PatternFill(start_color="1E40AF", end_color="1E40AF", fill_type="solid")
-                ws[f"B{start_row + i}"].font = Font(name="Calibri", size=12, bold=True, color="FFFFFF")
-                ws[f"D{start_row + i}"].font = Font(name="Calibri", size=12, bold=True, color="FFFFFF")
-            else:
-                ws[f"B{start_row + i}"].font = Font(name="Calibri", size=11, bold=True)
-                ws[f"D{start_row + i}"].font = body_font
-        
-        # Project description
-        ws[f"B{start_row + 6}"] = "Project Description:"
-        ws[f"B{start_row + 6}"].font = Font(name="Calibri", size=12, bold=True, color="1E40AF")
-        
-        ws.merge_cells(f"B{start_row + 7}:F{start_row + 10}")
-        ws[f"B{start_row + 7}"] = project_details.short_description
-        ws[f"B{start_row + 7}"].font = body_font
-        ws[f"B{start_row + 7}"].alignment = left_alignment
-        
-        # Quick stats
-        ws[f"B{start_row + 12}"] = "Quick Project Stats:"
-        ws[f"B{start_row + 12}"].font = Font(name="Calibri", size=12, bold=True, color="1E40AF")
-        
-        components_count = len(project_details.components) if project_details.components else 0
-        frameworks_count = len(project_details.frameworks) if project_details.frameworks else 0
-        youtube_count = len([link for link in project_details.youtube_links if link.strip()]) if project_details.youtube_links else 0
-        github_count = len([repo for repo in project_details.github_repos if repo.strip()]) if project_details.github_repos else 0
-        
-        stats_data = [
-            ["📦 Components Required:", str(components_count)],
-            ["🛠️ Tools & Frameworks:", str(frameworks_count)],
-            ["🎥 Video Tutorials:", str(youtube_count)],
-            ["💻 GitHub Repositories:", str(github_count)]
-        ]
-        
-        for i, (label, value) in enumerate(stats_data):
-            ws[f"B{start_row + 14 + i}"] = label
-            ws[f"D{start_row + 14 + i}"] = value
-            ws[f"B{start_row + 14 + i}"].font = body_font
-            ws[f"D{start_row + 14 + i}"].font = Font(name="Calibri", size=11, bold=True, color="10B981")
-        
-        # Set column widths
-        ws.column_dimensions["A"].width = 5
-        ws.column_dimensions["B"].width = 25
-        ws.column_dimensions["C"].width = 5
-        ws.column_dimensions["D"].width = 30
-        ws.column_dimensions["E"].width = 5
-        ws.column_dimensions["F"].width = 20
-        
-        # Set row heights
-        for row in range(1, 25):
-            ws.row_dimensions[row].height = 20
-        
-        ws.row_dimensions[7].height = 80  # Description row
+        self.excel_styles.write_sheet(ws, overview_sheet(project_details, user_name))
     
-    def _create_implementation_sheet(self, ws, project_details, header_font, subheader_font, body_font, left_alignment):
+    def _create_implementation_sheet(self, ws, project_details):
         """Create the implementation guide sheet"""
-        
-        # Title
-        ws.merge_cells("A1:E2")
-        ws["A1"] = "📖 Detailed Implementation Guide"
-        ws["A1"].font = header_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Process detailed description
-        if project_details.detailed_description:
-            lines = project_details.detailed_description.split('\n')
-            current_row = 4
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    current_row += 1
-                    continue
-                    
-                if line.startswith('## '):
-                    # Sub-heading
-                    clean_line = line.replace('## ', '').strip()
-                    ws.merge_cells(f"A{current_row}:E{current_row}")
-                    ws[f"A{current_row}"] = clean_line
-                    ws[f"A{current_row}"].font = subheader_font
-                    ws[f"A{current_row}"].fill = PatternFill(start_color="F8FAFC", end_color="F8FAFC", fill_type="solid")
-                    current_row += 1
-                elif line.startswith('# '):
-                    # Main heading
-                    clean_line = line.replace('# ', '').strip()
-                    ws.merge_cells(f"A{current_row}:E{current_row}")
-                    ws[f"A{current_row}"] = clean_line
-                    ws[f"A{current_row}"].font = Font(name="Calibri", size=14, bold=True, color="1E40AF")
-                    ws[f"A{current_row}"].fill = PatternFill(start_color="E0F2FE", end_color="E0F2FE", fill_type="solid")
-                    current_row += 1
-                elif line.startswith(('- ', '• ', '* ')):
-                    # Bullet point
-                    clean_line = line[2:].strip()
-                    ws[f"B{current_row}"] = f"• {clean_line}"
-                    ws[f"B{current_row}"].font = body_font
-                    ws[f"B{current_row}"].alignment = left_alignment
-                    current_row += 1
-                elif line.startswith(tuple(f"{i}." for i in range(1, 10))):
-                    # Numbered list
-                    ws[f"B{current_row}"] = line
-                    ws[f"B{current_row}"].font = body_font
-                    ws[f"B{current_row}"].alignment = left_alignment
-                    current_row += 1
-                else:
-                    # Normal paragraph
-                    if len(line) > 10:
-                        ws.merge_cells(f"A{current_row}:E{current_row}")
-                        ws[f"A{current_row}"] = line
-                        ws[f"A{current_row}"].font = body_font
-                        ws[f"A{current_row}"].alignment = left_alignment
-                        current_row += 1
-        else:
-            # Fallback content
-            ws.merge_cells("A4:E6")
-            ws["A4"] = "Detailed implementation steps will be provided based on your specific project requirements and chosen technologies."
-            ws["A4"].font = body_font
-            ws["A4"].alignment = left_alignment
-        
-        # Set column widths
-        ws.column_dimensions["A"].width = 40
-        ws.column_dimensions["B"].width = 40
-        ws.column_dimensions["C"].width = 20
-        ws.column_dimensions["D"].width = 20
-        ws.column_dimensions["E"].width = 20
+        self.excel_styles.write_sheet(ws, implementation_sheet(project_details))
     
-    def _create_components_sheet(self, ws, project_details, header_font, body_font, header_fill, alt_fill, center_alignment, left_alignment, thin_border):
+    def _create_components_sheet(self, ws, project_details):
         """Create the components sheet"""
-        
-        # Title
-        ws.merge_cells("A1:D2")
-        ws["A1"] = "🔧 Required Components & Specifications"
-        ws["A1"].font = header_font
-        ws["A1"].alignment = center_alignment
-        
-        # Headers
-        headers = ["Component Name", "Purpose", "Specifications", "Notes"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(4, col, header)
-            cell.font = Font(name="Calibri", size=12, bold=True, color="FFFFFF")
-            cell.fill = header_fill
-            cell.alignment = center_alignment
-            cell.border = thin_border
-        
-        # Data rows
-        if project_details.components and len(project_details.components) > 0:
-            for row, comp in enumerate(project_details.components, 5):
-                name = comp.get('name', 'Component')
-                purpose = comp.get('purpose', 'Project component')
-                specs = comp.get('specs', 'As per requirements')
-                notes = "Research suppliers for best prices"
-                
-                data = [name, purpose, specs, notes]
-                for col, value in enumerate(data, 1):
-                    cell = ws.cell(row, col, value)
-                    cell.font = body_font
-                    cell.alignment = left_alignment
-                    cell.border = thin_border
-                    
-                    if row % 2 == 0:
-                        cell.fill = alt_fill
-        else:
-            # Fallback message
-            ws.merge_cells("A5:D7")
-            ws["A5"] = ("Components will be determined based on your specific project requirements. "
-                       "Research the necessary hardware/software components for your implementation.")
-            ws["A5"].font = body_font
-            ws["A5"].alignment = left_alignment
-        
-        # Set column widths
-        ws.column_dimensions["A"].width = 25
-        ws.column_dimensions["B"].width = 35
-        ws.column_dimensions["C"].width = 30
-        ws.column_dimensions["D"].width = 25
+        self.excel_styles.write_sheet(ws, components_sheet(project_details))
     
-    def _create_frameworks_sheet(self, ws, project_details, header_font, body_font, header_fill, alt_fill, center_alignment, left_alignment, thin_border):
+    def _create_frameworks_sheet(self, ws, project_details):
         """Create the frameworks and tools sheet"""
-        
-        # Title
-        ws.merge_cells("A1:C2")
-        ws["A1"] = "🛠️ Recommended Tools & Frameworks"
-        ws["A1"].font = header_font
-        ws["A1"].alignment = center_alignment
-        
-        # Headers
-        headers = ["Tool/Framework", "Category", "Purpose"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(4, col, header)
-            cell.font = Font(name="Calibri", size=12, bold=True, color="FFFFFF")
-            cell.fill = header_fill
-            cell.alignment = center_alignment
-            cell.border = thin_border
-        
-        # Data rows
-        if project_details.frameworks and len(project_details.frameworks) > 0:
-            for row, framework in enumerate(project_details.frameworks, 5):
-                # Categorize frameworks
-                framework_lower = framework.lower()
-                if any(term in framework_lower for term in ['python', 'javascript', 'react', 'node']):
-                    category = "Programming"
-                elif any(term in framework_lower for term in ['arduino', 'iot', 'sensor']):
-                    category = "Hardware/IoT"
-                elif any(term in framework_lower for term in ['database', 'sql', 'mongodb']):
-                    category = "Database"
-                elif any(term in framework_lower for term in ['design', 'cad', 'modeling']):
-                    category = "Design/Modeling"
-                else:
-                    category = "Development Tool"
-                
-                purpose = f"Essential for {category.lower()} aspects of the project"
-                
-                data = [framework, category, purpose]
-                for col, value in enumerate(data, 1):
-                    cell = ws.cell(row, col, value)
-                    cell.font = body_font
-                    cell.alignment = left_alignment
-                    cell.border = thin_border
-                    
-                    if row % 2 == 0:
-                        cell.fill = alt_fill
-        else:
-            # Fallback message
-            ws.merge_cells("A5:C7")
-            ws["A5"] = ("Recommended tools and frameworks will depend on your specific project requirements. "
-                       "Consider popular development environments and libraries in your chosen field.")
-            ws["A5"].font = body_font
-            ws["A5"].alignment = left_alignment
-        
-        # Set column widths
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 20
-        ws.column_dimensions["C"].width = 40
+        self.excel_styles.write_sheet(ws, frameworks_sheet(project_details))
     
-    def _create_resources_sheet(self, ws, project_details, header_font, subheader_font, body_font, link_font, header_fill, alt_fill, center_alignment, left_alignment, thin_border):
+    def _create_resources_sheet(self, ws, project_details):
         """Create the learning resources sheet"""
-        
-        # Title
-        ws.merge_cells("A1:D2")
-        ws["A1"] = "📚 Learning Resources & References"
-        ws["A1"].font = header_font
-        ws["A1"].alignment = center_alignment
-        
-        current_row = 4
-        
-        # YouTube Tutorials Section
-        ws.merge_cells(f"A{current_row}:D{current_row}")
-        ws[f"A{current_row}"] = "🎥 Video Tutorials"
-        ws[f"A{current_row}"].font = subheader_font
-        ws[f"A{current_row}"].fill = PatternFill(start_color="FEE2E2", end_color="FEE2E2", fill_type="solid")
-        current_row += 2
-        
-        # YouTube headers
-        youtube_headers = ["#", "Tutorial Title/Search Term", "Link", "Type"]
-        for col, header in enumerate(youtube_headers, 1):
-            cell = ws.cell(current_row, col, header)
-            cell.font = Font(name="Calibri", size=11, bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="DC2626", end_color="DC2626", fill_type="solid")
-            cell.alignment = center_alignment
-            cell.border = thin_border
-        
-        current_row += 1
-        
-        if project_details.youtube_links and any(link.strip() for link in project_details.youtube_links if link):
-            video_count = 0
-            for link in project_details.youtube_links:
-                if link and link.strip():
-                    video_count += 1
-                    if link.startswith('http'):
-                        title = f"Direct Tutorial Link {video_count}"
-                        link_text = link.strip()
-                        link_type = "Direct Link"
-                    else:
-                        title = link.strip()
-                        link_text = f"Search YouTube for: {link.strip()}"
-                        link_type = "Search Term"
-                    
-                    data = [str(video_count), title, link_text, link_type]
-                    for col, value in enumerate(data, 1):
-                        cell = ws.cell(current_row, col, value)
-                        if col == 3 and link.startswith('http'):  # Link column
-                            cell.font = link_font
-                        else:
-                            cell.font = body_font
-                        cell.alignment = left_alignment
-                        cell.border = thin_border
-                        
-                        if current_row % 2 == 0:
-                            cell.fill = alt_fill
-                    
-                    current_row += 1
-        else:
-            ws.merge_cells(f"A{current_row}:D{current_row}")
-            ws[f"A{current_row}"] = "Search YouTube for tutorials related to your project components and implementation steps."
-            ws[f"A{current_row}"].font = body_font
-            ws[f"A{current_row}"].alignment = left_alignment
-            current_row += 1
-        
-        current_row += 2
-        
-        # GitHub Repositories Section  
-        ws.merge_cells(f"A{current_row}:D{current_row}")
-        ws[f"A{current_row}"] = "💻 Code Repositories"
-        ws[f"A{current_row}"].font = subheader_font
-        ws[f"A{current_row}"].fill = PatternFill(start_color="E0F2FE", end_color="E0F2FE", fill_type="solid")
-        current_row += 2
-        
-        # GitHub headers
-        github_headers = ["#", "Repository Name/Search Term", "Link", "Type"]
-        for col, header in enumerate(github_headers, 1):
-            cell = ws.cell(current_row, col, header)
-            cell.font = Font(name="Calibri", size=11, bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="0369A1", end_color="0369A1", fill_type="solid")
-            cell.alignment = center_alignment
-            cell.border = thin_border
-        
-        current_row += 1
-        
-        if project_details.github_repos and any(repo.strip() for repo in project_details.github_repos if repo):
-            repo_count = 0
-            for repo in project_details.github_repos:
-                if repo and repo.strip():
-                    repo_count += 1
-                    if repo.startswith('http'):
-                        repo_name = repo.split('/')[-1] if '/' in repo else f"Repository {repo_count}"
-                        link_text = repo.strip()
-                        repo_type = "Direct Link"
-                    else:
-                        repo_name = repo.strip()
-                        link_text = f"Search GitHub for: {repo.strip()}"
-                        repo_type = "Search Term"
-                    
-                    data = [str(repo_count), repo_name, link_text, repo_type]
-                    for col, value in enumerate(data, 1):
-                        cell = ws.cell(current_row, col, value)
-                        if col == 3 and repo.startswith('http'):  # Link column
-                            cell.font = link_font
-                        else:
-                            cell.font = body_font
-                        cell.alignment = left_alignment
-                        cell.border = thin_border
-                        
-                        if current_row % 2 == 0:
-                            cell.fill = alt_fill
-                    
-                    current_row += 1
-        else:
-            ws.merge_cells(f"A{current_row}:D{current_row}")
-            ws[f"A{current_row}"] = "Search GitHub for open-source projects and code examples related to your project."
-            ws[f"A{current_row}"].font = body_font
-            ws[f"A{current_row}"].alignment = left_alignment
-        
-        # Set column widths
-        ws.column_dimensions["A"].width = 8
-        ws.column_dimensions["B"].width = 40
-        ws.column_dimensions["C"].width = 50
-        ws.column_dimensions["D"].width = 15
+        self.excel_styles.write_sheet(ws, resources_sheet(project_details))
     
-    def _create_action_plan_sheet(self, ws, project_details, header_font, body_font, accent_fill, left_alignment, thin_border):
+    def _create_action_plan_sheet(self, ws, project_details):
         """Create the action plan sheet"""
-        
-        # Title
-        ws.merge_cells("A1:D2")
-        ws["A1"] = "🎯 Project Action Plan & Next Steps"
-        ws["A1"].font = header_font
-        ws["A1"].alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Action steps
-        action_steps = [
-            {
-                "phase": "Phase 1: Planning & Preparation",
-                "tasks": [
-                    "Gather all required components from the components list",
-                    "Set up development environment and install necessary tools",
-                    "Review all tutorial videos and documentation",
-                    "Create project folder structure and documentation"
-                ]
-            },
-            {
-                "phase": "Phase 2: Learning & Research",
-                "tasks": [
-                    "Watch key tutorial videos to understand concepts",
-                    "Study relevant GitHub repositories for code examples",
-                    "Practice with smaller components before full integration",
-                    "Join relevant online communities and forums"
-                ]
-            },
-            {
-                "phase": "Phase 3: Implementation",
-                "tasks": [
-                    "Start with basic functionality implementation",
-                    "Test each component individually before integration",
-                    "Follow step-by-step implementation guide",
-                    "Document your progress and code changes"
-                ]
-            },
-            {
-                "phase": "Phase 4: Testing & Refinement",
-                "tasks": [
-                    "Perform comprehensive testing of all features",
-                    "Debug issues and optimize performance",
-                    "Add additional features and improvements",
-                    "Prepare project documentation and presentation"
-                ]
-            }
-        ]
-        
-        current_row = 4
-        
-        for phase_data in action_steps:
-            # Phase header
-            ws.merge_cells(f"A{current_row}:D{current_row}")
-            ws[f"A{current_row}"] = phase_data["phase"]
-            ws[f"A{current_row}"].font = Font(name="Calibri", size=14, bold=True, color="FFFFFF")
-            ws[f"A{current_row}"].fill = accent_fill
-            ws[f"A{current_row}"].alignment = Alignment(horizontal="center", vertical="center")
-            ws[f"A{current_row}"].border = thin_border
-            current_row += 1
-            
-            # Phase tasks
-            for i, task in enumerate(phase_data["tasks"], 1):
-                ws[f"A{current_row}"] = f"{i}."
-                ws[f"B{current_row}"] = task
-                ws[f"C{current_row}"] = "⬜ To Do"  # Checkbox
-                ws[f"D{current_row}"] = "Notes"
-                
-                ws[f"A{current_row}"].font = Font(name="Calibri", size=11, bold=True)
-                ws[f"B{current_row}"].font = body_font
-                ws[f"C{current_row}"].font = Font(name="Calibri", size=11, color="10B981")
-                ws[f"D{current_row}"].font = Font(name="Calibri", size=10, italic=True, color="6B7280")
-                
-                ws[f"A{current_row}"].alignment = Alignment(horizontal="center", vertical="top")
-                ws[f"B{current_row}"].alignment = left_alignment
-                ws[f"C{current_row}"].alignment = Alignment(horizontal="center", vertical="top")
-                ws[f"D{current_row}"].alignment = left_alignment
-                
-                for col in ["A", "B", "C", "D"]:
-                    ws[f"{col}{current_row}"].border = thin_border
-                
-                current_row += 1
-            
-            current_row += 1  # Space between phases
-        
-        # Tips section
-        current_row += 1
-        ws.merge_cells(f"A{current_row}:D{current_row}")
-        ws[f"A{current_row}"] = "💡 Tips for Success"
-        ws[f"A{current_row}"].font = Font(name="Calibri", size=14, bold=True, color="1E40AF")
-        ws[f"A{current_row}"].fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
-        ws[f"A{current_row}"].alignment = Alignment(horizontal="center", vertical="center")
-        current_row += 1
-        
-        tips = [
-            "Start with the basics and build incrementally",
-            "Don't hesitate to ask for help in online communities",
-            "Document your progress and learnings for future reference",
-            "Test each component before integrating into the main system",
-            "Have fun and be creative with your implementation!"
-        ]
-        
-        for tip in tips:
-            ws[f"A{current_row}"] = "💡"
-            ws[f"B{current_row}"] = tip
-            ws[f"A{current_row}"].font = Font(name="Calibri", size=12)
-            ws[f"B{current_row}"].font = body_font
-            ws[f"B{current_row}"].alignment = left_alignment
-            current_row += 1
-        
-        # Set column widths
-        ws.column_dimensions["A"].width = 8
-        ws.column_dimensions["B"].width = 50
-        ws.column_dimensions["C"].width = 15
-        ws.column_dimensions["D"].width = 20
+        self.excel_styles.write_sheet(ws, action_plan_sheet(project_details))
 
     async def get_component_info(self, components: List[Dict]) -> List[str]:
         """Get component purchase links and information"""
         try:
-            if not components:
-                return []
-                
+            # Search for specs, prices and where to buy every component at once; the tool keeps one
+            # entry per distinct component, however the model spelled repeats
+            lookups = await asyncio.to_thread(
+                self.tools.component_lookups,
+                [comp.get("name", "") for comp in components], limit=COMPONENT_INFO_MAX, distinct=True
+            )
+            
             component_links = []
-            for comp in components[:5]:  # Limit to 5 components
-                component_name = comp.get("name", "")
-                if component_name:
-                    tavily_tool = self.tool_map.get("component_info_search")
-                    if tavily_tool:
-                        try:
-                            # Search for where to buy this component
-                            search_query = f"where to buy {component_name} electronics component online"
-                            result = await asyncio.to_thread(
-                                tavily_tool.invoke, {"query": search_query}
-                            )
-                            if result and len(result) > 20:  # Ensure we got useful results
-                                component_links.append(f"**{component_name}**: {result[:200]}...")
-                        except Exception as e:
-                            component_links.append(f"**{component_name}**: Search online stores like Amazon, Adafruit, SparkFun, or local electronics suppliers.")
+            for name, lookup in lookups.items():
+                top = (lookup.get("results") or [{}])[0]
+                info = lookup.get("summary") or top.get("content", "")
+                if lookup.get("error") or len(info) <= 20:  # Ensure we got useful results
+                    component_links.append(f"**{name}**: Search online stores like Amazon, Adafruit, SparkFun, or local electronics suppliers.")
+                    continue
+                link = f" [{top['title']}]({top['url']})" if top.get("url") else ""
+                component_links.append(f"**{name}**: {info[:200]}...{link}")
             
             return component_links
         except Exception as e:
-            st.error(f"Error fetching component information: {e}")
+            print(f"❌ Error fetching component information: {e}")
         return []
 
+def stage_task_group(stage: str = None) -> str:
+    """Background-task group for this browser session and stage, cancelled when the user navigates away"""
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    return f"{st.session_state.session_id}:{stage or st.session_state.current_stage}"
+
+def iterate_async(agen: AsyncIterator) -> Iterator:
+    """Drive an async generator on the shared background loop, one item at a time"""
+    return background_loop.iterate(agen, stage_task_group())
+
+class RefinementPrefetcher:
+    """Speculatively generates the next refinement question while the user is still answering
+
+    Candidates are keyed by a signature of the project context plus the answers (including the
+    draft being typed). On submit a matching candidate is reused, even while still running, and
+    the caller waits for it at most REFINEMENT_PREFETCH_WAIT; non-matching candidates are cancelled.
+    """
+    
+    def __init__(self, max_candidates: int = REFINEMENT_PREFETCH_MAX):
+        self.max_candidates = max_candidates
+        self.candidates: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def signature(project_title: str, engineering_field: str, project_type: str,
+                  complexity_level: str, user_responses: Dict) -> str:
+        raw = json.dumps(
+            [project_title, engineering_field, project_type, complexity_level,
+             sorted((k, (v or "").strip()) for k, v in user_responses.items())],
+            default=str
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def speculate(self, assistant, group: str, project_title: str, engineering_field: str,
+                  project_type: str, complexity_level: str, user_responses: Dict):
+        """Start generating the question that would follow these answers, unless already in flight"""
+        key = self.signature(project_title, engineering_field, project_type, complexity_level, user_responses)
+        if key in self.candidates:
+            return
+        
+        while len(self.candidates) >= self.max_candidates:
+            oldest = next(iter(self.candidates))
+            self.candidates.pop(oldest).cancel()
+        
+        self.candidates[key] = background_loop.submit(
+            assistant.ask_refinement_question(
+                project_title, engineering_field, project_type, complexity_level, dict(user_responses)
+            ),
+            group
+        )
+    
+    def take(self, project_title: str, engineering_field: str, project_type: str,
+             complexity_level: str, user_responses: Dict):
+        """Return the matching candidate's future, finished or in flight (or None), and cancel every other candidate"""
+        key = self.signature(project_title, engineering_field, project_type, complexity_level, user_responses)
+        future = self.candidates.pop(key, None)
+        self.cancel()
+        
+        if future is None or future.cancelled():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return future
+    
+    def cancel(self):
+        for future in self.candidates.values():
+            future.cancel()
+        self.candidates.clear()
+
+class BlueprintPipeline:
+    """Pre-generates the project blueprint in the background while refinement is still going on
+
+    The LLM part of the guide is drafted once enough answers are in. Drafts never search
+    YouTube or GitHub (those queries depend on the final answers), so a superseded draft costs
+    one LLM call and no API quota. Every later answer supersedes the draft, so the details stage
+    only reuses a draft built from the final answers.
+    """
+    
+    def __init__(self):
+        self.draft_key = None
+        self.draft = None
+        self.hits = 0
+        self.misses = 0
+    
+    def draft_blueprint(self, assistant, group: str, request: ProjectRequest):
+        """(Re)start the drafted project structure for the current answers, superseding any older draft"""
+        key = request.signature()
+        if key == self.draft_key:
+            return
+        if self.draft is not None:
+            self.draft.cancel()
+        self.draft_key = key
+        self.draft = background_loop.submit(assistant.generate_project_structure(request), group)
+    
+    def take_draft(self, request: ProjectRequest):
+        """Return the draft future if it was built from exactly this request, else None"""
+        draft, key = self.draft, self.draft_key
+        self.draft, self.draft_key = None, None
+        
+        if draft is None or draft.cancelled() or key != request.signature():
+            if draft is not None:
+                draft.cancel()
+            self.misses += 1
+            return None
+        self.hits += 1
+        return draft
+    
+    def cancel(self):
+        if self.draft is not None:
+            self.draft.cancel()
+        self.draft_key, self.draft = None, None
+
+def refinement_context() -> Tuple[str, str, str, str]:
+    """Project title, field, type and complexity that parameterize the refinement questions"""
+    return (
+        st.session_state.selected_project['title'],
+        st.session_state.selected_subdomain or st.session_state.selected_field,
+        st.session_state.project_type,
+        st.session_state.complexity_level,
+    )
+
+def session_project_request(project_title: str) -> ProjectRequest:
+    """Copy the refinement context out of session state so generation can run off the script thread"""
+    return ProjectRequest(
+        title=project_title,
+        engineering_field=st.session_state.get('selected_subdomain') or st.session_state.get('selected_field') or '',
+        selected_field=st.session_state.get('selected_field') or 'Engineering',
+        project_type=st.session_state.get('project_type') or 'General Project',
+        complexity_level=st.session_state.get('complexity_level') or 'Intermediate',
+        user_responses=dict(st.session_state.get('user_responses') or {}),
+    )
+
+def speculate_next_question(question_index: int):
+    """on_change hook for the answer box: start generating the follow-up question from the draft answer"""
+    draft = (st.session_state.get(f"response_input_{question_index}") or "").strip()
+    if not draft or len(st.session_state.refinement_questions) >= 4:
+        return
+    responses = dict(st.session_state.user_responses)
+    responses[f"question_{question_index}"] = draft
+    st.session_state.refinement_prefetcher.speculate(
+        st.session_state.assistant, stage_task_group(), *refinement_context(), responses
+    )
+
 def create_streamlit_app():
     """Create the enhanced Streamlit interface"""
     st.set_page_config(
@@ -2162,6 +1863,17 @@ def create_streamlit_app():
         st.session_state.refinement_questions = []
     if "user_responses" not in st.session_state:
         st.session_state.user_responses = {}
+    if "refinement_prefetcher" not in st.session_state:
+        st.session_state.refinement_prefetcher = RefinementPrefetcher()
+    if "blueprint_pipeline" not in st.session_state:
+        st.session_state.blueprint_pipeline = BlueprintPipeline()
+    if "rendered_stage" not in st.session_state:
+        st.session_state.rendered_stage = st.session_state.current_stage
+
+    # Cancel background work still running for a stage the user has navigated away from
+    if st.session_state.rendered_stage != st.session_state.current_stage:
+        background_loop.cancel_group(stage_task_group(st.session_state.rendered_stage))
+        st.session_state.rendered_stage = st.session_state.current_stage
 
     # Create progress indicator from theme - only show if user has started
     if st.session_state.conversation_history or st.session_state.current_stage != "idea_input":
@@ -2192,11 +1904,14 @@ def create_streamlit_app():
         
         if st.button("🔄 Start Fresh Journey", use_container_width=True):
             # Clear all session state for a fresh start
+            st.session_state.refinement_prefetcher.cancel()
+            st.session_state.blueprint_pipeline.cancel()
             keys_to_clear = [
                 "conversation_history", "project_details", "current_stage", "assistant",
                 "selected_field", "selected_subdomain", "selected_project", 
                 "project_type", "complexity_level", "trending_projects",
-                "refinement_questions", "user_responses", "component_info"
+                "refinement_questions", "user_responses", "component_info",
+                "refinement_prefetcher", "blueprint_pipeline", "pdf_export_job"
             ]
             for key in keys_to_clear:
                 if key in st.session_state:
@@ -2220,121 +1935,6 @@ def create_streamlit_app():
         </div>
         """, unsafe_allow_html=True)
         
-        # Engineering Fields Structure based on Pakistan's complete list
-        engineering_fields = {
-            "🏗️ Civil & Infrastructure": {
-                "color": "#8B4513",
-                "desc": "Building the foundations of society",
-                "subfields": [
-                    "Civil Engineering",
-                    "Structural Engineering", 
-                    "Environmental Engineering",
-                    "Transportation Engineering",
-                    "Water Resources Engineering",
-                    "Geotechnical Engineering",
-                    "Urban & Infrastructure Engineering",
-                    "Architectural Engineering",
-                    "Geological Engineering"
-                ]
-            },
-            "⚙️ Mechanical & Manufacturing": {
-                "color": "#FF6B35",
-                "desc": "Designing and building mechanical systems",
-                "subfields": [
-                    "Mechanical Engineering",
-                    "Manufacturing Engineering",
-                    "Automotive Engineering",
-                    "Aerospace Engineering",
-                    "Aeronautical Engineering",
-                    "Industrial Engineering",
-                    "Mechatronics Engineering",
-                    "Robotics & Automation Engineering",
-                    "Marine Engineering"
-                ]
-            },
-            "⚡ Electrical & Electronics": {
-                "color": "#FFD700",
-                "desc": "Powering the modern world",
-                "subfields": [
-                    "Electrical Engineering",
-                    "Electronics Engineering",
-                    "Telecommunication Engineering",
-                    "Avionics Engineering",
-                    "Power Systems Engineering",
-                    "Control Systems Engineering",
-                    "Instrumentation Engineering",
-                    "Energy & Power Engineering"
-                ]
-            },
-            "💻 Computing & Software": {
-                "color": "#4169E1",
-                "desc": "Creating digital solutions",
-                "subfields": [
-                    "Computer Engineering",
-                    "Software Engineering",
-                    "Information & Communication Technology (ICT)",
-                    "Systems Engineering",
-                    "Artificial Intelligence Engineering",
-                    "Data Science Engineering",
-                    "Cybersecurity Engineering",
-                    "Network Engineering"
-                ]
-            },
-            "⚗️ Chemical & Materials": {
-                "color": "#32CD32",
-                "desc": "Transforming materials and processes",
-                "subfields": [
-                    "Chemical Engineering",
-                    "Petroleum Engineering",
-                    "Polymer Engineering",
-                    "Materials Engineering",
-                    "Nanotechnology Engineering",
-                    "Process Engineering",
-                    "Food Engineering",
-                    "Textile Engineering"
-                ]
-            },
-            "🌱 Biological & Agricultural": {
-                "color": "#228B22",
-                "desc": "Engineering for life sciences",
-                "subfields": [
-                    "Biomedical Engineering",
-                    "Agricultural Engineering",
-                    "Bioengineering",
-                    "Biotechnology Engineering",
-                    "Food Engineering",
-                    "Environmental Engineering",
-                    "Biosystems Engineering"
-                ]
-            },
-            "🛡️ Specialized & Defense": {
-                "color": "#800080",
-                "desc": "Advanced and specialized fields",
-                "subfields": [
-                    "Nuclear Engineering",
-                    "Military Engineering",
-                    "Defense Production Engineering",
-                    "Mining Engineering",
-                    "Metallurgical Engineering",
-                    "Safety Engineering",
-                    "Quality Engineering"
-                ]
-            },
-            "🔬 Emerging Technologies": {
-                "color": "#FF1493",
-                "desc": "Cutting-edge engineering disciplines",
-                "subfields": [
-                    "Renewable Energy Engineering",
-                    "Artificial Intelligence Engineering",
-                    "Quantum Engineering",
-                    "Space Technology Engineering",
-                    "Biomedical Device Engineering",
-                    "Smart Systems Engineering",
-                    "Sustainable Engineering"
-                ]
-            }
-        }
-
         # Interactive Field Selection UI
         st.markdown("""
         <h3 style="text-align: center; color: #495057; margin: 2rem 0 1rem 0;">
@@ -2355,7 +1955,7 @@ def create_streamlit_app():
             
             # Create field selection grid
             cols = st.columns(2)
-            for i, (field_name, field_info) in enumerate(engineering_fields.items()):
+            for i, (field_name, field_info) in enumerate(ENGINEERING_FIELDS.items()):
                 with cols[i % 2]:
                     if st.button(
                         f"{field_name}\n{field_info['desc']}", 
@@ -2373,7 +1973,7 @@ def create_streamlit_app():
 
         # Step 2: Select Subdomain
         elif st.session_state.selected_field and not st.session_state.selected_subdomain:
-            selected_field_info = engineering_fields[st.session_state.selected_field]
+            selected_field_info = ENGINEERING_FIELDS[st.session_state.selected_field]
             
             st.markdown(f"""
             <div style="background: linear-gradient(135deg, {selected_field_info['color']} 0%, {selected_field_info['color']}CC 100%); 
@@ -2421,7 +2021,7 @@ def create_streamlit_app():
 
         # Step 3: Confirmation and proceed
         elif st.session_state.selected_field and st.session_state.selected_subdomain:
-            selected_field_info = engineering_fields[st.session_state.selected_field]
+            selected_field_info = ENGINEERING_FIELDS[st.session_state.selected_field]
             
             st.markdown(f"""
             <div style="background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%); 
@@ -2493,14 +2093,17 @@ def create_streamlit_app():
         </div>
         """.format(field_name=st.session_state.selected_subdomain or st.session_state.selected_field), unsafe_allow_html=True)
         
-        # Generate trending projects if not already done
+        # Generate trending projects if not already done, preferring the pre-generated catalogue
         if not st.session_state.trending_projects:
-            with st.spinner("🔍 Finding trending projects in your field..."):
-                field_for_projects = st.session_state.selected_subdomain or st.session_state.selected_field
-                trending_projects = asyncio.run(
-                    st.session_state.assistant.generate_trending_projects(field_for_projects)
-                )
-                st.session_state.trending_projects = trending_projects
+            field_for_projects = st.session_state.selected_subdomain or st.session_state.selected_field
+            trending_projects = st.session_state.assistant.catalogued_trending_projects(field_for_projects)
+            if not trending_projects:
+                with st.spinner("🔍 Finding trending projects in your field..."):
+                    trending_projects = background_loop.run(
+                        st.session_state.assistant.generate_trending_projects(field_for_projects),
+                        stage_task_group()
+                    )
+            st.session_state.trending_projects = trending_projects
         
         # Display trending projects
         if st.session_state.trending_projects:
@@ -2688,17 +2291,18 @@ def create_streamlit_app():
         
         # Initialize refinement questions if not started
         if not st.session_state.refinement_questions:
-            with st.spinner("🤔 Preparing the first question..."):
-                question = asyncio.run(
-                    st.session_state.assistant.ask_refinement_question(
-                        st.session_state.selected_project['title'],
-                        st.session_state.selected_subdomain or st.session_state.selected_field,
-                        st.session_state.project_type,
-                        st.session_state.complexity_level,
-                        st.session_state.user_responses
-                    )
+            st.caption("🤔 Preparing the first question...")
+            question = st.write_stream(iterate_async(
+                st.session_state.assistant.stream_refinement_question(
+                    st.session_state.selected_project['title'],
+                    st.session_state.selected_subdomain or st.session_state.selected_field,
+                    st.session_state.project_type,
+                    st.session_state.complexity_level,
+                    st.session_state.user_responses
                 )
-                st.session_state.refinement_questions.append(question)
+            ))
+            st.session_state.refinement_questions.append(question.strip())
+            st.rerun()
         
         # Display conversation
         st.markdown("### 💬 Project Refinement Discussion")
@@ -2730,7 +2334,9 @@ def create_streamlit_app():
                 placeholder="Share your thoughts, preferences, or requirements...",
                 height=100,
                 key=f"response_input_{current_question_index}",
-                help="Be as specific as possible - this helps me generate a better project guide!"
+                help="Be as specific as possible - this helps me generate a better project guide!",
+                on_change=speculate_next_question,
+                args=(current_question_index,)
             )
             
             col1, col2, col3 = st.columns([1, 2, 1])
@@ -2739,19 +2345,39 @@ def create_streamlit_app():
                     # Save the response
                     st.session_state.user_responses[f"question_{current_question_index}"] = user_response
                     
+                    # Enough context for a draft blueprint; each later answer supersedes it
+                    if len(st.session_state.user_responses) >= 3:
+                        st.session_state.blueprint_pipeline.draft_blueprint(
+                            st.session_state.assistant, stage_task_group("blueprint"),
+                            session_project_request(st.session_state.selected_project['title'])
+                        )
+                    
                     # Generate next question if we haven't asked enough
                     if len(st.session_state.refinement_questions) < 4:  # Ask up to 4 questions
-                        with st.spinner("🤔 Thinking of the next question..."):
-                            next_question = asyncio.run(
-                                st.session_state.assistant.ask_refinement_question(
-                                    st.session_state.selected_project['title'],
-                                    st.session_state.selected_subdomain or st.session_state.selected_field,
-                                    st.session_state.project_type,
-                                    st.session_state.complexity_level,
+                        next_question = None
+                        # Reuse the question speculatively generated from this exact answer, if any
+                        candidate = st.session_state.refinement_prefetcher.take(
+                            *refinement_context(), st.session_state.user_responses
+                        )
+                        if candidate is not None:
+                            try:
+                                # Usually still running: the blur that started it fired with this click
+                                if not candidate.done():
+                                    st.caption("🤔 Finishing the next question...")
+                                next_question = candidate.result(timeout=REFINEMENT_PREFETCH_WAIT)
+                            except Exception as e:
+                                candidate.cancel()
+                                print(f"⚠️ Prefetched refinement question unavailable: {e!r}")
+                        
+                        if not next_question:
+                            st.caption("🤔 Thinking of the next question...")
+                            next_question = st.write_stream(iterate_async(
+                                st.session_state.assistant.stream_refinement_question(
+                                    *refinement_context(),
                                     st.session_state.user_responses
                                 )
-                            )
-                            st.session_state.refinement_questions.append(next_question)
+                            ))
+                        st.session_state.refinement_questions.append(next_question.strip())
                     
                     st.rerun()
         
@@ -2771,17 +2397,18 @@ def create_streamlit_app():
             with col1:
                 if st.button("🔄 Ask More Questions", use_container_width=True):
                     # Generate one more question
-                    with st.spinner("🤔 Preparing another question..."):
-                        next_question = asyncio.run(
-                            st.session_state.assistant.ask_refinement_question(
-                                st.session_state.selected_project['title'],
-                                st.session_state.selected_subdomain or st.session_state.selected_field,
-                                st.session_state.project_type,
-                                st.session_state.complexity_level,
-                                st.session_state.user_responses
-                            )
+                    st.caption("🤔 Preparing another question...")
+                    next_question = st.write_stream(iterate_async(
+                        st.session_state.assistant.stream_refinement_question(
+                            st.session_state.selected_project['title'],
+                            st.session_state.selected_subdomain or st.session_state.selected_field,
+                            st.session_state.project_type,
+                            st.session_state.complexity_level,
+                            st.session_state.user_responses,
+                            use_cache=False
                         )
-                        st.session_state.refinement_questions.append(next_question)
+                    ))
+                    st.session_state.refinement_questions.append(next_question.strip())
                     st.rerun()
             
             with col2:
@@ -2793,6 +2420,8 @@ def create_streamlit_app():
         if st.button("← Back to Project Selection"):
             st.session_state.current_stage = "project_type_selection"
             # Clear refinement data when going back
+            st.session_state.refinement_prefetcher.cancel()
+            st.session_state.blueprint_pipeline.cancel()
             st.session_state.refinement_questions = []
             st.session_state.user_responses = {}
             st.rerun()
@@ -2801,18 +2430,18 @@ def create_streamlit_app():
         if st.session_state.conversation_history:
             latest_user_input = st.session_state.conversation_history[-1]
             if latest_user_input.startswith("User:") and len([m for m in st.session_state.conversation_history if m.startswith("Assistant:")]) < len([m for m in st.session_state.conversation_history if m.startswith("User:")]):
-                with st.spinner("🤔 Thinking about your question and preparing a helpful response..."):
-                    try:
-                        response = asyncio.run(
-                            st.session_state.assistant.refine_project_idea(
-                                latest_user_input[5:],
-                                st.session_state.conversation_history
-                            )
+                st.caption("🤔 Thinking about your question and preparing a helpful response...")
+                try:
+                    response = st.write_stream(iterate_async(
+                        st.session_state.assistant.stream_refine_project_idea(
+                            latest_user_input[5:],
+                            st.session_state.conversation_history
                         )
-                        st.session_state.conversation_history.append(f"Assistant: {response}")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Oops! I had trouble processing that. Let's try again: {e}")
+                    ))
+                    st.session_state.conversation_history.append(f"Assistant: {response}")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Oops! I had trouble processing that. Let's try again: {e}")
         
         # Enhanced input section
         st.markdown("""
@@ -2849,34 +2478,71 @@ def create_streamlit_app():
         """, unsafe_allow_html=True)
         
         if st.session_state.project_details is None:
-            # Extract project title from conversation
-            project_title = "Custom Project"
-            for msg in st.session_state.conversation_history:
-                if "project" in msg.lower():
-                    project_title = msg.split(":")[-1].strip()[:50]
-                    break
-            
-            # Enhanced loading with progress simulation
+            if st.session_state.selected_project:
+                project_title = st.session_state.selected_project['title']
+            else:
+                # Extract project title from conversation
+                project_title = "Custom Project"
+                for msg in st.session_state.conversation_history:
+                    if "project" in msg.lower():
+                        project_title = msg.split(":")[-1].strip()[:50]
+                        break
+            project_request = session_project_request(project_title)
+            drafted_structure = None
+            
+            # Reuse the project structure drafted during refinement if it matches the final answers
+            draft = st.session_state.blueprint_pipeline.take_draft(project_request)
+            if draft is not None:
+                try:
+                    with st.spinner("🧠 Finishing the blueprint prepared during refinement..."):
+                        drafted_structure = draft.result()
+                    if not drafted_structure:
+                        print("⚠️ Draft blueprint did not parse, generating from scratch")
+                except Exception as e:
+                    print(f"⚠️ Draft blueprint unavailable, generating from scratch: {e}")
+        
+        if st.session_state.project_details is None:
+            # Live progress while the blueprint streams in, rendering each field as it closes
             progress_bar = st.progress(0)
             status_text = st.empty()
-            
-            loading_steps = [
-                "🔍 Analyzing your requirements...",
-                "🧠 Generating project structure...",
-                "⚙️ Selecting components...",
-                "📚 Finding frameworks...",
-                "🎯 Finalizing details..."
-            ]
+            live_fields = st.container()
+            field_labels = {
+                "title": "🎯 Title",
+                "short_description": "💡 Summary",
+                "detailed_description": "📖 Implementation guide",
+                "components": "🔧 Components",
+                "frameworks": "🛠️ Frameworks",
+                "difficulty_level": "📊 Difficulty",
+                "estimated_time": "⏱️ Timeline",
+            }
             
             try:
-                for i, step in enumerate(loading_steps):
-                    status_text.text(step)
-                    progress_bar.progress((i + 1) / len(loading_steps))
-                    
-                if not st.session_state.project_details:  # Only generate if not already generated
-                    st.session_state.project_details = asyncio.run(
-                        st.session_state.assistant.generate_project_details(project_title)
-                    )
+                status_text.text("🧠 Generating project structure...")
+                fields_done = 0
+                for event, payload in iterate_async(
+                    st.session_state.assistant.stream_project_details(project_request, drafted_structure)
+                ):
+                    if event == "field":
+                        name, value = payload
+                        label = field_labels.get(name)
+                        if not label:
+                            continue
+                        fields_done += 1
+                        if isinstance(value, list):
+                            items = [v.get('name', '') if isinstance(v, dict) else str(v) for v in value]
+                            live_fields.markdown(f"**{label}:** {', '.join(i for i in items if i)}")
+                        elif name == "detailed_description":
+                            live_fields.markdown(f"**{label}:** ready ({len(str(value).split())} words)")
+                        else:
+                            live_fields.markdown(f"**{label}:** {value}")
+                        progress_bar.progress(min(0.75, fields_done / len(field_labels) * 0.75))
+                    elif event == "stage":
+                        status_text.text(payload)
+                        progress_bar.progress(0.8)
+                    elif event == "error":
+                        st.error(payload)
+                    elif event == "details":
+                        st.session_state.project_details = payload
                 
                 progress_bar.progress(1.0)
                 status_text.success("✅ Your project blueprint is ready!")
@@ -3241,9 +2907,9 @@ def create_streamlit_app():
                 """, unsafe_allow_html=True)
                 
                 # Display component info from get_component_info
-                component_info = getattr(details, 'component_info', [])
-                if hasattr(st.session_state, 'component_info') and st.session_state.component_info:
-                    for info in st.session_state.component_info:
+                component_info = getattr(details, 'component_info', []) or st.session_state.get('component_info', [])
+                if component_info:
+                    for info in component_info:
                         st.markdown(f"""
                         <div style="background: white; border: 2px solid #667eea; 
                                     border-radius: 10px; padding: 1rem; margin: 0.5rem 0;">
@@ -3377,79 +3043,7 @@ def create_streamlit_app():
             
             # Create downloadable summary with enhanced formatting
             user_name = st.session_state.get("user_name", "Builder")
-            summary = f"""# 🚀 {details.title}
-*Personal Project Guide for {user_name}*
-
----
-
-## 📋 Project Overview
-
-**Difficulty Level:** {details.difficulty_level}  
-**Estimated Timeline:** {details.estimated_time}  
-**Generated:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
-
-## 💡 Project Description
-
-{details.short_description}
-
-## 📖 Detailed Implementation Guide
-
-{details.detailed_description}
-
-## 🔧 Required Components
-
-"""
-            for i, comp in enumerate(details.components, 1):
-                summary += f"""{i}. **{comp.get('name', 'Component')}**
-   - Purpose: {comp.get('purpose', 'N/A')}
-   - Specifications: {comp.get('specs', 'N/A')}
-
-"""
-            
-            summary += f"""## 🛠️ Recommended Tools & Frameworks
-
-"""
-            for framework in details.frameworks:
-                summary += f"- {framework}\n"
-            
-            summary += f"""
-## 📺 Learning Resources
-
-### Video Tutorials
-"""
-            for i, link in enumerate(details.youtube_links, 1):
-                summary += f"{i}. [Tutorial Video {i}]({link})\n"
-            
-            summary += f"""
-### Code Repositories
-"""
-            for i, repo in enumerate(details.github_repos, 1):
-                summary += f"{i}. [GitHub Repository {i}]({repo})\n"
-            
-            summary += f"""
----
-
-## 🎯 Next Steps
-
-1. **Gather Components** - Use the component list to purchase or gather required materials
-2. **Study Resources** - Watch tutorials and explore code repositories
-3. **Start Building** - Follow the step-by-step guide
-4. **Join Community** - Connect with other builders and share your progress
-5. **Iterate & Improve** - Make the project your own!
-
-## 💡 Tips for Success
-
-- Start with the basics and build incrementally
-- Don't hesitate to ask for help in online communities
-- Document your progress and learnings
-- Test each component before integrating
-- Have fun and be creative!
-
----
-
-*Generated by ProjectCraft AI - Your Intelligent Project Guide*  
-*Happy Building! 🚀*
-"""
+            summary = markdown_guide(details, user_name)
             
             # Download section
             st.markdown("""
@@ -3462,27 +3056,65 @@ def create_streamlit_app():
             </div>
             """, unsafe_allow_html=True)
             
-            # Download buttons in two columns
-            col1, col2 = st.columns(2)
+            # PDF layout runs on the background loop so the page renders while it is produced
+            assistant = st.session_state.assistant
+            pdf_data = assistant.get_pdf_guide(details, user_name, build=False)
+            pdf_key = assistant.export_cache.make_key("pdf", [asdict(details), user_name])
+            pdf_job = st.session_state.get("pdf_export_job")
+            if pdf_data is None and (pdf_job is None or pdf_job[0] != pdf_key or pdf_job[1].cancelled()):
+                st.session_state.pdf_export_job = (pdf_key, background_loop.submit(
+                    asyncio.to_thread(assistant.get_pdf_guide, details, user_name), stage_task_group()
+                ))
+            
+            # Download buttons in three columns
+            col1, col2, col3 = st.columns(3)
             
             with col1:
-                # Excel Download
-                with st.spinner("Generating Professional Excel File..."):
-                    excel_data = st.session_state.assistant.generate_excel_guide(details, user_name)
-                    if excel_data:
-                        st.download_button(
-                            label="📊 Download Excel Guide (Professional)",
-                            data=excel_data,
-                            file_name=f"{details.title.replace(' ', '_')}_ProjectGuide.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            type="primary",
-                            use_container_width=True,
-                            help="Professional Excel format - Perfect for planning and tracking progress"
-                        )
-                    else:
+                # Excel Download: built only on request, then served from the export cache on reruns
+                excel_data = st.session_state.assistant.get_excel_guide(details, user_name, build=False)
+                if excel_data is None and st.button(
+                    "📊 Prepare Excel Guide (Professional)", type="primary", use_container_width=True
+                ):
+                    with st.spinner("Generating Professional Excel File..."):
+                        excel_data = st.session_state.assistant.get_excel_guide(details, user_name)
+                    if not excel_data:
                         st.error("Error generating Excel file. Please try again.")
+                if excel_data:
+                    st.download_button(
+                        label="📊 Download Excel Guide (Professional)",
+                        data=excel_data,
+                        file_name=f"{details.title.replace(' ', '_')}_ProjectGuide.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        type="primary",
+                        use_container_width=True,
+                        help="Professional Excel format - Perfect for planning and tracking progress"
+                    )
             
             with col2:
+                # PDF Download: usually ready by the time the page has rendered
+                if pdf_data is None and st.button(
+                    "📄 Prepare PDF Guide (Print-Ready)", type="primary", use_container_width=True
+                ):
+                    with st.spinner("Generating PDF Guide..."):
+                        try:
+                            pdf_data = st.session_state.pdf_export_job[1].result()
+                        except Exception as e:
+                            print(f"❌ Background PDF export failed: {e}")
+                            pdf_data = assistant.get_pdf_guide(details, user_name)
+                    if not pdf_data:
+                        st.error("Error generating PDF file. Please try again.")
+                if pdf_data:
+                    st.download_button(
+                        label="📄 Download PDF Guide (Print-Ready)",
+                        data=pdf_data,
+                        file_name=f"{details.title.replace(' ', '_')}_ProjectGuide.pdf",
+                        mime="application/pdf",
+                        type="primary",
+                        use_container_width=True,
+                        help="PDF format - Easy to share, print and read on any device"
+                    )
+            
+            with col3:
                 # Markdown Download (fallback)
                 st.download_button(
                     label="📝 Download Markdown Guide",
@@ -3512,11 +3144,14 @@ def create_streamlit_app():
             with col1:
                 if st.button("🔄 Start Another Project", type="secondary", use_container_width=True):
                     # Clear all session state for a fresh start
+                    st.session_state.refinement_prefetcher.cancel()
+                    st.session_state.blueprint_pipeline.cancel()
                     keys_to_clear = [
                         "conversation_history", "project_details", "current_stage", "assistant",
                         "selected_field", "selected_subdomain", "selected_project", 
                         "project_type", "complexity_level", "trending_projects",
-                        "refinement_questions", "user_responses", "component_info"
+                        "refinement_questions", "user_responses", "component_info",
+                        "refinement_prefetcher", "blueprint_pipeline", "pdf_export_job"
                     ]
                     for key in keys_to_clear:
                         if key in st.session_state:
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+
+def markdown_guide(details, user_name: str = "Builder", generated_at: datetime = None) -> str:
+    """Render the downloadable Markdown project guide"""
+    generated_at = generated_at or datetime.now()
+    summary = f"""# 🚀 {details.title}
+*Personal Project Guide for {user_name}*
+
+---
+
+## 📋 Project Overview
+
+**Difficulty Level:** {details.difficulty_level}  
+**Estimated Timeline:** {details.estimated_time}  
+**Generated:** {generated_at.strftime('%B %d, %Y at %I:%M %p')}
+
+## 💡 Project Description
+
+{details.short_description}
+
+## 📖 Detailed Implementation Guide
+
+{details.detailed_description}
+
+## 🔧 Required Components
+
+"""
+    for i, comp in enumerate(details.components, 1):
+        summary += f"""{i}. **{comp.get('name', 'Component')}**
+   - Purpose: {comp.get('purpose', 'N/A')}
+   - Specifications: {comp.get('specs', 'N/A')}
+
+"""
+
+    summary += """## 🛠️ Recommended Tools & Frameworks
+
+"""
+    for framework in details.frameworks:
+        summary += f"- {framework}\n"
+
+    summary += """
+## 📺 Learning Resources
+
+### Video Tutorials
+"""
+    for i, link in enumerate(details.youtube_links, 1):
+        summary += f"{i}. [Tutorial Video {i}]({link})\n"
+
+    summary += """
+### Code Repositories
+"""
+    for i, repo in enumerate(details.github_repos, 1):
+        summary += f"{i}. [GitHub Repository {i}]({repo})\n"
+
+    summary += """
+---
+
+## 🎯 Next Steps
+
+1. **Gather Components** - Use the component list to purchase or gather required materials
+2. **Study Resources** - Watch tutorials and explore code repositories
+3. **Start Building** - Follow the step-by-step guide
+4. **Join Community** - Connect with other builders and share your progress
+5. **Iterate & Improve** - Make the project your own!
+
+## 💡 Tips for Success
+
+- Start with the basics and build incrementally
+- Don't hesitate to ask for help in online communities
+- Document your progress and learnings
+- Test each component before integrating
+- Have fun and be creative!
+
+---
+
+*Generated by ProjectCraft AI - Your Intelligent Project Guide*  
+*Happy Building! 🚀*
+"""
+    return summary
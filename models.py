@@ -0,0 +1,43 @@
+import json
+import hashlib
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List
+
+
+@dataclass
+class ProjectDetails:
+    title: str
+    short_description: str
+    detailed_description: str
+    components: List[Dict[str, str]]
+    frameworks: List[str]
+    youtube_links: List[str]
+    github_repos: List[str]
+    difficulty_level: str
+    estimated_time: str
+    component_info: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ProjectRequest:
+    """Everything the assistant needs to generate one project guide, as plain picklable data"""
+    title: str
+    engineering_field: str = "Engineering"
+    selected_field: str = "Engineering"
+    project_type: str = "General Project"
+    complexity_level: str = "Intermediate"
+    user_responses: Dict[str, str] = field(default_factory=dict)
+
+    def signature(self) -> str:
+        """Stable hash of the request, used to match speculative work against the final answers"""
+        raw = json.dumps(asdict(self), sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def resource_context(self, project_type: str = '') -> Dict[str, Any]:
+        """Project context passed to the YouTube/GitHub/component lookups"""
+        return {
+            'engineering_field': self.engineering_field,
+            'user_responses': self.user_responses,
+            'project_type': project_type,
+            'complexity_level': self.complexity_level
+        }
@@ -0,0 +1,277 @@
+import io
+import time
+import argparse
+import tracemalloc
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Flowable, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from excel_export import ACTION_PLAN, SUCCESS_TIPS, framework_category
+
+PRIMARY = colors.HexColor("#1E40AF")
+ACCENT = colors.HexColor("#10B981")
+TEXT = colors.HexColor("#374151")
+STRIPE = colors.HexColor("#F8FAFC")
+VIDEO = colors.HexColor("#DC2626")
+REPO = colors.HexColor("#0369A1")
+
+# Rows per table chunk in long component/framework/link tables
+TABLE_CHUNK_ROWS = 20
+
+
+@lru_cache(maxsize=1)
+def pdf_styles() -> Dict[str, ParagraphStyle]:
+    """Paragraph styles for the guide, built once per process and shared by every export"""
+    base = getSampleStyleSheet()
+    body = ParagraphStyle("PCBody", parent=base["BodyText"], fontSize=10, leading=14, textColor=TEXT)
+    return {
+        "title": ParagraphStyle("PCTitle", parent=base["Title"], fontSize=22, leading=26, textColor=PRIMARY),
+        "subtitle": ParagraphStyle("PCSubtitle", parent=base["Heading2"], alignment=TA_CENTER, textColor=TEXT),
+        "section": ParagraphStyle("PCSection", parent=base["Heading1"], fontSize=16, textColor=PRIMARY,
+                                  spaceBefore=6, spaceAfter=8),
+        "heading": ParagraphStyle("PCHeading", parent=base["Heading2"], fontSize=13, textColor=PRIMARY),
+        "subheading": ParagraphStyle("PCSubheading", parent=base["Heading3"], fontSize=11, textColor=TEXT),
+        "body": body,
+        "bullet": ParagraphStyle("PCBullet", parent=body, leftIndent=14, bulletIndent=4),
+        "cell": ParagraphStyle("PCCell", parent=body, fontSize=9, leading=11),
+        "header_cell": ParagraphStyle("PCHeaderCell", parent=body, fontSize=9, leading=11,
+                                      fontName="Helvetica-Bold", textColor=colors.white),
+        "link": ParagraphStyle("PCLink", parent=body, fontSize=9, leading=11, textColor=colors.HexColor("#2563EB")),
+    }
+
+
+def _p(text, style: str) -> Paragraph:
+    return Paragraph(escape(str(text)), pdf_styles()[style])
+
+
+def _table(headers: List[str], records: Iterable[List[Flowable]], widths: List[float], header_color) -> Iterator[Table]:
+    """Striped tables with wrapped cells, chunked so long lists never have to be split across pages
+
+    Splitting a long reportlab Table re-measures every remaining row on each page break,
+    which is quadratic in the row count; fixed-size chunks keep layout linear.
+    """
+    styles = pdf_styles()
+    header = [Paragraph(escape(h), styles["header_cell"]) for h in headers]
+    records = iter(records)
+    while True:
+        # Each chunk becomes its own table of at most TABLE_CHUNK_ROWS rows
+        chunk = list(islice(records, TABLE_CHUNK_ROWS))
+        if not chunk:
+            break
+        data = [header] + chunk
+        table = Table(data, colWidths=widths, repeatRows=1)
+        commands = [
+            ("BACKGROUND", (0, 0), (-1, 0), header_color),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ]
+        commands += [("BACKGROUND", (0, row), (-1, row), STRIPE) for row in range(2, len(data), 2)]
+        table.setStyle(TableStyle(commands))
+        yield table
+
+
+def _overview(details, user_name: str) -> Iterator[Flowable]:
+    yield _p("ProjectCraft AI - Project Guide", "title")
+    yield _p(details.title, "subtitle")
+    yield Spacer(1, 0.2 * inch)
+
+    info = [
+        ("Personal Guide for", user_name),
+        ("Difficulty Level", details.difficulty_level),
+        ("Estimated Timeline", details.estimated_time),
+        ("Generated on", datetime.now().strftime('%B %d, %Y at %I:%M %p')),
+        ("Components Required", len(details.components or [])),
+        ("Tools & Frameworks", len(details.frameworks or [])),
+        ("Video Tutorials", len([l for l in details.youtube_links or [] if l.strip()])),
+        ("GitHub Repositories", len([r for r in details.github_repos or [] if r.strip()])),
+    ]
+    yield from _table(["Project Information", "Details"],
+                 [[_p(label, "cell"), _p(value, "cell")] for label, value in info],
+                 [2.2 * inch, 4.3 * inch], PRIMARY)
+    yield Spacer(1, 0.2 * inch)
+    yield _p("Project Description", "heading")
+    yield _p(details.short_description, "body")
+
+
+def _implementation(details) -> Iterator[Flowable]:
+    yield _p("Detailed Implementation Guide", "section")
+    if not details.detailed_description:
+        yield _p("Detailed implementation steps will be provided based on your specific project "
+                 "requirements and chosen technologies.", "body")
+        return
+
+    for line in details.detailed_description.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('## '):
+            yield _p(line[3:].strip(), "subheading")
+        elif line.startswith('# '):
+            yield _p(line[2:].strip(), "heading")
+        elif line.startswith(('- ', '• ', '* ')):
+            yield Paragraph(escape(line[2:].strip()), pdf_styles()["bullet"], bulletText="•")
+        else:
+            yield _p(line, "body")
+
+
+def _components(details) -> Iterator[Flowable]:
+    yield _p("Required Components & Specifications", "section")
+    components = details.components or []
+    if not components:
+        yield _p("Components will be determined based on your specific project requirements.", "body")
+        return
+    records = (
+        [_p(c.get('name', 'Component'), "cell"), _p(c.get('purpose', 'Project component'), "cell"),
+         _p(c.get('specs', 'As per requirements'), "cell")]
+        for c in components
+    )
+    yield from _table(["Component", "Purpose", "Specifications"], records,
+                 [1.6 * inch, 2.6 * inch, 2.3 * inch], PRIMARY)
+
+
+def _frameworks(details) -> Iterator[Flowable]:
+    yield _p("Recommended Tools & Frameworks", "section")
+    frameworks = details.frameworks or []
+    if not frameworks:
+        yield _p("Recommended tools and frameworks will depend on your specific project requirements.", "body")
+        return
+    records = (
+        [_p(framework, "cell"), _p(framework_category(framework), "cell"),
+         _p(f"Essential for {framework_category(framework).lower()} aspects of the project", "cell")]
+        for framework in frameworks
+    )
+    yield from _table(["Tool/Framework", "Category", "Purpose"], records,
+                 [2.0 * inch, 1.5 * inch, 3.0 * inch], PRIMARY)
+
+
+def _link_table(links: List[str], site: str, header_color) -> Iterator[Flowable]:
+    links = [link.strip() for link in links or [] if link and link.strip()]
+
+    def records():
+        for index, link in enumerate(links, 1):
+            if link.startswith('http'):
+                href = escape(link, {'"': "&quot;"})
+                cell = Paragraph(f'<link href="{href}">{escape(link)}</link>', pdf_styles()["link"])
+            else:
+                cell = _p(f"Search {site} for: {link}", "cell")
+            yield [_p(index, "cell"), cell]
+
+    if links:
+        yield from _table(["#", "Link"], records(), [0.4 * inch, 6.1 * inch], header_color)
+    else:
+        yield _p(f"Search {site} for resources related to your project.", "body")
+
+
+def _resources(details) -> Iterator[Flowable]:
+    yield _p("Learning Resources & References", "section")
+    yield _p("Video Tutorials", "heading")
+    yield from _link_table(details.youtube_links, "YouTube", VIDEO)
+    yield Spacer(1, 0.15 * inch)
+    yield _p("Code Repositories", "heading")
+    yield from _link_table(details.github_repos, "GitHub", REPO)
+
+
+def _action_plan(details) -> Iterator[Flowable]:
+    yield _p("Project Action Plan & Next Steps", "section")
+    for phase, tasks in ACTION_PLAN:
+        yield _p(phase, "heading")
+        for i, task in enumerate(tasks, 1):
+            yield Paragraph(escape(task), pdf_styles()["bullet"], bulletText=f"{i}.")
+    yield _p("Tips for Success", "heading")
+    for tip in SUCCESS_TIPS:
+        yield Paragraph(escape(tip), pdf_styles()["bullet"], bulletText="•")
+
+
+def guide_flowables(details, user_name: str = "Builder") -> Iterator[Flowable]:
+    """Flowables for the whole guide, section by section; write_pdf_guide collects them into one story list"""
+    sections = [
+        _overview(details, user_name), _implementation(details), _components(details),
+        _frameworks(details), _resources(details), _action_plan(details),
+    ]
+    for i, section in enumerate(sections):
+        if i:
+            yield PageBreak()
+        yield from section
+
+
+def write_pdf_guide(details, user_name: str = "Builder", output: BinaryIO = None) -> BinaryIO:
+    """Lay out the guide into output (default: BytesIO) and return it rewound when seekable"""
+    if output is None:
+        output = io.BytesIO()
+    doc = SimpleDocTemplate(
+        output, pagesize=A4, title=f"{details.title} - Project Guide", author="ProjectCraft AI",
+        leftMargin=0.75 * inch, rightMargin=0.75 * inch, topMargin=0.75 * inch, bottomMargin=0.75 * inch,
+    )
+    doc.build(list(guide_flowables(details, user_name)))
+    if output.seekable():
+        output.seek(0)
+    return output
+
+
+def pdf_guide_bytes(details, user_name: str = "Builder") -> bytes:
+    return write_pdf_guide(details, user_name).getvalue()
+
+
+def _benchmark_details(scale: int):
+    from types import SimpleNamespace
+
+    description = "\n".join(
+        f"## Step {i}" if i % 10 == 0 else
+        f"- Detail {i}: wire the module and verify its output against the expected readings" if i % 3 else
+        f"Paragraph {i} explains the reasoning behind this stage of the build in a few sentences. " * 3
+        for i in range(1, 40 * scale)
+    )
+    return SimpleNamespace(
+        title="Benchmark Guide", short_description="Synthetic guide used for export benchmarks.",
+        detailed_description=description,
+        components=[{"name": f"Component {i}", "purpose": "Sensing and control " * 3, "specs": "5V, I2C " * 4}
+                    for i in range(25 * scale)],
+        frameworks=[f"Python library {i}" for i in range(5 * scale)],
+        youtube_links=[f"https://www.youtube.com/watch?v=video{i:05d}" for i in range(5 * scale)],
+        github_repos=[f"https://github.com/example/repo-{i}" for i in range(5 * scale)],
+        difficulty_level="Advanced", estimated_time="12 weeks",
+    )
+
+
+def benchmark(scales: List[int], repeats: int = 3):
+    """Time and trace memory of the PDF layout for synthetic guides of growing size"""
+    pdf_styles()
+    for scale in scales:
+        details = _benchmark_details(scale)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            size = len(write_pdf_guide(details).getvalue())
+            timings.append(time.perf_counter() - start)
+        # Memory is traced in a separate run: tracemalloc slows layout down several times
+        tracemalloc.start()
+        write_pdf_guide(details)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"scale={scale:<3} components={len(details.components):<5} "
+              f"best={min(timings) * 1000:8.1f} ms  peak={peak / 1e6:6.1f} MB  pdf={size / 1024:7.1f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF guide export benchmarks")
+    parser.add_argument("--benchmark", action="store_true", help="Run the layout benchmark")
+    parser.add_argument("--scales", type=int, nargs="*", default=[1, 4, 16], help="Guide size multipliers")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.scales, args.repeats)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -43,20 +43,30 @@ class simple_chat:
             return "\n".join([f"- {r['title']}: {r['href']}" for r in results])
 
 
-    async def fusion_answer(self, user_query):
-   
-        loop = asyncio.get_event_loop()
-        search_task = loop.run_in_executor(None, self.duckduckgo_search, user_query) 
-        llm_task = loop.run_in_executor(None, self.llm.predict, user_query)
+    async def _merge_input(self, user_query):
+        # DDGS is a blocking client, so only the web search runs in a worker thread
+        search_task = asyncio.to_thread(self.duckduckgo_search, user_query)
+        llm_task = self.llm.ainvoke(user_query)
         search_result, llm_output = await asyncio.gather(search_task, llm_task)
 
-        final_input = self.merge_prompt.format_messages(
+        return self.merge_prompt.format_messages(
             query=user_query,
-            search_result=search_result + "\n\nLLM Thought:\n" + llm_output
+            search_result=search_result + "\n\nLLM Thought:\n" + llm_output.content
         )
 
-        final_response = self.llm.invoke(final_input)
+    async def fusion_answer(self, user_query):
+   
+        final_input = await self._merge_input(user_query)
+
+        final_response = await self.llm.ainvoke(final_input)
         return final_response.content
+
+    async def astream_fusion_answer(self, user_query):
+        final_input = await self._merge_input(user_query)
+
+        async for chunk in self.llm.astream(final_input):
+            if chunk.content:
+                yield chunk.content
     
     def __call__(self, user_query):
         return asyncio.run(self.fusion_answer(user_query))
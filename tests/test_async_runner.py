@@ -0,0 +1,75 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from async_runner import BackgroundLoop
+
+
+@pytest.fixture
+def runner():
+    loop = BackgroundLoop(name="test-event-loop")
+    yield loop
+    loop.stop()
+
+
+def test_run_executes_on_one_long_lived_loop(runner):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = runner.run(current_loop())
+    assert runner.run(current_loop()) is first
+    assert first is runner.loop
+
+
+def test_run_propagates_exceptions(runner):
+    async def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError, match="bad"):
+        runner.run(boom())
+
+
+def test_iterate_drives_an_async_generator_and_closes_it(runner):
+    closed = []
+
+    async def numbers():
+        try:
+            for i in range(5):
+                yield i
+        finally:
+            closed.append(True)
+
+    iterator = runner.iterate(numbers())
+    assert [next(iterator), next(iterator)] == [0, 1]
+    iterator.close()
+    assert closed == [True]
+
+
+def test_cancel_group_cancels_only_that_group(runner):
+    async def sleeper():
+        await asyncio.sleep(30)
+
+    async def quick():
+        return "ok"
+
+    pending = [runner.submit(sleeper(), group="session:details") for _ in range(2)]
+    other = runner.submit(sleeper(), group="session:trending")
+
+    assert runner.cancel_group("session:details") == 2
+    for future in pending:
+        with pytest.raises(concurrent.futures.CancelledError):
+            future.result(timeout=5)
+    assert not other.done()
+    assert runner.cancel_group("session:details") == 0
+    assert runner.run(quick(), group="session:details") == "ok"
+    other.cancel()
+    # Let the loop process the cancellations before the fixture stops it
+    runner.run(asyncio.sleep(0.05))
+
+
+def test_stop_starts_a_fresh_loop_on_next_use(runner):
+    first = runner.loop
+    runner.stop()
+    assert first.is_closed()
+    assert runner.loop is not first
@@ -0,0 +1,79 @@
+import pytest
+
+import cache
+from cache import ResultCache, SQLiteCache, TTLCache, normalize_query
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, "time", fake)
+    return fake
+
+
+def test_normalize_query_collapses_case_spacing_and_punctuation():
+    assert normalize_query("  Arduino   LINE follower?! ") == "arduino line follower"
+    assert normalize_query(None) == ""
+
+
+def test_ttl_cache_expires_entries(clock):
+    store = TTLCache(max_entries=4, default_ttl=10)
+    store.set("a", 1)
+    store.set("b", 2, ttl=100)
+
+    clock.now += 11
+    assert store.get("a") is None
+    assert store.get("b") == 2
+    assert store.stats() == {"entries": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    store = TTLCache(max_entries=2, default_ttl=60)
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1  # "b" is now the oldest entry
+
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+    assert store.evictions == 1
+
+
+def test_sqlite_cache_round_trip_and_expiry(tmp_path, clock):
+    disk = SQLiteCache(str(tmp_path / "cache.db"))
+    disk.set("k", {"items": [1, 2]}, ttl=5)
+    disk.set("old", "x", ttl=1)
+    assert disk.get("k") == {"items": [1, 2]}
+
+    clock.now += 2
+    assert disk.get("old") is None
+    clock.now += 10
+    assert disk.purge_expired() == 1
+    assert disk.get("k") is None
+
+
+def test_result_cache_promotes_disk_hits_to_memory(tmp_path, clock):
+    disk = SQLiteCache(str(tmp_path / "cache.db"))
+    results = ResultCache(memory=TTLCache(), disk=disk, ttls={"github_repos": 60})
+    results.set("github_repos", ["line follower"], [{"name": "repo"}])
+
+    fresh = ResultCache(memory=TTLCache(), disk=disk, ttls={"github_repos": 60})
+    assert fresh.get("github_repos", ["line follower"]) == [{"name": "repo"}]
+    assert len(fresh.memory) == 1
+    assert fresh.get("github_repos", ["other"]) is None
+
+
+def test_result_cache_keys_are_provider_scoped():
+    results = ResultCache(memory=TTLCache())
+    results.set("youtube_search", ["q"], "videos")
+    assert results.get("ddg_search", ["q"]) is None
+    assert results.ttl_for("unknown") == cache.DEFAULT_TTL
@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+import github_client as gh
+from github_client import GitHubClient, GitHubError, GitHubRateLimited, RateLimitWindow
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, data=None, headers=None):
+        self.status_code = status_code
+        self._data = data
+        self.headers = headers or {}
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    """Queue of responses returned by the pooled HTTP client, recording each request's headers"""
+    queue, sent = [], []
+
+    def fake_get(url, params=None, headers=None):
+        sent.append(dict(headers or {}))
+        return queue.pop(0)
+
+    monkeypatch.setattr(gh.http_pool, "get", fake_get)
+    return queue, sent
+
+
+def test_window_allows_requests_up_to_the_budget():
+    window = RateLimitWindow(per_minute=2)
+    assert window.acquire(max_wait=0) == 0.0
+    assert window.acquire(max_wait=0) == 0.0
+    with pytest.raises(GitHubRateLimited) as exc:
+        window.acquire(max_wait=1)
+    assert 59 < exc.value.retry_in <= 60
+
+
+def test_window_refund_frees_a_slot():
+    window = RateLimitWindow(per_minute=1)
+    window.acquire(max_wait=0)
+    window.refund()
+    assert window.acquire(max_wait=0) == 0.0
+
+
+def test_window_adopts_server_headers():
+    window = RateLimitWindow(per_minute=30)
+    window.update({"X-RateLimit-Limit": "30", "X-RateLimit-Remaining": "0",
+                   "X-RateLimit-Reset": str(time.time() + 45)})
+    with pytest.raises(GitHubRateLimited):
+        window.acquire(max_wait=5)
+    state = window.state()
+    assert state["limit"] == 30 and state["remaining"] == 0
+    assert 40 < state["resets_in"] <= 45
+
+
+def test_window_treats_retry_after_as_an_exhausted_window():
+    window = RateLimitWindow(per_minute=30)
+    window.update({"Retry-After": "20"})
+    with pytest.raises(GitHubRateLimited):
+        window.acquire(max_wait=1)
+
+
+def test_not_modified_serves_the_cached_body_and_refunds_the_slot(responses):
+    queue, sent = responses
+    client = GitHubClient(max_wait=0)
+    body = {"items": [{"full_name": "a/b"}]}
+    queue.append(FakeResponse(200, body, {"ETag": '"v1"'}))
+    queue.append(FakeResponse(304, None, {"ETag": '"v1"'}))
+
+    assert client.search_repositories("rover", token="t") == body
+    assert client.search_repositories("rover", token="t") == body
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+
+    metrics = client.metrics("t")
+    assert metrics["requests"] == 2 and metrics["not_modified"] == 1
+    assert metrics["window"]["sent_last_minute"] == 1
+
+
+def test_rate_limited_response_raises_without_retrying(responses):
+    queue, _ = responses
+    client = GitHubClient(max_wait=0)
+    queue.append(FakeResponse(403, None, {"X-RateLimit-Remaining": "0",
+                                          "X-RateLimit-Reset": str(time.time() + 30)}))
+    with pytest.raises(GitHubRateLimited):
+        client.search_repositories("rover")
+    # The window now knows it is exhausted, so the next call fails before any request
+    with pytest.raises(GitHubRateLimited):
+        client.search_repositories("rover")
+    assert client.metrics()["requests"] == 1
+
+
+def test_http_errors_raise_github_error(responses):
+    queue, _ = responses
+    queue.append(FakeResponse(422, {"message": "Validation Failed"}))
+    with pytest.raises(GitHubError, match="HTTP 422"):
+        GitHubClient(max_wait=0).search_repositories("rover")
+
+
+def test_etag_cache_is_bounded(responses):
+    queue, _ = responses
+    client = GitHubClient(max_wait=0, max_entries=2)
+    for i in range(3):
+        queue.append(FakeResponse(200, {"items": [i]}, {"ETag": f'"v{i}"'}))
+        client.search_repositories(f"query {i}", token="t")
+    assert client.metrics("t")["etag_entries"] == 2
@@ -0,0 +1,62 @@
+import json
+
+from json_stream import IncrementalJSONParser
+
+
+def feed_in_chunks(text: str, size: int):
+    parser = IncrementalJSONParser()
+    fields = []
+    for i in range(0, len(text), size):
+        fields.extend(parser.feed(text[i:i + size]))
+    return parser, fields
+
+
+def test_fields_are_emitted_as_each_value_closes():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"title": "Line ') == []
+    assert parser.feed('Follower", "frameworks": ["ROS"') == [("title", "Line Follower")]
+    assert parser.feed(', "Arduino"]}') == [("frameworks", ["ROS", "Arduino"])]
+    assert parser.done
+    assert parser.close() == {"title": "Line Follower", "frameworks": ["ROS", "Arduino"]}
+
+
+def test_code_fences_and_prose_around_the_object_are_ignored():
+    text = 'Here is the guide:\n```json\n{"title": "Rover", "estimated_time": "6 weeks"}\n```\nEnjoy!'
+    parser, fields = feed_in_chunks(text, 3)
+    assert fields == [("title", "Rover"), ("estimated_time", "6 weeks")]
+    assert parser.close() == {"title": "Rover", "estimated_time": "6 weeks"}
+
+
+def test_braces_and_escapes_inside_strings_do_not_end_values():
+    payload = {
+        "detailed_description": 'Use {braces}, [brackets] and "quotes" \\ freely',
+        "components": [{"name": "ESP32", "specs": "240 MHz, {dual core}"}],
+    }
+    text = json.dumps(payload)
+    for size in (1, 2, 7, len(text)):
+        parser, fields = feed_in_chunks(text, size)
+        assert dict(fields) == payload
+        assert parser.close() == payload
+
+
+def test_trailing_commas_are_dropped():
+    parser, _ = feed_in_chunks('{"frameworks": ["A", "B", ], "components": [{"name": "x",},],}', 4)
+    assert parser.close() == {"frameworks": ["A", "B"], "components": [{"name": "x"}]}
+
+
+def test_close_keeps_a_complete_final_field_without_closing_brace():
+    parser = IncrementalJSONParser()
+    parser.feed('{"title": "Drone", "difficulty_level": "Advanced"')
+    assert parser.close() == {"title": "Drone", "difficulty_level": "Advanced"}
+
+
+def test_close_drops_a_truncated_field():
+    parser = IncrementalJSONParser()
+    parser.feed('{"title": "Drone", "components": [{"name": "Mot')
+    assert parser.close() == {"title": "Drone"}
+
+
+def test_non_json_text_yields_nothing():
+    parser, fields = feed_in_chunks("Sorry, I cannot help with that.", 5)
+    assert fields == []
+    assert parser.close() == {}
@@ -0,0 +1,110 @@
+import pytest
+
+from tools import QuotaExceeded, QuotaLedger
+
+
+@pytest.fixture
+def ledger():
+    return QuotaLedger(daily_quota=10000, path=None)
+
+
+def test_charge_tracks_units_per_key(ledger):
+    assert ledger.charge("key-a", "search") == 9900
+    assert ledger.charge("key-a", "videos", calls=3) == 9897
+    assert ledger.spent("key-a") == 103
+    assert ledger.spent("key-b") == 0
+
+
+@pytest.mark.parametrize("searches_spent, expected", [
+    (0, 4),    # more than half the quota left
+    (51, 2),   # 49% left
+    (76, 1),   # 24% left
+    (96, 0),   # 4% left: below the reserve, cached results only
+])
+def test_plan_searches_scales_down_as_the_budget_drains(ledger, searches_spent, expected):
+    if searches_spent:
+        ledger.charge("key", "search", calls=searches_spent)
+    assert ledger.plan_searches("key", wanted=6) == expected
+
+
+def test_plan_searches_never_exceeds_what_is_wanted_or_affordable():
+    ledger = QuotaLedger(daily_quota=250, path=None)
+    assert ledger.plan_searches("key", wanted=1) == 1
+    assert ledger.plan_searches("key", wanted=6) == 2
+
+
+def test_require_and_exhaust(ledger):
+    ledger.require("key", "search")
+    ledger.exhaust("key")
+    assert ledger.remaining("key") == 0
+    with pytest.raises(QuotaExceeded):
+        ledger.require("key", "videos")
+
+
+def test_ledger_file_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "quota.db")
+    app, batch = QuotaLedger(path=path), QuotaLedger(path=path)
+    app.charge("key", "search")
+    batch.charge("key", "search", calls=2)
+    assert app.spent("key") == batch.spent("key") == 300
+
+
+def test_counters_reset_with_the_quota_day(ledger, monkeypatch):
+    ledger.charge("key", "search")
+    monkeypatch.setattr(QuotaLedger, "day", staticmethod(lambda: "2099-01-01"))
+    assert ledger.spent("key") == 0
+    ledger.charge("key", "videos")
+    assert ledger.status("key")["spent"] == 1
+
+
+@pytest.fixture
+def tools_main(monkeypatch):
+    from cache import ResultCache, TTLCache
+    from tools import ToolsMain
+
+    looked_up = []
+
+    def fake_lookup(self, component):
+        looked_up.append(component)
+        if component == "broken":
+            raise RuntimeError("Error fetching data: timeout")
+        return {"name": component, "summary": f"{component} specs", "results": [], "depth": "basic"}
+
+    monkeypatch.setattr(ToolsMain, "component_lookup", fake_lookup)
+    main = ToolsMain(cache=ResultCache(memory=TTLCache()))
+    main.looked_up = looked_up
+    return main
+
+
+def test_component_lookups_searches_each_distinct_component_once(tools_main):
+    lookups = tools_main.component_lookups(["ESP32", " esp32 ", "DHT22", "", None, "ESP32!"])
+    assert sorted(tools_main.looked_up) == ["DHT22", "ESP32"]
+    assert set(lookups) == {"ESP32", " esp32 ", "DHT22", "ESP32!"}
+    assert lookups[" esp32 "] is lookups["ESP32"] is lookups["ESP32!"]
+
+
+def test_component_lookups_maps_failures_to_errors(tools_main):
+    lookups = tools_main.component_lookups(["broken", "Servo"])
+    assert lookups["broken"] == {"name": "broken", "error": "Error fetching data: timeout"}
+    assert lookups["Servo"]["summary"] == "Servo specs"
+
+
+def test_component_lookups_limit_counts_distinct_components(tools_main):
+    names = ["LED", "led", "Resistor", "LED ", "Servo", "Buzzer"]
+    lookups = tools_main.component_lookups(names, limit=3, distinct=True)
+    assert list(lookups) == ["LED", "Resistor", "Servo"]
+    assert sorted(tools_main.looked_up) == ["LED", "Resistor", "Servo"]
+
+
+def test_registry_rebuild_picks_up_new_api_keys(monkeypatch):
+    from tools import ToolRegistry
+
+    registry = ToolRegistry()
+    monkeypatch.setenv("GITHUB_API_KEY", "old-token")
+    assert registry.tools_main.github_api_key == "old-token"
+
+    monkeypatch.setenv("GITHUB_API_KEY", "new-token")
+    assert registry.tools_main.github_api_key == "old-token"
+    registry.invalidate()
+    assert registry.tools_main.github_api_key == "new-token"
+    assert registry.generation == 2
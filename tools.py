@@ -1,19 +1,174 @@
 import os
-import requests
+import re
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
-from typing import List, Dict
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
 from langchain.tools import Tool
 from tavily import TavilyClient
 from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
 
+from http_pool import http_pool
+from github_client import github_client, GitHubError
+from cache import result_cache, normalize_query
+
 load_dotenv()
 
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 GITHUB_API_KEY = os.getenv("GITHUB_API_KEY")
 
+# Search settings behind the youtube_search tool and the assistant's structured lookups
+YOUTUBE_TOOL_MAX_RESULTS = 6
+YOUTUBE_TOOL_PARAMS = {
+    "videoDuration": "medium",  # Prefer 4-20 minute videos
+    "order": "relevance",
+    "videoDefinition": "high",
+    "relevanceLanguage": "en"
+}
+GITHUB_TOOL_MAX_RESULTS = 5
+# Concurrent search.list calls in a batched lookup, and the videos.list ID limit
+YOUTUBE_SEARCH_CONCURRENCY = 3
+YOUTUBE_VIDEOS_PER_REQUEST = 50
+
+# Concurrent Tavily lookups for a bill of materials
+COMPONENT_LOOKUP_CONCURRENCY = int(os.getenv("COMPONENT_LOOKUP_CONCURRENCY", "4"))
+COMPONENT_LOOKUP_RESULTS = 5
+# Generic parts are well covered by a basic search; model numbers get the advanced depth
+COMPONENT_BASIC_TERMS = (
+    "resistor", "capacitor", "led", "wire", "jumper", "breadboard", "battery", "switch", "button",
+    "diode", "transistor", "cable", "header", "screw", "enclosure", "buzzer", "potentiometer",
+)
+
+# YouTube Data API quota: units per key per day, reset at midnight Pacific time
+YOUTUBE_DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+YOUTUBE_QUOTA_COSTS = {"search": 100, "videos": 1}
+# Below this share of the daily quota no new searches are made; only cached results are served
+YOUTUBE_QUOTA_RESERVE = float(os.getenv("YOUTUBE_QUOTA_RESERVE", "0.05"))
+# Optional SQLite file so spent units survive restarts and are shared between processes
+YOUTUBE_QUOTA_LEDGER_PATH = os.getenv("YOUTUBE_QUOTA_LEDGER")
+# (remaining share of the quota, max uncached searches per batch), checked top to bottom
+YOUTUBE_SEARCH_PLAN = ((0.5, 4), (0.25, 2), (YOUTUBE_QUOTA_RESERVE, 1))
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:  # no tz database: approximate the reset with UTC
+    QUOTA_TIMEZONE = timezone.utc
+
+
+class QuotaExceeded(RuntimeError):
+    """The YouTube quota for this key is spent (or too low for the call) until the daily reset"""
+
+
+class QuotaLedger:
+    """Units spent per API key per quota day, with a planner that scales searches to the remaining budget
+
+    Counters live in SQLite (in memory unless a ledger path is given) and are updated in place,
+    so processes sharing one ledger file (the app and the batch CLI) add to the same totals.
+    """
+
+    def __init__(self, daily_quota: int = YOUTUBE_DAILY_QUOTA, costs: Dict[str, int] = None,
+                 path: Optional[str] = YOUTUBE_QUOTA_LEDGER_PATH):
+        self.daily_quota = daily_quota
+        self.costs = dict(costs or YOUTUBE_QUOTA_COSTS)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        schema = ("CREATE TABLE IF NOT EXISTS youtube_quota ("
+                  "day TEXT NOT NULL, key TEXT NOT NULL, spent INTEGER NOT NULL, PRIMARY KEY (day, key))")
+        if self.path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+                with conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(schema)
+                return conn
+            except Exception as e:
+                print(f"⚠️ Could not open YouTube quota ledger {self.path}, tracking in memory: {e}")
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        with conn:
+            conn.execute(schema)
+        return conn
+
+    @staticmethod
+    def key_id(api_key: str) -> str:
+        # Keys are never stored, only a short fingerprint
+        return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:12]
+
+    @staticmethod
+    def day() -> str:
+        return datetime.now(QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+    def _spent(self, day: str, key: str) -> int:
+        row = self._conn.execute(
+            "SELECT spent FROM youtube_quota WHERE day = ? AND key = ?", (day, key)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def spent(self, api_key: str) -> int:
+        with self._lock:
+            return self._spent(self.day(), self.key_id(api_key))
+
+    def remaining(self, api_key: str) -> int:
+        return max(0, self.daily_quota - self.spent(api_key))
+
+    def charge(self, api_key: str, operation: str, calls: int = 1) -> int:
+        """Record calls made (the API bills failed requests too); returns units remaining"""
+        units = self.costs[operation] * calls
+        today, key = self.day(), self.key_id(api_key)
+        with self._lock, self._conn:
+            # Only today's counters matter; older days are dropped on the next write
+            self._conn.execute("DELETE FROM youtube_quota WHERE day != ?", (today,))
+            # Increment in the database so concurrent writers never overwrite each other's units
+            self._conn.execute(
+                "INSERT INTO youtube_quota (day, key, spent) VALUES (?, ?, ?) "
+                "ON CONFLICT (day, key) DO UPDATE SET spent = spent + excluded.spent",
+                (today, key, units)
+            )
+            return max(0, self.daily_quota - self._spent(today, key))
+
+    def exhaust(self, api_key: str):
+        """The API reported quotaExceeded: treat the rest of the day as spent"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO youtube_quota (day, key, spent) VALUES (?, ?, ?) "
+                "ON CONFLICT (day, key) DO UPDATE SET spent = MAX(spent, excluded.spent)",
+                (self.day(), self.key_id(api_key), self.daily_quota)
+            )
+        print("🚫 YouTube quota exhausted until the daily reset")
+
+    def require(self, api_key: str, operation: str, calls: int = 1):
+        """Raise QuotaExceeded before making calls the remaining budget cannot cover"""
+        if self.remaining(api_key) < self.costs[operation] * calls:
+            raise QuotaExceeded("YouTube daily quota exhausted")
+
+    def plan_searches(self, api_key: str, wanted: int) -> int:
+        """How many of the wanted uncached searches to run, scaled down as the budget drains"""
+        remaining = self.remaining(api_key)
+        affordable = remaining // self.costs["search"]
+        share = remaining / self.daily_quota if self.daily_quota else 0.0
+        for min_share, max_searches in YOUTUBE_SEARCH_PLAN:
+            if share >= min_share:
+                return min(wanted, max_searches, affordable)
+        return 0
+
+    def status(self, api_key: str) -> Dict[str, int]:
+        spent = self.spent(api_key)
+        return {"day": self.day(), "spent": spent, "remaining": max(0, self.daily_quota - spent),
+                "daily_quota": self.daily_quota}
+
+
+youtube_quota = QuotaLedger()
+
 class QueryInput(BaseModel):
     query: str = Field(..., description="Search query string")
 
@@ -21,10 +176,14 @@ class ComponentsInput(BaseModel):
     components: str = Field(..., description="Comma-separated electronic components list")
 
 class ToolsMain:
-    def __init__(self):
-        self.youtube_api_key = YOUTUBE_API_KEY
-        self.github_api_key = GITHUB_API_KEY
-        self.tavily_api_key = TAVILY_API_KEY
+    def __init__(self, cache=None):
+        self.cache = cache or result_cache
+        # Read at construction so a rebuilt instance (ToolRegistry.invalidate) picks up new keys
+        self.youtube_api_key = os.getenv("YOUTUBE_API_KEY")
+        self.github_api_key = os.getenv("GITHUB_API_KEY")
+        self.tavily_api_key = os.getenv("TAVILY_API_KEY")
+        self.youtube_quota = youtube_quota
+        self.github = github_client
 
         self.tavily_client = TavilyClient(api_key=self.tavily_api_key) if self.tavily_api_key else None
         self.ddg = DuckDuckGoSearchAPIWrapper()
@@ -61,10 +220,79 @@ class ToolsMain:
     def search_youtube(self, query: str, max_results: int = 10, 
                       advanced_params: Dict = None) -> List[Dict]:
         """Expert-level YouTube search with advanced filtering and parameters"""
+        return self.search_youtube_batch([query], max_results, advanced_params)[query]
+
+    def search_youtube_batch(self, queries: List[str], max_results: int = 10,
+                             advanced_params: Dict = None) -> Dict[str, List[Dict]]:
+        """Run several searches, then resolve every new video ID in as few videos.list calls as possible"""
         
         if not self.youtube_api_key:
             raise RuntimeError("Missing YOUTUBE_API_KEY in environment.")
 
+        results: Dict[str, List[Dict]] = {}
+        pending: Dict[str, tuple] = {}
+        for query in dict.fromkeys(queries):
+            cache_key = (normalize_query(query), max_results, sorted((advanced_params or {}).items()))
+            cached = self.cache.get("youtube_search", cache_key)
+            if cached is not None:
+                print(f"⚡ YouTube search cache hit: {query}")
+                results[query] = cached
+            else:
+                pending[query] = cache_key
+
+        if not pending:
+            return results
+
+        # Spend search units (100 each) only as far as the remaining budget allows
+        allowed = self.youtube_quota.plan_searches(self.youtube_api_key, len(pending))
+        if allowed < len(pending):
+            print(f"💸 YouTube quota: {self.youtube_quota.remaining(self.youtube_api_key)} units left, "
+                  f"running {allowed} of {len(pending)} searches")
+            for query in list(pending)[allowed:]:
+                del pending[query]
+                results[query] = []
+            if not pending:
+                if not any(results.values()):
+                    raise QuotaExceeded("YouTube quota budget too low for new searches")
+                return results
+
+        def search(query: str):
+            try:
+                return self._youtube_search_items(query, max_results, advanced_params)
+            except RuntimeError as e:
+                return e
+
+        # Search calls are independent; run a few at once
+        with ThreadPoolExecutor(max_workers=min(YOUTUBE_SEARCH_CONCURRENCY, len(pending))) as pool:
+            search_items = dict(zip(pending, pool.map(search, pending)))
+
+        errors = {q: e for q, e in search_items.items() if isinstance(e, Exception)}
+        if errors and len(errors) == len(search_items) and not results:
+            raise next(iter(errors.values()))
+
+        # One de-duplicated details lookup for every search's videos
+        video_ids = []
+        for query, items in search_items.items():
+            if query in errors:
+                print(f"⚠️ {errors[query]}")
+                results[query] = []
+                continue
+            for item in items:
+                vid = (item.get("id", {}) or {}).get("videoId")
+                if vid:
+                    video_ids.append(vid)
+        detailed_videos = self._fetch_video_details(video_ids) if video_ids else {}
+
+        # Process and filter results with expert criteria
+        for query, cache_key in pending.items():
+            if query in errors:
+                continue
+            results[query] = self._process_expert_youtube_results(search_items[query], detailed_videos, query)
+            self.cache.set("youtube_search", cache_key, results[query])
+        return results
+
+    def _youtube_search_items(self, query: str, max_results: int, advanced_params: Dict = None) -> List[Dict]:
+        """One search.list call; returns the raw result items"""
         # Simplified parameter configuration to avoid API issues
         default_params = {
             "part": "snippet",
@@ -89,31 +317,27 @@ class ToolsMain:
 
         # Execute search API call
         url = "https://www.googleapis.com/youtube/v3/search"
+        self.youtube_quota.require(self.youtube_api_key, "search")
         try:
-            resp = requests.get(url, params=default_params, timeout=20)
+            resp = http_pool.get(url, params=default_params)
+            self.youtube_quota.charge(self.youtube_api_key, "search")
+            self._check_youtube_quota(resp)
             resp.raise_for_status()
-            search_data = resp.json()
+            return resp.json().get("items", []) or []
+        except QuotaExceeded:
+            raise
         except Exception as e:
             raise RuntimeError(f"YouTube search API failed: {e}")
 
-        # Get additional video details for better filtering
-        video_ids = []
-        for item in search_data.get("items", []):
-            vid = (item.get("id", {}) or {}).get("videoId")
-            if vid:
-                video_ids.append(vid)
-        
-        # Fetch detailed video information
-        detailed_videos = {}
-        if video_ids:
-            detailed_videos = self._fetch_video_details(video_ids)
-        
-        # Process and filter results with expert criteria
-        results = self._process_expert_youtube_results(
-            search_data.get("items", []), detailed_videos, query
-        )
-        
-        return results
+    def _check_youtube_quota(self, resp):
+        """Turn a quotaExceeded error into QuotaExceeded and mark the key spent for the day"""
+        if resp.status_code == 403 and "quotaExceeded" in (resp.text or ""):
+            self.youtube_quota.exhaust(self.youtube_api_key)
+            raise QuotaExceeded("YouTube daily quota exceeded")
+
+    def youtube_quota_status(self) -> Dict[str, int]:
+        """Units spent and remaining today for the configured YouTube key"""
+        return self.youtube_quota.status(self.youtube_api_key)
     
     def _build_enhanced_query(self, query: str) -> str:
         """Build enhanced search query with smart exclusions and inclusions"""
@@ -140,20 +364,44 @@ class ToolsMain:
         if not video_ids:
             return {}
         
-        url = "https://www.googleapis.com/youtube/v3/videos"
-        params = {
-            "part": "contentDetails,statistics,snippet",
-            "id": ",".join(video_ids),
-            "key": self.youtube_api_key
-        }
+        # Serve already-known videos from cache and only fetch the rest
+        video_details = {}
+        missing_ids = []
+        for video_id in video_ids:
+            cached = self.cache.get("youtube_video", (video_id,))
+            if cached is not None:
+                video_details[video_id] = cached
+            elif video_id not in missing_ids:
+                missing_ids.append(video_id)
+        
+        if not missing_ids:
+            return video_details
         
-        try:
-            resp = requests.get(url, params=params, timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
+        url = "https://www.googleapis.com/youtube/v3/videos"
+        # videos.list accepts up to 50 IDs per call
+        for start in range(0, len(missing_ids), YOUTUBE_VIDEOS_PER_REQUEST):
+            chunk = missing_ids[start:start + YOUTUBE_VIDEOS_PER_REQUEST]
+            params = {
+                "part": "contentDetails,statistics,snippet",
+                "id": ",".join(chunk),
+                "key": self.youtube_api_key
+            }
+            
+            try:
+                self.youtube_quota.require(self.youtube_api_key, "videos")
+                resp = http_pool.get(url, params=params)
+                self.youtube_quota.charge(self.youtube_api_key, "videos")
+                self._check_youtube_quota(resp)
+                resp.raise_for_status()
+                data = resp.json()
+            except QuotaExceeded as e:
+                print(f"⚠️ Skipping video details: {e}")
+                break
+            except Exception as e:
+                print(f"⚠️ Failed to fetch video details: {e}")
+                continue
             
             # Create lookup dictionary
-            video_details = {}
             for item in data.get("items", []):
                 video_id = item.get("id")
                 if video_id:
@@ -170,12 +418,11 @@ class ToolsMain:
                         "category_id": snippet.get("categoryId", ""),
                         "tags": snippet.get("tags", [])
                     }
-            
-            return video_details
-            
-        except Exception as e:
-            print(f"⚠️ Failed to fetch video details: {e}")
-            return {}
+                    self.cache.set("youtube_video", (video_id,), video_details[video_id])
+        
+        print(f"🎞️ Video details: {len(set(video_ids)) - len(missing_ids)} cached, {len(missing_ids)} fetched "
+              f"in {-(-len(missing_ids) // YOUTUBE_VIDEOS_PER_REQUEST)} call(s)")
+        return video_details
     
     def _process_expert_youtube_results(self, search_items: List[Dict], 
                                       detailed_videos: Dict[str, Dict], 
@@ -366,6 +613,21 @@ class ToolsMain:
             return self.search_youtube(query, max_results)
 
 
+    def youtube_videos(self, query: str) -> List[Dict]:
+        """Structured YouTube tutorials for a query (title, video_url, duration_seconds, view_count, ...)"""
+        q = (query or "").strip()
+        if not q:
+            return []
+        return self.search_youtube(q, max_results=YOUTUBE_TOOL_MAX_RESULTS, advanced_params=YOUTUBE_TOOL_PARAMS)
+
+    def youtube_videos_batch(self, queries: List[str]) -> Dict[str, List[Dict]]:
+        """youtube_videos for several queries, sharing one batched video-details lookup"""
+        queries = [q.strip() for q in queries if q and q.strip()]
+        if not queries:
+            return {}
+        return self.search_youtube_batch(queries, max_results=YOUTUBE_TOOL_MAX_RESULTS,
+                                         advanced_params=YOUTUBE_TOOL_PARAMS)
+
     def search_youtube_wrapped(self, query: str) -> str:
         """Enhanced YouTube search wrapper with expert-level results formatting"""
         
@@ -374,22 +636,16 @@ class ToolsMain:
             return "Please provide a non-empty search query for YouTube."
 
         try:
-            # Use expert-level search with advanced parameters
-            advanced_params = {
-                "videoDuration": "medium",  # Prefer 4-20 minute videos
-                "order": "relevance",
-                "videoDefinition": "high",
-                "relevanceLanguage": "en"
-            }
-            
-            results = self.search_youtube(q, max_results=6, advanced_params=advanced_params)
+            results = self.youtube_videos(q)
         except Exception as e:
             return f"Error: {e}"
 
         if not results:
             return "No videos found."
+        return self._format_youtube_results(q, results)
 
-        # Format results with enhanced information
+    def _format_youtube_results(self, query: str, results: List[Dict]) -> str:
+        """Render videos as text for LLM agents"""
         lines = []
         for i, r in enumerate(results, 1):
             title = r.get('title', 'Untitled')
@@ -421,70 +677,83 @@ class ToolsMain:
                 f"   ⭐ Quality Score: {quality_score}/100"
             )
         
-        header = f"🔍 Found {len(results)} high-quality YouTube tutorials for: '{q}'\n" + "="*60 + "\n"
+        header = f"🔍 Found {len(results)} high-quality YouTube tutorials for: '{query}'\n" + "="*60 + "\n"
         return header + "\n\n".join(lines)
 
     # GitHub 
-    def github_search_tool(self, query: str) -> str:
+    def github_repositories(self, query: str) -> List[Dict]:
+        """Structured top repositories for a query (name, url, stars, description, language, updated); raises RuntimeError"""
         q = (query or "").strip()
         if not q:
-            return "Please provide a non-empty search query for GitHub."
+            return []
 
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-            "User-Agent": "langchain-tool",
-        }
-        if self.github_api_key:
-            headers["Authorization"] = f"Bearer {self.github_api_key}"
+        cache_key = (normalize_query(q),)
+        cached = self.cache.get("github_repos", cache_key)
+        if cached is not None:
+            print(f"⚡ GitHub search cache hit: {q}")
+            return cached
 
         # Enhanced search with better filtering
         search_query = f"{q} NOT homework NOT assignment NOT practice NOT test NOT hello-world"
-        url = f"https://api.github.com/search/repositories?q={search_query}&sort=stars&order=desc&per_page=8"
 
+        # The client paces requests under the search rate limit and revalidates with ETags
         try:
-            res = requests.get(url, headers=headers, timeout=15)
-            res.raise_for_status()
-            data = res.json()
-        except requests.HTTPError as e:
-            status = e.response.status_code if e.response else "unknown"
-            if status in (401, 403):
-                auth_msg = " (authentication may be missing or rate limit exceeded)"
-            else:
-                auth_msg = ""
-            return f"GitHub search failed with HTTP {status}{auth_msg}."
+            data = self.github.search_repositories(search_query, token=self.github_api_key, per_page=8)
+        except GitHubError:
+            raise
         except Exception as e:
-            return f"GitHub search failed: {e}"
+            raise RuntimeError(f"GitHub search failed: {e}")
 
         items = data.get("items", []) or []
-        if not items:
-            return "No results found."
 
         # Filter and rank repositories
-        quality_repos = []
-        for repo in items:
-            if self._is_quality_repo(repo, q):
-                quality_repos.append(repo)
-
+        quality_repos = [repo for repo in items if self._is_quality_repo(repo, q)]
         if not quality_repos:
-            quality_repos = items[:5]  # Fallback to original results
+            quality_repos = items[:GITHUB_TOOL_MAX_RESULTS]  # Fallback to original results
+
+        repos = [
+            {
+                "name": repo.get("full_name", "unknown"),
+                "url": repo.get("html_url", ""),
+                "stars": repo.get("stargazers_count", 0),
+                "description": (repo.get("description") or "").strip(),
+                "language": repo.get("language") or "",
+                "updated": (repo.get("updated_at") or "")[:10],  # Get date part only
+            }
+            for repo in quality_repos[:GITHUB_TOOL_MAX_RESULTS]
+        ]
+        self.cache.set("github_repos", cache_key, repos)
+        return repos
 
+    def github_search_tool(self, query: str) -> str:
+        q = (query or "").strip()
+        if not q:
+            return "Please provide a non-empty search query for GitHub."
+
+        try:
+            repos = self.github_repositories(q)
+        except RuntimeError as e:
+            return str(e)
+
+        if not repos:
+            return "No results found."
+        return self._format_github_results(repos)
+
+    def github_metrics(self) -> Dict:
+        """GitHub request counters and rate-limit window for the configured token"""
+        return self.github.metrics(self.github_api_key)
+
+    def _format_github_results(self, repos: List[Dict]) -> str:
+        """Render repositories as text for LLM agents"""
         out_lines = []
-        for repo in quality_repos[:5]:
-            name = repo.get("full_name", "unknown")
-            stars = repo.get("stargazers_count", 0)
-            html = repo.get("html_url", "")
-            desc = (repo.get("description") or "").strip()
-            language = repo.get("language", "")
-            updated = repo.get("updated_at", "")[:10]  # Get date part only
-            
-            desc_with_info = f"{desc}"
-            if language:
-                desc_with_info += f" | Language: {language}"
-            if updated:
-                desc_with_info += f" | Updated: {updated}"
+        for repo in repos:
+            desc_with_info = repo["description"]
+            if repo["language"]:
+                desc_with_info += f" | Language: {repo['language']}"
+            if repo["updated"]:
+                desc_with_info += f" | Updated: {repo['updated']}"
                 
-            out_lines.append(f"- {name} ⭐ ({stars} stars)\n  {html}\n  {desc_with_info}")
+            out_lines.append(f"- {repo['name']} ⭐ ({repo['stars']} stars)\n  {repo['url']}\n  {desc_with_info}")
         return "\n\n".join(out_lines)
     
     def _is_quality_repo(self, repo: dict, query: str) -> bool:
@@ -509,6 +778,96 @@ class ToolsMain:
         return relevance_score > 0 or stars > 50  # Either relevant or popular
 
     # Tavily (components) 
+    def _component_depth(self, component: str) -> str:
+        """basic for generic parts, advanced for specific modules and part numbers"""
+        name = component.lower()
+        if any(re.search(rf"\b{term}s?\b", name) for term in COMPONENT_BASIC_TERMS):
+            return "basic"
+        if re.search(r"\d", name):
+            return "advanced"
+        return "basic" if len(name.split()) <= 2 else "advanced"
+
+    def _tavily_component_search(self, component: str, depth: str) -> Dict:
+        search_query = (
+            f"{component} specs price datasheet site:aliexpress.com OR site:amazon.com OR site:daraz.pk"
+        )
+        resp = self.tavily_client.search(
+            query=search_query,
+            search_depth=depth,
+            include_answer=True,
+            include_images=False,
+            max_results=COMPONENT_LOOKUP_RESULTS,
+        )
+        results = []
+        for r in (resp.get("results", []) or [])[:COMPONENT_LOOKUP_RESULTS]:
+            content = (r.get("content") or "").strip()
+            if len(content) > 220:
+                content = content[:217] + "..."
+            results.append({
+                "title": r.get("title", "").strip() or "Result",
+                "url": r.get("url", "").strip(),
+                "content": content,
+            })
+        return {"name": component, "summary": (resp.get("answer") or "").strip(), "results": results, "depth": depth}
+
+    def component_lookup(self, component: str) -> Dict:
+        """Structured specs/price/store results for one component (name, summary, results, depth); raises RuntimeError"""
+        component = (component or "").strip()
+        if not self.tavily_client:
+            raise RuntimeError("Missing TAVILY_API_KEY in environment.")
+
+        cache_key = (normalize_query(component),)
+        cached = self.cache.get("component_lookup", cache_key)
+        if cached is not None:
+            return cached
+
+        depth = self._component_depth(component)
+        try:
+            lookup = self._tavily_component_search(component, depth)
+            # A thin basic answer is retried once at the advanced depth
+            if depth == "basic" and (not lookup["summary"] or len(lookup["results"]) < 2):
+                lookup = self._tavily_component_search(component, "advanced")
+        except Exception as e:
+            raise RuntimeError(f"Error fetching data: {e}")
+
+        self.cache.set("component_lookup", cache_key, lookup)
+        return lookup
+
+    def component_lookups(self, components: List[str], limit: Optional[int] = None,
+                          distinct: bool = False) -> Dict[str, Dict]:
+        """Look up a bill of materials concurrently, once per distinct component; failures map to {"error": ...}
+
+        limit caps the number of distinct components looked up (repeats do not count against it).
+        With distinct, only each component's first spelling is returned.
+        """
+        unique = {}
+        for component in components:
+            component = (component or "").strip()
+            if component and normalize_query(component) not in unique:
+                if limit is not None and len(unique) >= limit:
+                    continue
+                unique[normalize_query(component)] = component
+        if not unique:
+            return {}
+
+        def lookup(component: str) -> Dict:
+            try:
+                return self.component_lookup(component)
+            except RuntimeError as e:
+                return {"name": component, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=min(COMPONENT_LOOKUP_CONCURRENCY, len(unique))) as pool:
+            lookups = dict(zip(unique.values(), pool.map(lookup, unique.values())))
+
+        if distinct:
+            return lookups
+        # Duplicates (differently spelled) share their first spelling's result
+        return {
+            component: lookups[unique[normalize_query(component.strip())]]
+            for component in components
+            if component and component.strip() and normalize_query(component.strip()) in unique
+        }
+
     def component_info_tool(self, components: str) -> str:
         raw = (components or "").strip()
         if not raw:
@@ -520,51 +879,35 @@ class ToolsMain:
         if not components_list:
             return "Please provide valid component names."
 
-        sections: List[str] = []
-        for component in components_list:
-            search_query = (
-                f"{component} specs price datasheet site:aliexpress.com OR site:amazon.com OR site:daraz.pk"
-            )
-            try:
-                resp = self.tavily_client.search(
-                    query=search_query,
-                    search_depth="advanced",
-                    include_answer=True,
-                    include_images=False,
-                    max_results=5,
-                )
-            except Exception as e:
-                sections.append(f"{component}:\n  Error fetching data: {e}")
-                continue
-
-            answer = (resp.get("answer") or "").strip()
-            results = resp.get("results", []) or []
-
-            lines = [f"{component}:"]
-            if answer:
-                lines.append(f"  Summary: {answer}")
-
-            for r in results[:5]:
-                title = r.get("title", "").strip() or "Result"
-                url = r.get("url", "").strip()
-                content = (r.get("content") or "").strip()
-                if len(content) > 220:
-                    content = content[:217] + "..."
-                lines.append(f"  - {title}\n    {url}\n    {content}")
-
-            sections.append("\n".join(lines))
-
-        return "\n\n".join(sections)
+        lookups = self.component_lookups(components_list)
+        return "\n\n".join(self._format_component_lookup(component, lookups[component])
+                            for component in dict.fromkeys(components_list))
+
+    def _format_component_lookup(self, component: str, lookup: Dict) -> str:
+        """Render one component's lookup as text for LLM agents"""
+        if lookup.get("error"):
+            return f"{component}:\n  {lookup['error']}"
+        lines = [f"{component}:"]
+        if lookup["summary"]:
+            lines.append(f"  Summary: {lookup['summary']}")
+        for r in lookup["results"]:
+            lines.append(f"  - {r['title']}\n    {r['url']}\n    {r['content']}")
+        return "\n".join(lines)
 
     # DuckDuckGo 
     def ddg_search(self, query: str) -> str:
         q = (query or "").strip()
         if not q:
             return "Please provide a non-empty search query."
-        try:
-            results = self.ddg.results(q, num_results=5)
-        except Exception as e:
-            return f"DuckDuckGo search failed: {e}"
+
+        cache_key = (normalize_query(q),)
+        results = self.cache.get("ddg_search", cache_key)
+        if results is None:
+            try:
+                results = self.ddg.results(q, num_results=5)
+            except Exception as e:
+                return f"DuckDuckGo search failed: {e}"
+            self.cache.set("ddg_search", cache_key, results)
 
         if not results:
             return "No results found."
@@ -580,4 +923,60 @@ class ToolsMain:
         return "\n\n".join(lines)
 
     def __call__(self):
-        return [self.ddg_tool, self.youtube_tool, self.github_tool, self.tavily_tool]
\ No newline at end of file
+        return [self.ddg_tool, self.youtube_tool, self.github_tool, self.tavily_tool]
+
+
+class ToolRegistry:
+    """Process-wide, lazily built ToolsMain shared by every assistant and Streamlit session"""
+
+    def __init__(self, factory=ToolsMain):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._tools_main = None
+        self._tool_list: List[Tool] = []
+        self._tool_map: Dict[str, Tool] = {}
+        self.generation = 0
+
+    def _ensure_built(self) -> ToolsMain:
+        tools_main = self._tools_main
+        if tools_main is not None:
+            return tools_main
+
+        with self._lock:
+            if self._tools_main is None:
+                tools_main = self._factory()
+                self._tool_list = tools_main()
+                self._tool_map = {t.name: t for t in self._tool_list}
+                self._tools_main = tools_main
+                self.generation += 1
+                print(f"🧰 Tool registry built (generation {self.generation})")
+            return self._tools_main
+
+    @property
+    def tools_main(self) -> ToolsMain:
+        return self._ensure_built()
+
+    @property
+    def tool_list(self) -> List[Tool]:
+        self._ensure_built()
+        return list(self._tool_list)
+
+    @property
+    def tool_map(self) -> Dict[str, Tool]:
+        self._ensure_built()
+        return dict(self._tool_map)
+
+    def get(self, name: str):
+        """Return a shared tool by name, or None if it is not registered"""
+        self._ensure_built()
+        return self._tool_map.get(name)
+
+    def invalidate(self):
+        """Drop the shared instance (e.g. after API keys change); it is rebuilt on next use"""
+        with self._lock:
+            self._tools_main = None
+            self._tool_list = []
+            self._tool_map = {}
+
+
+tool_registry = ToolRegistry()
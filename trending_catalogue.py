@@ -0,0 +1,199 @@
+import os
+import json
+import time
+import asyncio
+import argparse
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CATALOGUE_PATH = os.getenv(
+    "PROJECTCRAFT_TRENDING_CATALOGUE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "trending_catalogue.json")
+)
+# Entries older than this are still served, but trigger a background refresh of that field
+CATALOGUE_MAX_AGE = float(os.getenv("PROJECTCRAFT_TRENDING_MAX_AGE", str(7 * 24 * 3600)))
+CATALOGUE_SCHEMA = 1
+
+PROJECTS_PER_FIELD = 6
+PROJECT_KEYS = ("title", "description", "difficulty", "category", "key_technologies", "why_trending")
+DIFFICULTIES = ("Beginner", "Intermediate", "Advanced")
+
+
+def validate_projects(projects: Any) -> List[Dict]:
+    """Check a generated project list against the schema the UI relies on; raises ValueError"""
+    if isinstance(projects, dict):
+        projects = projects.get("projects")
+    if not isinstance(projects, list):
+        raise ValueError("expected a list of projects")
+
+    valid = []
+    for project in projects:
+        if not isinstance(project, dict):
+            continue
+        if not all(str(project.get(key) or "").strip() for key in PROJECT_KEYS if key != "key_technologies"):
+            continue
+
+        technologies = project.get("key_technologies") or []
+        if isinstance(technologies, str):
+            technologies = [t.strip() for t in technologies.split(",")]
+        difficulty = next(
+            (d for d in DIFFICULTIES if d.lower() in str(project["difficulty"]).lower()), "Intermediate"
+        )
+
+        valid.append({
+            "title": str(project["title"]).strip(),
+            "description": str(project["description"]).strip(),
+            "difficulty": difficulty,
+            "category": str(project["category"]).strip(),
+            "key_technologies": [str(t) for t in technologies if str(t).strip()],
+            "why_trending": str(project["why_trending"]).strip(),
+        })
+
+    titles = {p["title"].lower() for p in valid}
+    if len(valid) < PROJECTS_PER_FIELD or len(titles) < len(valid):
+        raise ValueError(f"expected {PROJECTS_PER_FIELD} distinct projects, got {len(titles)}")
+    return valid[:PROJECTS_PER_FIELD]
+
+
+def catalogue_fields(engineering_fields: Dict[str, Dict]) -> List[str]:
+    """Every field and subdomain the UI can ask trending projects for"""
+    fields = []
+    for field_name, field_info in engineering_fields.items():
+        for name in [field_name] + field_info.get("subfields", []):
+            if name not in fields:
+                fields.append(name)
+    return fields
+
+
+class TrendingCatalogue:
+    """Versioned JSON store of pre-generated trending projects per engineering field
+
+    The catalogue is seeded and refreshed on a schedule by the CLI below (python trending_catalogue.py,
+    e.g. from cron). The app only refreshes the field a user asks for, so it never queues generation
+    for every field.
+    """
+
+    def __init__(self, path: str = CATALOGUE_PATH, max_age: float = CATALOGUE_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._mtime = None
+        self._refreshing = set()
+
+    def _empty(self) -> Dict[str, Any]:
+        return {"schema": CATALOGUE_SCHEMA, "version": 0, "generated_at": None, "fields": {}}
+
+    def load(self) -> Dict[str, Any]:
+        """Return the catalogue, re-reading the file only when it changed on disk"""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+
+        with self._lock:
+            if self._data is not None and mtime == self._mtime:
+                return self._data
+            data = self._empty()
+            if mtime is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        loaded = json.load(f)
+                    if loaded.get("schema") == CATALOGUE_SCHEMA:
+                        data = loaded
+                    else:
+                        print(f"⚠️ Ignoring trending catalogue with schema {loaded.get('schema')}")
+                except Exception as e:
+                    print(f"⚠️ Could not read trending catalogue {self.path}: {e}")
+            self._data, self._mtime = data, mtime
+            return data
+
+    @property
+    def version(self) -> int:
+        return self.load()["version"]
+
+    def get(self, engineering_field: str) -> Optional[List[Dict]]:
+        entry = self.load()["fields"].get(engineering_field)
+        return entry["projects"] if entry else None
+
+    def is_stale(self, engineering_field: str) -> bool:
+        entry = self.load()["fields"].get(engineering_field)
+        return entry is None or time.time() - entry["generated_at"] > self.max_age
+
+    def stale_fields(self, fields: Iterable[str]) -> List[str]:
+        return [f for f in fields if self.is_stale(f)]
+
+    def put_many(self, entries: Dict[str, List[Dict]]):
+        """Validate and store projects for several fields as one new catalogue version"""
+        if not entries:
+            return
+        now = time.time()
+        validated = {f: validate_projects(projects) for f, projects in entries.items()}
+
+        self.load()
+        with self._lock:
+            data = json.loads(json.dumps(self._data))
+            for engineering_field, projects in validated.items():
+                data["fields"][engineering_field] = {"generated_at": now, "projects": projects}
+            data["version"] += 1
+            data["generated_at"] = now
+
+            # Atomic replace so readers in other processes never see a half-written file
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._data, self._mtime = data, os.path.getmtime(self.path)
+
+    def put(self, engineering_field: str, projects: List[Dict]):
+        self.put_many({engineering_field: projects})
+
+    async def refresh(self, assistant, fields: Iterable[str], force: bool = False) -> Dict[str, str]:
+        """Regenerate stale (or all, with force) fields in batched requests; failures keep the previous entry"""
+        targets = [f for f in dict.fromkeys(fields) if (force or self.is_stale(f)) and f not in self._refreshing]
+        if not targets:
+            return {}
+        self._refreshing.update(targets)
+        try:
+            results, errors = await assistant.request_trending_projects_batch(targets, use_cache=False)
+            self.put_many(results)
+        finally:
+            self._refreshing.difference_update(targets)
+
+        report = {f: "ok" for f in results}
+        report.update({f: f"failed: {reason}" for f, reason in errors.items()})
+        for engineering_field, reason in errors.items():
+            print(f"⚠️ Trending refresh failed for {engineering_field}: {reason}")
+        print(f"🗂️ Trending catalogue v{self.version}: refreshed {len(results)}/{len(targets)} fields")
+        return report
+
+
+trending_catalogue = TrendingCatalogue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate the trending-projects catalogue")
+    parser.add_argument("--fields", nargs="*", help="Only refresh these fields/subdomains")
+    parser.add_argument("--force", action="store_true", help="Regenerate fields that are still fresh")
+    parser.add_argument("--path", default=CATALOGUE_PATH, help="Catalogue file to write")
+    args = parser.parse_args()
+
+    # Imported lazily: the app module pulls in Streamlit and the LLM client
+    from main import ENGINEERING_FIELDS, ProjectGuideAssistant
+
+    catalogue = TrendingCatalogue(args.path)
+    fields = args.fields or catalogue_fields(ENGINEERING_FIELDS)
+    report = asyncio.run(catalogue.refresh(ProjectGuideAssistant(), fields, force=args.force))
+    failed = {f: r for f, r in report.items() if r != "ok"}
+    print(f"✅ {len(report) - len(failed)} refreshed, {len(failed)} failed, "
+          f"{len(fields) - len(report)} already fresh (catalogue v{catalogue.version})")
+    for engineering_field, reason in failed.items():
+        print(f"   ❌ {engineering_field}: {reason}")
+
+
+if __name__ == "__main__":
+    main()